@@ -645,6 +645,7 @@ def texttranslate(concept_config_path: str, image_path: str, target_language: st
     """
     from glow.concept2asset.image_editor import ImageEditor
     from glow.concept2asset.localization_processor import LocalizationProcessor
+    from glow.core.credentials import load_env_file
     
     try:
         # Load concept configuration
@@ -660,6 +661,7 @@ def texttranslate(concept_config_path: str, image_path: str, target_language: st
             logger.warning("Using legacy 'llm_processing' section instead of 'generated_concept' (deprecated)")
         
         # Check if API key is provided
+        load_env_file()
         if not api_key and "TRANSLATION_API_KEY" not in os.environ:
             # Prompt for API key
             api_key = click.prompt("Enter Google Translate API key", hide_input=True)
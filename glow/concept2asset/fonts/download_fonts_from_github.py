@@ -1,19 +1,56 @@
+import json
+import logging
 import os
 import requests
+import shutil
+import sys
+import tarfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # GitHub repository information
 GITHUB_REPO = "jongrover/all-google-fonts-ttf-only"
 GITHUB_BRANCH = "master"
 GITHUB_FONTS_PATH = "fonts"
 BASE_URL = f"https://raw.githubusercontent.com/{GITHUB_REPO}/{GITHUB_BRANCH}/{GITHUB_FONTS_PATH}"
+ARCHIVE_URL = f"https://codeload.github.com/{GITHUB_REPO}/tar.gz/{GITHUB_BRANCH}"
+
+# Largest repository archive worth fetching in place of per-file downloads
+MAX_ARCHIVE_SIZE = 5 * 1024 * 1024
+
+# Maximum number of concurrent font downloads, kept low to stay under
+# raw.githubusercontent.com rate limits
+MAX_WORKERS = 6
+
+# Shared session so parallel downloads reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
+# Retry settings for throttled (429) or unavailable (503) responses
+MAX_RETRIES = 3
+RETRY_STATUS_CODES = (429, 503)
+MAX_RETRY_AFTER = 8
+
+# Chunk size used when streaming font files to disk
+CHUNK_SIZE = 64 * 1024
 
 # Local fonts directory - use current directory by default
 FONTS_DIR = "."
 
+# Create alias files as hardlinks; set to False to always write real copies
+USE_HARDLINKS = True
+
+# Sidecar file caching upstream ETags so unchanged fonts are not re-downloaded
+ETAGS_FILE = ".font_etags.json"
+
+# ETags of downloaded fonts, keyed by font file name
+_etags = {}
+
 # Simplified list of fonts to download based on updated FONTS_NEEDED.md
-FONTS_TO_DOWNLOAD = [
+FONTS_TO_DOWNLOAD = (
     # Required fonts (must have)
     "Montserrat-Regular.ttf",       # Default font
     "Montserrat-Bold.ttf",          # Bold variant
@@ -25,107 +62,263 @@ FONTS_TO_DOWNLOAD = [
     "Anton-Regular.ttf",            # Display
     "DancingScript-Regular.ttf",    # Script
     "RobotoMono-Regular.ttf"        # Monospace
-]
+)
 
 # No need for alternatives since we're only using fonts available on Google Fonts
 
-def download_font(font_name, output_dir):
+def write_font(source, output_path):
+    """
+    Stream a font into place without ever leaving a partial file at output_path.
+    
+    The data is written to a ".part" file next to the target and moved over it
+    only once the copy completes, so an interrupted run cannot leave a
+    truncated font that later runs would skip as already downloaded.
+    
+    Args:
+        source: Readable binary file object with the font data
+        output_path: Path to save the font file
+    """
+    part_path = output_path + ".part"
+    try:
+        with open(part_path, 'wb') as f:
+            shutil.copyfileobj(source, f, length=CHUNK_SIZE)
+        os.replace(part_path, output_path)
+    except BaseException:
+        # Don't leave the partial file behind
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+def download_font(font_name, url, output_path, force=False):
     """
     Download a font from the GitHub repository.
     
     Args:
         font_name: Name of the font file
-        output_dir: Directory to save the font file
+        url: URL of the font file in the repository
+        output_path: Path to save the font file
+        force: Re-check the font upstream even if it already exists locally
     
     Returns:
         bool: True if download was successful, False otherwise
     """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Construct the URL
-    url = f"{BASE_URL}/{font_name}"
-    
-    # Construct the output path
-    output_path = os.path.join(output_dir, font_name)
-    
     try:
+        # Skip the network entirely if a previous run already fetched the font
+        if not force and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            logger.debug(f"{font_name} already exists, skipping")
+            return True
+        
         # Download the font file
-        print(f"Downloading {font_name}...")
-        response = requests.get(url)
+        logger.debug(f"Downloading {font_name}...")
+        # Only ask for a conditional response if we still have the file on disk
+        headers = {}
+        if font_name in _etags and os.path.exists(output_path):
+            headers["If-None-Match"] = _etags[font_name]
         
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Save the font file
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-            print(f"Successfully downloaded {font_name} to {output_path}")
-            return True
-        else:
-            print(f"Failed to download {font_name}: HTTP {response.status_code}")
-            return False
+        for attempt in range(MAX_RETRIES + 1):
+            response = _SESSION.get(url, headers=headers, stream=True, timeout=(5, 30))
+            
+            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                break
+            
+            # Release the connection before backing off
+            response.close()
+            
+            # Back off before retrying, honouring Retry-After when provided
+            delay = 0.5 * 2 ** attempt
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = min(int(retry_after), MAX_RETRY_AFTER)
+            logger.warning(f"Throttled downloading {font_name} (HTTP {response.status_code}), retrying in {delay}s...")
+            time.sleep(delay)
+        
+        with response:
+            # Check if the request was successful
+            if response.status_code == 304:
+                logger.debug(f"{font_name} is already up to date")
+                return True
+            elif response.status_code == 200:
+                # Stream the font file to disk
+                response.raw.decode_content = True
+                write_font(response.raw, output_path)
+                etag = response.headers.get("ETag")
+                if etag:
+                    _etags[font_name] = etag
+                logger.debug(f"Successfully downloaded {font_name} to {output_path}")
+                return True
+            else:
+                logger.error(f"Failed to download {font_name}: HTTP {response.status_code}")
+                return False
     
     except Exception as e:
-        print(f"Error downloading {font_name}: {str(e)}")
+        logger.error(f"Error downloading {font_name}: {str(e)}")
         return False
 
-def main():
+def download_fonts_from_archive(font_names, output_dir):
+    """
+    Download fonts in a single request by extracting them from the repository archive.
+    
+    The archive is only used when the server reports a size no larger than
+    MAX_ARCHIVE_SIZE; otherwise nothing is downloaded and the caller should
+    fall back to per-file downloads.
+    
+    Args:
+        font_names: Names of the font files to extract
+        output_dir: Directory to save the font files
+    
+    Returns:
+        set: Names of the fonts that were extracted
+    """
+    wanted = set(font_names)
+    extracted = set()
+    
+    try:
+        with _SESSION.get(ARCHIVE_URL, stream=True, timeout=(5, 30)) as response:
+            content_length = response.headers.get("Content-Length")
+            if response.status_code != 200 or not content_length or int(content_length) > MAX_ARCHIVE_SIZE:
+                logger.debug("Repository archive unavailable or too large, downloading fonts individually")
+                return extracted
+            
+            logger.debug(f"Downloading repository archive from {ARCHIVE_URL}...")
+            response.raw.decode_content = True
+            with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                for member in archive:
+                    font_name = os.path.basename(member.name)
+                    if not member.isfile() or font_name not in wanted:
+                        continue
+                    
+                    with archive.extractfile(member) as src:
+                        write_font(src, os.path.join(output_dir, font_name))
+                    extracted.add(font_name)
+                    wanted.discard(font_name)
+                    logger.debug(f"Extracted {font_name} from repository archive")
+                    
+                    if not wanted:
+                        break
+    
+    except Exception as e:
+        logger.warning(f"Error downloading repository archive: {str(e)}")
+    
+    return extracted
+
+def load_etags(fonts_dir):
+    """
+    Load cached font ETags from the sidecar file.
+    
+    Args:
+        fonts_dir: Directory containing the fonts and the ETag cache
+    
+    Returns:
+        dict: Mapping of font file name to ETag, empty if no cache exists
+    """
+    etags_path = os.path.join(fonts_dir, ETAGS_FILE)
+    try:
+        with open(etags_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_etags(fonts_dir, etags):
+    """
+    Save font ETags to the sidecar file.
+    
+    Args:
+        fonts_dir: Directory containing the fonts and the ETag cache
+        etags: Mapping of font file name to ETag
+    """
+    etags_path = os.path.join(fonts_dir, ETAGS_FILE)
+    try:
+        with open(etags_path, 'w') as f:
+            json.dump(etags, f, indent=2)
+    except OSError as e:
+        logger.error(f"Error saving ETag cache: {str(e)}")
+
+def link_or_copy(source_path, target_path):
+    """
+    Create target_path as a hardlink to source_path, copying if linking fails.
+    
+    Copies go through shutil.copyfile, which uses the platform's in-kernel
+    copy (e.g. sendfile on Linux) rather than reading the font into memory.
+    
+    Args:
+        source_path: Path of the existing font file
+        target_path: Path of the alias to create
+    """
+    if USE_HARDLINKS:
+        try:
+            os.link(source_path, target_path)
+            return
+        except OSError:
+            # Hardlinks are unavailable across filesystems and on some platforms
+            pass
+    
+    shutil.copyfile(source_path, target_path)
+
+def main(force=False, use_archive=False):
     """
     Main function to download all fonts.
+    
+    Args:
+        force: Re-check fonts upstream even if they already exist locally
+        use_archive: Try fetching missing fonts from the repository archive
+            before downloading them individually. Off by default because the
+            archive of the full font repository is normally larger than
+            MAX_ARCHIVE_SIZE, making the extra request wasted.
     """
-    print(f"Downloading fonts to {FONTS_DIR} (current directory)...")
+    logger.info(f"Downloading fonts to {FONTS_DIR} (current directory)...")
     
     # Create fonts directory if it doesn't exist and it's not the current directory
     if FONTS_DIR != "." and not os.path.exists(FONTS_DIR):
         os.makedirs(FONTS_DIR, exist_ok=True)
     
-    # Download each font
-    successful = 0
-    failed = 0
+    # Load cached ETags so unchanged fonts can be skipped with a 304
+    _etags.update(load_etags(FONTS_DIR))
     
-    for font in FONTS_TO_DOWNLOAD:
-        # Add a small delay to avoid rate limiting
-        time.sleep(0.5)
-        
-        if download_font(font, FONTS_DIR):
-            successful += 1
-        else:
-            failed += 1
+    # Optionally fetch fonts missing locally in one archive request when the archive is small enough
+    extracted = set()
+    if use_archive:
+        missing = [font for font in FONTS_TO_DOWNLOAD if not os.path.exists(os.path.join(FONTS_DIR, font))]
+        if missing:
+            extracted = download_fonts_from_archive(missing, FONTS_DIR)
     
-    print(f"\nDownload complete: {successful} successful, {failed} failed")
+    # Build each remaining font's URL and output path once, outside the workers
+    tasks = [
+        (font, f"{BASE_URL}/{font}", os.path.join(FONTS_DIR, font), force)
+        for font in FONTS_TO_DOWNLOAD
+        if font not in extracted
+    ]
+    
+    # Downloads are independent network I/O, so run them concurrently
+    results = []
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tasks))) as executor:
+            results = list(executor.map(lambda task: download_font(*task), tasks))
+    
+    successful = len(extracted) + sum(results)
+    failed = len(results) - sum(results)
+    
+    save_etags(FONTS_DIR, _etags)
+    
+    logger.info(f"Download complete: {successful} successful, {failed} failed")
     
     # Create symlinks for fonts with spaces in their names
-    print("\nCreating additional font files with alternative naming conventions...")
-    
-    for font_file in os.listdir(FONTS_DIR):
-        if font_file.endswith(('.ttf', '.otf')):
-            # Create version with spaces replaced by underscores
-            if ' ' in font_file:
-                underscore_name = font_file.replace(' ', '_')
-                underscore_path = os.path.join(FONTS_DIR, underscore_name)
-                if not os.path.exists(underscore_path):
-                    try:
-                        # Copy the file
-                        with open(os.path.join(FONTS_DIR, font_file), 'rb') as src:
-                            with open(underscore_path, 'wb') as dst:
-                                dst.write(src.read())
-                        print(f"Created {underscore_name}")
-                    except Exception as e:
-                        print(f"Error creating {underscore_name}: {str(e)}")
-            
-            # Create version with spaces removed
-            if ' ' in font_file:
-                no_spaces_name = font_file.replace(' ', '')
-                no_spaces_path = os.path.join(FONTS_DIR, no_spaces_name)
-                if not os.path.exists(no_spaces_path):
-                    try:
-                        # Copy the file
-                        with open(os.path.join(FONTS_DIR, font_file), 'rb') as src:
-                            with open(no_spaces_path, 'wb') as dst:
-                                dst.write(src.read())
-                        print(f"Created {no_spaces_name}")
-                    except Exception as e:
-                        print(f"Error creating {no_spaces_name}: {str(e)}")
+    logger.info("Creating additional font files with alternative naming conventions...")
+    
+    # Scan the directory once; the set stands in for per-alias existence checks
+    existing = {entry.name for entry in os.scandir(FONTS_DIR) if entry.is_file()}
+    
+    for font_file in [name for name in existing if name.endswith(('.ttf', '.otf')) and ' ' in name]:
+        # Create versions with spaces replaced by underscores and with spaces removed
+        for alias_name in (font_file.replace(' ', '_'), font_file.replace(' ', '')):
+            if alias_name not in existing:
+                try:
+                    link_or_copy(os.path.join(FONTS_DIR, font_file), os.path.join(FONTS_DIR, alias_name))
+                    existing.add(alias_name)
+                    logger.debug(f"Created {alias_name}")
+                except Exception as e:
+                    logger.error(f"Error creating {alias_name}: {str(e)}")
     
     # Create special cases for fonts with spaces in their names
     special_cases = [
@@ -134,20 +327,16 @@ def main():
     ]
     
     for source, target in special_cases:
-        source_path = os.path.join(FONTS_DIR, source)
-        target_path = os.path.join(FONTS_DIR, target)
-        
-        if os.path.exists(source_path) and not os.path.exists(target_path):
+        if source in existing and target not in existing:
             try:
-                # Copy the file
-                with open(source_path, 'rb') as src:
-                    with open(target_path, 'wb') as dst:
-                        dst.write(src.read())
-                print(f"Created '{target}' from '{source}'")
+                link_or_copy(os.path.join(FONTS_DIR, source), os.path.join(FONTS_DIR, target))
+                existing.add(target)
+                logger.debug(f"Created '{target}' from '{source}'")
             except Exception as e:
-                print(f"Error creating '{target}': {str(e)}")
+                logger.error(f"Error creating '{target}': {str(e)}")
     
-    print("\nFont download and setup complete!")
+    logger.info("Font download and setup complete!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper(), format="%(message)s")
+    main(force="--force" in sys.argv[1:], use_archive="--archive" in sys.argv[1:])
\ No newline at end of file
@@ -8,15 +8,123 @@ logo overlay, and basic image adjustments using the Pillow library.
 import os
 import logging
 import requests
-from typing import Dict, Any, Tuple, Optional, Union
-from pathlib import Path
+import shutil
+from typing import Dict, Any, List, Tuple, Optional, Union
 import colorsys
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
+import numpy as np
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageEnhance, ImageFilter
 
 logger = logging.getLogger(__name__)
 
+# ITU-R 601-2 luma weights, as used by Pillow's RGB to L conversion
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Fonts in the fonts directory to fall back to, in order of preference
+_FALLBACK_FONT_FILES = (
+    "Montserrat-Regular.ttf",
+    "OpenSans-Regular.ttf",
+    "Roboto-Regular.ttf",
+    "PlayfairDisplay-Regular.ttf",
+)
+
+# Loaded fonts keyed by (font_dir, font_name, font_size), shared across editors
+_font_cache = {}
+
+# Resized, opacity-adjusted logos keyed by (logo_url, mtime, target_width, opacity)
+_logo_cache = {}
+_logo_cache_lock = threading.Lock()
+_LOGO_CACHE_SIZE = 64
+
+@functools.lru_cache(maxsize=4096)
+def _text_bbox(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+    """
+    Get the bounding box of text rendered in a font, memoized per (font, text).
+    
+    Args:
+        font: Font used to render the text.
+        text: Text to measure.
+    
+    Returns:
+        Bounding box as (left, top, right, bottom).
+    """
+    return font.getbbox(text)
+
+@functools.lru_cache(maxsize=32)
+def _fetch_logo_bytes(logo_url: str) -> bytes:
+    """
+    Download a logo, memoized per URL so repeat overlays skip the HTTP round-trip.
+    
+    Args:
+        logo_url: URL of the logo image.
+    
+    Returns:
+        Raw bytes of the logo image.
+    
+    Raises:
+        requests.RequestException: If the download fails.
+    """
+    with requests.get(logo_url, timeout=10, stream=True) as response:
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        
+        # Stream the body into a single buffer instead of materializing response.content
+        response.raw.decode_content = True
+        buffer = BytesIO()
+        shutil.copyfileobj(response.raw, buffer, 64 * 1024)
+        return buffer.getvalue()
+
+@functools.lru_cache(maxsize=256)
+def _parse_hex_color(color: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse a hex color string into an RGBA tuple, memoized per string.
+    
+    Args:
+        color: Color string in hex format (#RRGGBB or #RRGGBBAA).
+    
+    Returns:
+        RGBA tuple, or None if the string is not 6 or 8 hex digits long.
+    
+    Raises:
+        ValueError: If the string contains non-hex characters.
+    """
+    digits = color[1:] if color.startswith("#") else color
+    
+    # Parse all channels at once and split them with shifts
+    if len(digits) == 6:
+        value = int(digits, 16)
+        return (value >> 16 & 0xFF, value >> 8 & 0xFF, value & 0xFF, 255)
+    elif len(digits) == 8:
+        value = int(digits, 16)
+        return (value >> 24 & 0xFF, value >> 16 & 0xFF, value >> 8 & 0xFF, value & 0xFF)
+    
+    return None
+
+# Fast-encoding save options for images that are only inputs to a later step
+_INTERMEDIATE_SAVE_KWARGS = {
+    ".png": {"compress_level": 1},
+    ".jpg": {"quality": 95, "subsampling": 0},
+    ".jpeg": {"quality": 95, "subsampling": 0},
+}
+
+def intermediate_save_kwargs(path: str) -> Dict[str, Any]:
+    """
+    Get Image.save options suited to an intermediate image at the given path.
+    
+    Intermediate images are re-read by a later processing step, so they favour
+    encoding speed (fast PNG compression, high-quality JPEG) over file size.
+    
+    Args:
+        path: Output path of the intermediate image.
+    
+    Returns:
+        Keyword arguments for Image.save (empty for unknown formats).
+    """
+    return dict(_INTERMEDIATE_SAVE_KWARGS.get(os.path.splitext(path)[1].lower(), {}))
+
 class ImageEditor:
     """
     Class for editing images using Pillow.
@@ -57,12 +165,24 @@ class ImageEditor:
         
         # Default shadow offset if shadow is enabled but offset not specified
         self.default_shadow_offset = (2, 2)
+        
+        # Parse the default text color once so invalid colors fall back without re-parsing
+        self._default_text_rgba = _parse_hex_color(self.default_text_color)
+        
+        # Resolve the last-resort fallback font once rather than on every failed load
+        self._fallback_font_path = next(
+            (path for path in (os.path.join(self.font_dir, name) for name in _FALLBACK_FONT_FILES)
+             if os.path.isfile(path)),
+            None
+        )
     
     def apply_text_overlay(
         self,
         image_path: str,
         text_config: Dict[str, Any],
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        font: Optional[ImageFont.FreeTypeFont] = None,
+        save_kwargs: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Apply text overlay to an image.
@@ -84,6 +204,10 @@ class ImageEditor:
                     - shadow_offset: Offset of the shadow (x, y).
             output_path: Path to save the output image. If not provided,
                          a path will be generated based on the input path.
+            font: Optional preloaded font. If not provided, the font is
+                  resolved from the text configuration.
+            save_kwargs: Optional keyword arguments for Image.save, e.g.
+                         {"compress_level": 1} for fast intermediate PNGs.
         
         Returns:
             Path to the output image.
@@ -103,16 +227,14 @@ class ImageEditor:
         # Set default output path if not provided
         if output_path is None:
             # Generate output path based on input path
-            input_path = Path(image_path)
-            output_path = str(input_path.parent / f"{input_path.stem}_text{input_path.suffix}")
+            root, ext = os.path.splitext(image_path)
+            output_path = f"{root}_text{ext}"
         
         # Open the image
         with Image.open(image_path) as img:
             # Convert to RGBA to support transparency
-            img = img.convert("RGBA")
-            
-            # Create a drawing context
-            draw = ImageDraw.Draw(img)
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
             
             # Get text position
             position = text_config.get("text_position", "bottom").lower()
@@ -123,7 +245,8 @@ class ImageEditor:
             call_to_action = text_config.get("call_to_action")
             
             # Get font and styling
-            font = self._get_font(text_config)
+            if font is None:
+                font = self._get_font(text_config)
             color = self._parse_color(text_config.get("color", self.default_text_color))
             
             # Check if shadow is enabled
@@ -135,53 +258,168 @@ class ImageEditor:
                 shadow_offset = text_config.get("shadow_offset", self.default_shadow_offset)
             
             # Calculate text positions based on the specified position
-            width, height = img.size
             text_positions = self._calculate_text_positions(
-                img, position, primary_text, secondary_text, call_to_action, font
+                img.size, position, primary_text, secondary_text, call_to_action, font
             )
             
-            # Draw text with shadow if enabled
-            if shadow:
-                # Draw primary text shadow
-                primary_pos = text_positions["primary"]
-                shadow_pos = (primary_pos[0] + shadow_offset[0], primary_pos[1] + shadow_offset[1])
-                draw.text(shadow_pos, primary_text, font=font, fill=shadow_color)
-                
-                # Draw secondary text shadow if present
-                if secondary_text and "secondary" in text_positions:
-                    secondary_pos = text_positions["secondary"]
-                    shadow_pos = (secondary_pos[0] + shadow_offset[0], secondary_pos[1] + shadow_offset[1])
-                    draw.text(shadow_pos, secondary_text, font=font, fill=shadow_color)
-                
-                # Draw call to action shadow if present
-                if call_to_action and "cta" in text_positions:
-                    cta_pos = text_positions["cta"]
-                    shadow_pos = (cta_pos[0] + shadow_offset[0], cta_pos[1] + shadow_offset[1])
-                    draw.text(shadow_pos, call_to_action, font=font, fill=shadow_color)
+            # Collect the text elements that have a position
+            items = [(primary_text, "primary")]
+            if secondary_text and "secondary" in text_positions:
+                items.append((secondary_text, "secondary"))
+            if call_to_action and "cta" in text_positions:
+                items.append((call_to_action, "cta"))
             
-            # Draw primary text
-            draw.text(text_positions["primary"], primary_text, font=font, fill=color)
+            # Rasterize each text element once; the mask is reused for shadow and fill
+            layers = [(self._render_text_mask(text, font), text_positions[key]) for text, key in items]
+            composite = self._composite_text_mask
             
-            # Draw secondary text if present
-            if secondary_text and "secondary" in text_positions:
-                draw.text(text_positions["secondary"], secondary_text, font=font, fill=color)
+            # Draw all shadows first so no shadow falls over another element's text
+            if shadow:
+                offset_x, offset_y = shadow_offset
+                for text_mask, (x, y) in layers:
+                    composite(img, text_mask, (x + offset_x, y + offset_y), shadow_color)
             
-            # Draw call to action if present
-            if call_to_action and "cta" in text_positions:
-                draw.text(text_positions["cta"], call_to_action, font=font, fill=color)
+            for text_mask, text_pos in layers:
+                composite(img, text_mask, text_pos, color)
             
             # Save the image
-            img.save(output_path)
+            img.save(output_path, **(save_kwargs or {}))
             
             logger.info(f"Applied text overlay to {image_path} and saved to {output_path}")
             
             return output_path
     
+    def process_batch(
+        self,
+        image_paths: List[str],
+        text_config: Optional[Dict[str, Any]] = None,
+        logo_config: Optional[Dict[str, Any]] = None,
+        adjustments: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Apply the same text overlay, logo overlay and adjustments to many images.
+        
+        The font and logo are resolved once up front and reused for every image,
+        and the images are processed concurrently in a thread pool. Each step
+        writes its output next to the input, as the individual methods do.
+        
+        Args:
+            image_paths: Paths to the input images.
+            text_config: Optional text overlay configuration (see apply_text_overlay).
+            logo_config: Optional logo overlay configuration (see apply_logo_overlay).
+            adjustments: Optional image adjustments (see adjust_image).
+            max_workers: Maximum number of worker threads. Defaults to the CPU count.
+        
+        Returns:
+            Paths to the output images, in the same order as image_paths.
+        
+        Raises:
+            FileNotFoundError: If an input image does not exist.
+            ValueError: If the text or logo configuration is invalid.
+        """
+        if not image_paths:
+            return []
+        
+        # Resolve the font once for the whole batch
+        font = self._get_font(text_config) if text_config else None
+        
+        # Warm the logo cache for the first image's width; same-sized images reuse it
+        if logo_config and "url" in logo_config and os.path.isfile(image_paths[0]):
+            with Image.open(image_paths[0]) as first_img:
+                target_width = int(first_img.width * (logo_config.get("size", 15) / 100))
+            self._prepare_logo(logo_config["url"], target_width, logo_config.get("opacity", 100))
+        
+        # Only the last step writes a final image; earlier steps save with fast settings
+        steps = []
+        if text_config:
+            steps.append(lambda path, kwargs: self.apply_text_overlay(path, text_config, font=font, save_kwargs=kwargs))
+        if logo_config:
+            steps.append(lambda path, kwargs: self.apply_logo_overlay(path, logo_config, save_kwargs=kwargs))
+        if adjustments:
+            steps.append(lambda path, kwargs: self.adjust_image(path, adjustments, save_kwargs=kwargs))
+        
+        def process_image(image_path: str) -> str:
+            result_path = image_path
+            for index, step in enumerate(steps):
+                is_last = index == len(steps) - 1
+                result_path = step(result_path, None if is_last else intermediate_save_kwargs(result_path))
+            return result_path
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            results = list(executor.map(process_image, image_paths))
+        
+        logger.info(f"Processed batch of {len(results)} images")
+        
+        return results
+    
+    def _render_text_mask(
+        self,
+        text: str,
+        font: ImageFont.FreeTypeFont
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Rasterize text into a grayscale coverage mask.
+        
+        Args:
+            text: Text to rasterize.
+            font: Font to use for the text.
+        
+        Returns:
+            Tuple of (mask, origin), where origin is the offset of the mask's
+            top-left corner relative to the text's drawing position.
+        """
+        left, top, right, bottom = _text_bbox(font, text)
+        
+        # Extend the mask to cover glyphs that overhang the drawing position
+        origin = (min(left, 0), min(top, 0))
+        mask = Image.new("L", (max(right - origin[0], 1), max(bottom - origin[1], 1)), 0)
+        ImageDraw.Draw(mask).text((-origin[0], -origin[1]), text, font=font, fill=255)
+        
+        return mask, origin
+    
+    def _composite_text_mask(
+        self,
+        img: Image.Image,
+        text_mask: Tuple[Image.Image, Tuple[int, int]],
+        position: Tuple[int, int],
+        color: Tuple[int, int, int, int]
+    ) -> None:
+        """
+        Composite a rasterized text mask onto an image in the given color.
+        
+        Args:
+            img: RGBA image to draw on (modified in place).
+            text_mask: Mask and origin as returned by _render_text_mask.
+            position: Position the text was laid out at.
+            color: RGBA color of the text.
+        """
+        mask, origin = text_mask
+        x, y = position[0] + origin[0], position[1] + origin[1]
+        
+        # alpha_composite requires a non-negative destination, so crop any overhang
+        if x < 0 or y < 0:
+            mask = mask.crop((max(-x, 0), max(-y, 0), mask.width, mask.height))
+            x, y = max(x, 0), max(y, 0)
+        if mask.width <= 0 or mask.height <= 0 or x >= img.width or y >= img.height:
+            return
+        
+        # Scale glyph coverage by the color's own alpha
+        if color[3] == 255:
+            alpha = mask
+        else:
+            alpha = ImageChops.multiply(mask, Image.new("L", mask.size, color[3]))
+        
+        layer = Image.new("RGBA", mask.size, color)
+        layer.putalpha(alpha)
+        img.alpha_composite(layer, dest=(x, y))
+    
     def apply_logo_overlay(
         self,
         image_path: str,
         logo_config: Dict[str, Any],
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        save_kwargs: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Apply logo overlay to an image.
@@ -198,6 +436,8 @@ class ImageEditor:
                     - opacity: Opacity of the logo (0-100).
             output_path: Path to save the output image. If not provided,
                          a path will be generated based on the input path.
+            save_kwargs: Optional keyword arguments for Image.save, e.g.
+                         {"compress_level": 1} for fast intermediate PNGs.
         
         Returns:
             Path to the output image.
@@ -217,8 +457,8 @@ class ImageEditor:
         # Set default output path if not provided
         if output_path is None:
             # Generate output path based on input path
-            input_path = Path(image_path)
-            output_path = str(input_path.parent / f"{input_path.stem}_with_logo{input_path.suffix}")
+            root, ext = os.path.splitext(image_path)
+            output_path = f"{root}_with_logo{ext}"
         
         # Get logo URL
         logo_url = logo_config["url"]
@@ -239,19 +479,14 @@ class ImageEditor:
             # Open the image
             with Image.open(image_path) as img:
                 # Convert to RGBA to support transparency
-                img = img.convert("RGBA")
+                if img.mode != "RGBA":
+                    img = img.convert("RGBA")
                 
-                # Load the logo
-                logo = self._load_logo(logo_url)
+                # Load the logo, resized and opacity-adjusted for this image width
+                target_width = int(img.width * (size_percent / 100))
+                logo = self._prepare_logo(logo_url, target_width, opacity)
                 
                 if logo:
-                    # Resize the logo
-                    logo = self._resize_logo(logo, img, size_percent)
-                    
-                    # Apply opacity if needed
-                    if opacity < 100:
-                        logo = self._apply_opacity(logo, opacity)
-                    
                     # Calculate logo position
                     logo_position = self._calculate_logo_position(img, logo, position, padding)
                     
@@ -259,7 +494,7 @@ class ImageEditor:
                     img = self._overlay_logo(img, logo, logo_position)
                     
                     # Save the image
-                    img.save(output_path)
+                    img.save(output_path, **(save_kwargs or {}))
                     
                     logger.info(f"Applied logo overlay to {image_path} and saved to {output_path}")
                     
@@ -285,41 +520,84 @@ class ImageEditor:
             # Check if it's a URL or a file path
             if logo_url.startswith(('http://', 'https://')):
                 # It's a URL, download the image
-                response = requests.get(logo_url, timeout=10)
-                response.raise_for_status()  # Raise an exception for HTTP errors
-                
-                # Load the image from the response content
-                logo = Image.open(BytesIO(response.content))
+                source = BytesIO(_fetch_logo_bytes(logo_url))
             else:
                 # It's a file path, load the image directly
                 if not os.path.isfile(logo_url):
                     logger.error(f"Logo file not found: {logo_url}")
                     return None
                 
-                logo = Image.open(logo_url)
-            
-            # Convert to RGBA to support transparency
-            logo = logo.convert("RGBA")
+                source = logo_url
             
-            return logo
+            # Load the pixels eagerly so no file handle outlives this call, and
+            # convert to RGBA to support transparency
+            with Image.open(source) as image:
+                return image.convert("RGBA") if image.mode != "RGBA" else image.copy()
         except Exception as e:
             logger.error(f"Error loading logo: {e}")
             return None
     
-    def _resize_logo(self, logo: Image.Image, img: Image.Image, size_percent: int) -> Image.Image:
+    def _prepare_logo(self, logo_url: str, target_width: int, opacity: int) -> Optional[Image.Image]:
+        """
+        Load, resize and apply opacity to a logo, reusing previously prepared logos.
+        
+        Args:
+            logo_url: URL or path to the logo image.
+            target_width: Width to resize the logo to, in pixels.
+            opacity: Opacity value (0-100).
+            
+        Returns:
+            Prepared logo image or None if loading fails.
+        """
+        # Include the modification time of local files so edited logos are reloaded
+        mtime = None
+        if not logo_url.startswith(('http://', 'https://')) and os.path.isfile(logo_url):
+            mtime = os.path.getmtime(logo_url)
+        
+        key = (logo_url, mtime, target_width, opacity)
+        with _logo_cache_lock:
+            logo = _logo_cache.get(key)
+        if logo is not None:
+            return logo
+        
+        # Load the logo
+        logo = self._load_logo(logo_url)
+        if logo is None:
+            return None
+        
+        # Resize the logo
+        logo = self._resize_logo(logo, target_width)
+        
+        # Apply opacity if needed
+        if opacity < 100:
+            logo = self._apply_opacity(logo, opacity)
+        
+        with _logo_cache_lock:
+            # Another thread may have prepared the same logo meanwhile
+            if key in _logo_cache:
+                return _logo_cache[key]
+            
+            # Evict the oldest entry once the cache is full
+            if len(_logo_cache) >= _LOGO_CACHE_SIZE:
+                _logo_cache.pop(next(iter(_logo_cache)))
+            _logo_cache[key] = logo
+        
+        return logo
+    
+    def _resize_logo(self, logo: Image.Image, target_width: int) -> Image.Image:
         """
-        Resize the logo based on the image width.
+        Resize the logo to a target width, preserving its aspect ratio.
         
         Args:
             logo: Logo image.
-            img: Main image.
-            size_percent: Size of the logo as a percentage of the image width.
+            target_width: Width to resize the logo to, in pixels.
             
         Returns:
             Resized logo image.
         """
-        # Calculate the target width
-        target_width = int(img.width * (size_percent / 100))
+        # Already the requested size
+        if logo.width == target_width:
+            return logo
         
         # Calculate the aspect ratio
         aspect_ratio = logo.width / logo.height
@@ -344,14 +622,11 @@ class ImageEditor:
         # Convert opacity from percentage to alpha value (0-255)
         alpha = int(255 * (opacity / 100))
         
-        # Get the alpha channel
-        r, g, b, a = logo.split()
-        
-        # Apply the new alpha
-        a = a.point(lambda x: min(x, alpha))
+        # Clamp the alpha channel in a single vectorized pass
+        arr = np.array(logo, copy=True)
+        np.minimum(arr[..., 3], alpha, out=arr[..., 3])
         
-        # Recombine the channels
-        return Image.merge("RGBA", (r, g, b, a))
+        return Image.fromarray(arr)
     
     def _calculate_logo_position(
         self,
@@ -401,24 +676,31 @@ class ImageEditor:
             position: Position of the logo as (x, y) coordinates.
             
         Returns:
-            Image with logo overlaid.
+            Image with logo overlaid (the input image, modified in place).
         """
-        # Create a new image with the same size as the original
-        result = Image.new("RGBA", img.size)
-        
-        # Paste the original image
-        result.paste(img, (0, 0))
-        
-        # Paste the logo
-        result.paste(logo, position, logo)
-        
-        return result
+        # Logos without transparency can be copied straight in
+        if logo.mode != "RGBA":
+            img.paste(logo, position)
+            return img
+        
+        # alpha_composite needs a non-negative destination, so crop off any part
+        # of the logo that falls outside the top or left edge of the image
+        x, y = position
+        source = (max(-x, 0), max(-y, 0))
+        if source[0] >= logo.width or source[1] >= logo.height:
+            return img
+        
+        # Composite the logo directly onto the image instead of copying it first
+        img.alpha_composite(logo, dest=(max(x, 0), max(y, 0)), source=source)
+        
+        return img
     
     def adjust_image(
         self,
         image_path: str,
         adjustments: Dict[str, float],
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        save_kwargs: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Apply adjustments to an image.
@@ -434,6 +716,8 @@ class ImageEditor:
                     - blur: Blur radius (0.0 to 10.0).
             output_path: Path to save the output image. If not provided,
                          a path will be generated based on the input path.
+            save_kwargs: Optional keyword arguments for Image.save, e.g.
+                         {"compress_level": 1} for fast intermediate PNGs.
         
         Returns:
             Path to the output image.
@@ -448,31 +732,25 @@ class ImageEditor:
         # Set default output path if not provided
         if output_path is None:
             # Generate output path based on input path
-            input_path = Path(image_path)
-            output_path = str(input_path.parent / f"{input_path.stem}_adjusted{input_path.suffix}")
+            root, ext = os.path.splitext(image_path)
+            output_path = f"{root}_adjusted{ext}"
+        
+        # Nothing to apply, so copy the image through without re-encoding it
+        if not adjustments:
+            if os.path.abspath(output_path) != os.path.abspath(image_path):
+                shutil.copyfile(image_path, output_path)
+            logger.info(f"No adjustments requested for {image_path}, copied to {output_path}")
+            return output_path
         
         # Open the image
         with Image.open(image_path) as img:
             # Convert to RGB to support all adjustments
-            img = img.convert("RGB")
+            if img.mode != "RGB":
+                img = img.convert("RGB")
             
-            # Apply brightness adjustment
-            if "brightness" in adjustments:
-                factor = 1.0 + (adjustments["brightness"] / 100.0)
-                enhancer = ImageEnhance.Brightness(img)
-                img = enhancer.enhance(factor)
-            
-            # Apply contrast adjustment
-            if "contrast" in adjustments:
-                factor = 1.0 + (adjustments["contrast"] / 100.0)
-                enhancer = ImageEnhance.Contrast(img)
-                img = enhancer.enhance(factor)
-            
-            # Apply saturation adjustment
-            if "saturation" in adjustments:
-                factor = 1.0 + (adjustments["saturation"] / 100.0)
-                enhancer = ImageEnhance.Color(img)
-                img = enhancer.enhance(factor)
+            # Apply brightness, contrast and saturation in a single array pass
+            if any(key in adjustments for key in ("brightness", "contrast", "saturation")):
+                img = self._apply_color_adjustments(img, adjustments)
             
             # Apply sharpness adjustment
             if "sharpness" in adjustments:
@@ -480,18 +758,62 @@ class ImageEditor:
                 enhancer = ImageEnhance.Sharpness(img)
                 img = enhancer.enhance(factor)
             
-            # Apply blur
-            if "blur" in adjustments:
+            # Apply blur. Pillow implements GaussianBlur as repeated extended box
+            # blurs, so its cost per pixel does not grow with the radius.
+            if adjustments.get("blur", 0) > 0:
                 radius = adjustments["blur"]
                 img = img.filter(ImageFilter.GaussianBlur(radius=radius))
             
             # Save the image
-            img.save(output_path)
+            img.save(output_path, **(save_kwargs or {}))
             
             logger.info(f"Applied adjustments to {image_path} and saved to {output_path}")
             
             return output_path
     
+    def _apply_color_adjustments(self, img: Image.Image, adjustments: Dict[str, float]) -> Image.Image:
+        """
+        Apply brightness, contrast and saturation adjustments to an RGB image.
+        
+        The adjustments are applied in that order with the same formulas as
+        Pillow's ImageEnhance operators, but on a single float buffer so no
+        intermediate images are materialized between steps.
+        
+        Args:
+            img: RGB image.
+            adjustments: Dictionary of adjustments to apply (percentages).
+            
+        Returns:
+            Adjusted RGB image.
+        """
+        arr = np.asarray(img, dtype=np.float32).copy()
+        
+        # Brightness: scale towards black
+        if "brightness" in adjustments:
+            arr *= 1.0 + (adjustments["brightness"] / 100.0)
+            np.clip(arr, 0, 255, out=arr)
+        
+        # Contrast: scale around the mean grayscale level
+        if "contrast" in adjustments:
+            mean = int((arr @ _LUMA_WEIGHTS).mean() + 0.5)
+            arr -= mean
+            arr *= 1.0 + (adjustments["contrast"] / 100.0)
+            arr += mean
+            np.clip(arr, 0, 255, out=arr)
+        
+        # Saturation: scale each pixel around its own grayscale level, i.e.
+        # luma + (arr - luma) * factor, rearranged as arr * factor + luma * (1 - factor)
+        # so the full RGB buffer is only swept twice
+        if "saturation" in adjustments:
+            factor = 1.0 + (adjustments["saturation"] / 100.0)
+            luma = arr @ _LUMA_WEIGHTS
+            luma *= 1.0 - factor
+            arr *= factor
+            arr += luma[..., np.newaxis]
+            np.clip(arr, 0, 255, out=arr)
+        
+        return Image.fromarray(np.rint(arr).astype(np.uint8))
+    
     def _get_font(self, text_config: Dict[str, Any]) -> ImageFont.FreeTypeFont:
         """
         Get a font based on the text configuration.
@@ -506,6 +828,26 @@ class ImageEditor:
         font_name = text_config.get("font", self.default_font)
         font_size = text_config.get("font_size", self.default_font_size)
         
+        # Reuse a previously loaded font to avoid re-parsing the font file
+        key = (self.font_dir, font_name, font_size)
+        font = _font_cache.get(key)
+        if font is None:
+            font = self._load_font_uncached(font_name, font_size)
+            _font_cache[key] = font
+        
+        return font
+    
+    def _load_font_uncached(self, font_name: str, font_size: int) -> ImageFont.FreeTypeFont:
+        """
+        Load a font from the font directory, the system, or the fallbacks.
+        
+        Args:
+            font_name: Name of the font.
+            font_size: Size of the font.
+        
+        Returns:
+            Font object.
+        """
         logger.info(f"Attempting to load font: {font_name} at size: {font_size}px")
         
         # Try to load the font from the font directory if provided
@@ -548,34 +890,18 @@ class ImageEditor:
             except Exception as e:
                 logger.warning(f"Failed to load default font {self.default_font}: {e}")
                 
-                # Fall back to a bitmap font with the specified size
+                # Try the fallback font resolved from our fonts directory
                 logger.warning(f"Falling back to default font with size {font_size}px")
-                default_font = ImageFont.load_default()
-                
-                # Create a larger bitmap font by scaling
-                try:
-                    # Try fonts that we know are in our fonts directory
-                    common_fonts = [
-                        os.path.join(self.font_dir, "Montserrat-Regular.ttf"),
-                        os.path.join(self.font_dir, "OpenSans-Regular.ttf"),
-                        os.path.join(self.font_dir, "Roboto-Regular.ttf"),
-                        os.path.join(self.font_dir, "PlayfairDisplay-Regular.ttf")
-                    ]
-                    
-                    for common_font in common_fonts:
-                        if os.path.exists(common_font):
-                            try:
-                                return ImageFont.truetype(common_font, font_size)
-                            except Exception as e:
-                                logger.warning(f"Failed to load font {common_font}: {e}")
-                                continue
-                except Exception as e:
-                    logger.warning(f"Error trying common fonts: {e}")
+                if self._fallback_font_path:
+                    try:
+                        return ImageFont.truetype(self._fallback_font_path, font_size)
+                    except Exception as e:
+                        logger.warning(f"Failed to load font {self._fallback_font_path}: {e}")
                 
                 # If all else fails, return the default font
                 # Note: The default font may not respect the requested size
                 logger.warning("All font loading attempts failed. Text size may not be as expected.")
-                return default_font
+                return ImageFont.load_default()
     
     def _parse_color(self, color: str) -> Tuple[int, int, int, int]:
         """
@@ -587,33 +913,17 @@ class ImageEditor:
         Returns:
             RGBA tuple.
         """
-        # Remove # if present
-        if color.startswith("#"):
-            color = color[1:]
-        
-        # Parse RGB or RGBA
-        if len(color) == 6:
-            # RGB
-            r = int(color[0:2], 16)
-            g = int(color[2:4], 16)
-            b = int(color[4:6], 16)
-            a = 255
-        elif len(color) == 8:
-            # RGBA
-            r = int(color[0:2], 16)
-            g = int(color[2:4], 16)
-            b = int(color[4:6], 16)
-            a = int(color[6:8], 16)
-        else:
+        rgba = _parse_hex_color(color)
+        if rgba is None:
             # Invalid color, use default
             logger.warning(f"Invalid color format: {color}, using default")
-            return self._parse_color(self.default_text_color)
+            return self._default_text_rgba
         
-        return (r, g, b, a)
+        return rgba
     
     def _calculate_text_positions(
         self,
-        img: Image.Image,
+        image_size: Tuple[int, int],
         position: str,
         primary_text: str,
         secondary_text: Optional[str],
@@ -623,8 +933,12 @@ class ImageEditor:
         """
         Calculate positions for text elements.
         
+        Text sizes come from the memoized _text_bbox, which gives the same box
+        as ImageDraw.textbbox at the default anchor, so the layout needs no
+        drawing context and each string is measured at most once per font.
+        
         Args:
-            img: Image to overlay text on.
+            image_size: Size of the image to overlay text on, as (width, height).
             position: Position of the text (top, center, bottom).
             primary_text: Primary text.
             secondary_text: Secondary text.
@@ -634,16 +948,16 @@ class ImageEditor:
         Returns:
             Dictionary of text positions.
         """
-        width, height = img.size
+        width, height = image_size
         positions = {}
         
         # Calculate text sizes
-        primary_size = font.getbbox(primary_text)
+        primary_size = _text_bbox(font, primary_text)
         primary_width = primary_size[2] - primary_size[0]
         primary_height = primary_size[3] - primary_size[1]
         
         if secondary_text:
-            secondary_size = font.getbbox(secondary_text)
+            secondary_size = _text_bbox(font, secondary_text)
             secondary_width = secondary_size[2] - secondary_size[0]
             secondary_height = secondary_size[3] - secondary_size[1]
         else:
@@ -651,7 +965,7 @@ class ImageEditor:
             secondary_height = 0
         
         if call_to_action:
-            cta_size = font.getbbox(call_to_action)
+            cta_size = _text_bbox(font, call_to_action)
             cta_width = cta_size[2] - cta_size[0]
             cta_height = cta_size[3] - cta_size[1]
         else:
@@ -7,12 +7,69 @@ styling information.
 
 import os
 import json
+import time
+import sqlite3
+import hashlib
+import asyncio
+import functools
+import itertools
 import logging
-from typing import Dict, Any, List, Optional, Union
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from glow.core.credentials import load_env_file
 
 logger = logging.getLogger(__name__)
 
+# Text configuration keys that hold translatable text, in request order
+TRANSLATABLE_KEYS = ("primary_text", "secondary_text", "call_to_action")
+
+# Maximum number of texts sent to the translation API in a single request
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# Connection pool size and retry policy for translation API requests
+POOL_SIZE = 50
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False
+)
+
+# Default number of concurrent translation requests made by async batches
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Default lifetime of access tokens fetched from token_url, in seconds
+DEFAULT_TOKEN_TTL = 9 * 60
+
+# Response status codes that indicate an expired or rejected access token
+AUTH_ERROR_STATUS_CODES = (401, 403)
+
+# Default lifetime of on-disk cached translations, in seconds (30 days)
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
+
+def _extract_translations(result: Dict[str, Any], texts: List[str]) -> List[str]:
+    """Extract translations from a ``{"translations": [{"translated_text": ...}]}`` response."""
+    return [item["translated_text"] for item in result["translations"]]
+
+def _extract_translated_texts(result: Dict[str, Any], texts: List[str]) -> List[str]:
+    """Extract translations from a ``{"translated_texts": [...]}`` response."""
+    return result["translated_texts"]
+
+def _extract_list(result: List[str], texts: List[str]) -> List[str]:
+    """Extract translations from a plain list response with one entry per text."""
+    if not isinstance(result, list) or len(result) != len(texts):
+        raise ValueError("Response is not a list of translations")
+    return result
+
+def _extract_text(result: Dict[str, Any], texts: List[str]) -> List[str]:
+    """Extract the translation from a ``{"text": ...}`` response."""
+    return [result["text"]]
+
 class LocalizationProcessor:
     """
     Class for processing text localization.
@@ -33,6 +90,19 @@ class LocalizationProcessor:
                     - env_vars: List of environment variable names for API credentials.
                     - headers: Additional headers to include in API requests.
                     - params: Additional parameters to include in API requests.
+                    - max_batch_size: Maximum number of texts sent in a single
+                      batch request (default: 100).
+                    - max_concurrency: Maximum number of translation requests in
+                      flight during async batch translation (default: 8). Local
+                      or on-prem translators should use a lower value.
+                    - token_url: URL that issues short-lived access tokens. When set,
+                      requests use a cached token instead of the API key directly.
+                    - token_ttl: Lifetime of issued access tokens in seconds
+                      (default: 540).
+                    - cache_path: Path of an SQLite file used to cache translations
+                      across runs. Disabled when not set.
+                    - cache_ttl: Lifetime of cached translations in seconds
+                      (default: 30 days).
         """
         self.api_config = api_config or {}
         self.api_endpoint = self.api_config.get("api_endpoint")
@@ -40,6 +110,7 @@ class LocalizationProcessor:
         # Load API credentials from environment variables if specified
         self.credentials = {}
         if "env_vars" in self.api_config:
+            load_env_file()
             for env_var in self.api_config["env_vars"]:
                 if env_var in os.environ:
                     self.credentials[env_var] = os.environ[env_var]
@@ -49,6 +120,35 @@ class LocalizationProcessor:
         # Additional headers and parameters for API requests
         self.headers = self.api_config.get("headers", {})
         self.params = self.api_config.get("params", {})
+        self.max_batch_size = self.api_config.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE)
+        self.max_concurrency = self.api_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        
+        # Translations already returned by the API, keyed by (source, target, text)
+        self._already_translated = {}
+        
+        # Response extractor detected from the first successful response
+        self._extract = None
+        
+        # Reuse connections to the translation API across requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY_POLICY
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Short-lived access token cache, refreshed by a single thread at a time
+        self.token_url = self.api_config.get("token_url")
+        self.token_ttl = self.api_config.get("token_ttl", DEFAULT_TOKEN_TTL)
+        self._token = None
+        self._token_lock = threading.Lock()
+        
+        # Optional on-disk translation cache shared across runs
+        self.cache_ttl = self.api_config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+        self._cache_db = None
+        if self.api_config.get("cache_path"):
+            self._cache_db = self._open_cache(self.api_config["cache_path"])
         
         # If API key is in credentials, add it to headers
         if "TRANSLATION_API_KEY" in self.credentials:
@@ -79,57 +179,378 @@ class LocalizationProcessor:
         if not self.api_endpoint:
             raise ValueError("Translation API endpoint not configured")
         
-        # Create a copy of the text configuration to avoid modifying the original
-        translated_config = text_config.copy()
-        
         # Extract text content to translate
-        texts_to_translate = []
-        text_keys = []
-        
-        # Check for primary text
-        if "primary_text" in text_config:
-            texts_to_translate.append(text_config["primary_text"])
-            text_keys.append("primary_text")
-        
-        # Check for secondary text
-        if "secondary_text" in text_config:
-            texts_to_translate.append(text_config["secondary_text"])
-            text_keys.append("secondary_text")
-        
-        # Check for call to action
-        if "call_to_action" in text_config:
-            texts_to_translate.append(text_config["call_to_action"])
-            text_keys.append("call_to_action")
+        texts_to_translate, text_keys = self._extract_texts(text_config)
         
         # If no text to translate, return the original configuration
         if not texts_to_translate:
             logger.warning("No text content found to translate")
-            return translated_config
+            return text_config.copy()
         
         # Translate the text
         try:
-            translated_texts = self._call_translation_api(
+            translated_texts = self._translate_texts(
                 texts_to_translate, target_language, source_language
             )
             
-            # Update the text configuration with translated text
-            for i, key in enumerate(text_keys):
-                if i < len(translated_texts):
-                    translated_config[key] = translated_texts[i]
-            
-            # Add localization metadata
-            translated_config["localization"] = {
-                "source_language": source_language,
-                "target_language": target_language,
-                "translated": True
-            }
-            
-            return translated_config
+            return self._apply_translations(
+                text_config, text_keys, translated_texts, target_language, source_language
+            )
         
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             raise ValueError(f"Translation failed: {e}")
     
+    async def translate_text_async(
+        self,
+        text_config: Dict[str, Any],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate text content in a text configuration without blocking the event loop.
+        
+        The API request runs in the event loop's default executor, so several
+        translations awaited together overlap their network round-trips.
+        
+        Args:
+            text_config: Text configuration containing text content to translate.
+            target_language: Target language code (e.g., "fr" for French).
+            source_language: Source language code. If not provided, the API will
+                            attempt to detect the source language.
+        
+        Returns:
+            Updated text configuration with translated text.
+        
+        Raises:
+            ValueError: If the API endpoint is not configured or if the translation fails.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.translate_text, text_config, target_language, source_language)
+        )
+    
+    def _extract_texts(self, text_config: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """
+        Extract the translatable text content from a text configuration.
+        
+        Args:
+            text_config: Text configuration.
+        
+        Returns:
+            Tuple of (texts, keys), where keys are the configuration keys the
+            texts were read from.
+        """
+        texts = []
+        keys = []
+        
+        for key in TRANSLATABLE_KEYS:
+            if key in text_config:
+                texts.append(text_config[key])
+                keys.append(key)
+        
+        return texts, keys
+    
+    def _apply_translations(
+        self,
+        text_config: Dict[str, Any],
+        text_keys: List[str],
+        translated_texts: List[str],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a translated copy of a text configuration.
+        
+        Args:
+            text_config: Original text configuration.
+            text_keys: Keys of the texts that were translated, in request order.
+            translated_texts: Translated texts, in request order.
+            target_language: Target language code.
+            source_language: Source language code.
+        
+        Returns:
+            Copy of the text configuration with translated text and localization metadata.
+        """
+        # Create a copy of the text configuration to avoid modifying the original
+        translated_config = text_config.copy()
+        
+        # Update the text configuration with translated text
+        for i, key in enumerate(text_keys):
+            if i < len(translated_texts):
+                translated_config[key] = translated_texts[i]
+        
+        # Add localization metadata
+        translated_config["localization"] = {
+            "source_language": source_language,
+            "target_language": target_language,
+            "translated": True
+        }
+        
+        return translated_config
+    
+    def _translate_texts(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> List[str]:
+        """
+        Translate a list of texts, reusing earlier translations.
+        
+        Texts translated before by this processor are served from memory, and the
+        remaining texts are deduplicated so each distinct string is sent to the API
+        only once.
+        
+        Args:
+            texts: List of texts to translate.
+            target_language: Target language code.
+            source_language: Source language code.
+        
+        Returns:
+            List of translated texts, in the same order as ``texts``.
+        
+        Raises:
+            ValueError: If the API call fails.
+        """
+        known = self._already_translated
+        unique = [
+            text for text in dict.fromkeys(texts)
+            if (source_language, target_language, text) not in known
+        ]
+        
+        # Serve what we can from the on-disk cache
+        if unique and self._cache_db is not None:
+            cached = self._read_cache(unique, target_language, source_language)
+            for text, translation in cached.items():
+                known[(source_language, target_language, text)] = translation
+            unique = [text for text in unique if text not in cached]
+        
+        if unique:
+            translated = self._call_translation_api(unique, target_language, source_language)
+            for text, translation in zip(unique, translated):
+                known[(source_language, target_language, text)] = translation
+            
+            if self._cache_db is not None:
+                self._write_cache(
+                    dict(zip(unique, translated)), target_language, source_language
+                )
+        
+        # Stop at the first text the API did not return a translation for
+        keys = itertools.takewhile(
+            lambda key: key in known,
+            ((source_language, target_language, text) for text in texts)
+        )
+        return [known[key] for key in keys]
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """
+        Build the headers for a translation API request.
+        
+        Returns:
+            Request headers, including a current access token if token_url is configured.
+        
+        Raises:
+            requests.exceptions.RequestException: If a token refresh fails.
+        """
+        if not self.token_url:
+            return self.headers
+        
+        headers = dict(self.headers)
+        headers["Authorization"] = f"Bearer {self._get_token()}"
+        return headers
+    
+    def _get_token(self) -> str:
+        """
+        Return a cached access token, fetching a new one when it has expired.
+        
+        Only one thread refreshes the token at a time; others wait and reuse it.
+        
+        Returns:
+            Access token.
+        
+        Raises:
+            requests.exceptions.RequestException: If the token request fails.
+        """
+        token = self._token
+        if token is not None and time.monotonic() - token[1] < self.token_ttl:
+            return token[0]
+        
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited
+            token = self._token
+            if token is not None and time.monotonic() - token[1] < self.token_ttl:
+                return token[0]
+            
+            response = self._session.post(self.token_url, headers=self.headers)
+            response.raise_for_status()
+            
+            try:
+                result = response.json()
+                access_token = result["access_token"] if isinstance(result, dict) else result
+            except (json.JSONDecodeError, KeyError):
+                access_token = response.text.strip()
+            
+            self._token = (access_token, time.monotonic())
+            return access_token
+    
+    def _invalidate_token(self, authorization: str) -> None:
+        """
+        Drop the cached access token so the next request fetches a new one.
+        
+        The token is only dropped if it is still the one the rejected request
+        used, so a fresh token fetched by another thread is kept.
+        
+        Args:
+            authorization: Authorization header of the rejected request.
+        """
+        with self._token_lock:
+            if self._token is not None and f"Bearer {self._token[0]}" == authorization:
+                self._token = None
+    
+    def _open_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """
+        Open the on-disk translation cache and purge expired entries.
+        
+        Args:
+            cache_path: Path of the SQLite cache file.
+        
+        Returns:
+            Database connection, or None if the cache could not be opened.
+        """
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            
+            db = sqlite3.connect(cache_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(hash BLOB PRIMARY KEY, tgt TEXT, translation TEXT, ts REAL)"
+            )
+            db.execute("DELETE FROM translations WHERE ts < ?", (time.time() - self.cache_ttl,))
+            db.commit()
+            return db
+        
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache disabled, failed to open {cache_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _cache_key(text: str, target_language: str, source_language: Optional[str]) -> bytes:
+        """
+        Build the on-disk cache key for a text.
+        
+        Args:
+            text: Source text.
+            target_language: Target language code.
+            source_language: Source language code.
+        
+        Returns:
+            Cache key bytes.
+        """
+        digest = hashlib.blake2b(
+            f"{source_language or ''}\0{text}".encode("utf-8"), digest_size=16
+        ).digest()
+        return digest + target_language.encode("utf-8")
+    
+    def _read_cache(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Look up texts in the on-disk translation cache.
+        
+        Args:
+            texts: Texts to look up.
+            target_language: Target language code.
+            source_language: Source language code.
+        
+        Returns:
+            Dictionary mapping each cached text to its translation.
+        """
+        keys = {self._cache_key(text, target_language, source_language): text for text in texts}
+        min_ts = time.time() - self.cache_ttl
+        cached = {}
+        
+        try:
+            with self._cache_lock:
+                for key in keys:
+                    row = self._cache_db.execute(
+                        "SELECT translation FROM translations WHERE hash = ? AND ts >= ?",
+                        (key, min_ts)
+                    ).fetchone()
+                    if row is not None:
+                        cached[keys[key]] = row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read translation cache: {e}")
+        
+        return cached
+    
+    def _write_cache(
+        self,
+        translations: Dict[str, str],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> None:
+        """
+        Store translations in the on-disk translation cache.
+        
+        Args:
+            translations: Dictionary mapping source texts to translations.
+            target_language: Target language code.
+            source_language: Source language code.
+        """
+        now = time.time()
+        rows = [
+            (self._cache_key(text, target_language, source_language), target_language, translation, now)
+            for text, translation in translations.items()
+        ]
+        
+        try:
+            with self._cache_lock:
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO translations (hash, tgt, translation, ts) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._cache_db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write translation cache: {e}")
+    
+    def _find_extractor(self, result: Any, texts: List[str]) -> Callable[[Any, List[str]], List[str]]:
+        """
+        Detect the structure of a translation API response.
+        
+        Args:
+            result: Parsed API response.
+            texts: Texts that were sent for translation.
+        
+        Returns:
+            Function that extracts the translated texts from responses of this structure.
+        
+        Raises:
+            ValueError: If the response structure is not recognized.
+        """
+        # The exact structure depends on the API being used
+        if "translations" in result:
+            # Common structure for translation APIs
+            return _extract_translations
+        elif "translated_texts" in result:
+            # Alternative structure
+            return _extract_translated_texts
+        else:
+            # Try to extract translations based on the response structure
+            logger.warning("Unexpected response structure, attempting to extract translations")
+            if isinstance(result, list) and len(result) == len(texts):
+                return _extract_list
+            elif isinstance(result, dict) and "text" in result:
+                return _extract_text
+            else:
+                raise ValueError("Unable to extract translations from API response")
+    
     def _call_translation_api(
         self,
         texts: List[str],
@@ -166,35 +587,43 @@ class LocalizationProcessor:
         
         try:
             # Make the API request
-            response = requests.post(
+            headers = self._request_headers()
+            response = self._session.post(
                 self.api_endpoint,
                 json=payload,
-                headers=self.headers
+                headers=headers
             )
             
+            # Refresh an expired access token and retry once
+            if self.token_url and response.status_code in AUTH_ERROR_STATUS_CODES:
+                logger.info("Access token rejected, refreshing")
+                self._invalidate_token(headers["Authorization"])
+                response = self._session.post(
+                    self.api_endpoint,
+                    json=payload,
+                    headers=self._request_headers()
+                )
+            
             # Check if the request was successful
             response.raise_for_status()
             
             # Parse the response
             result = response.json()
             
-            # Extract translated texts from the response
-            # The exact structure depends on the API being used
-            if "translations" in result:
-                # Common structure for translation APIs
-                return [item["translated_text"] for item in result["translations"]]
-            elif "translated_texts" in result:
-                # Alternative structure
-                return result["translated_texts"]
-            else:
-                # Try to extract translations based on the response structure
-                logger.warning("Unexpected response structure, attempting to extract translations")
-                if isinstance(result, list) and len(result) == len(texts):
-                    return result
-                elif isinstance(result, dict) and "text" in result:
-                    return [result["text"]]
-                else:
-                    raise ValueError("Unable to extract translations from API response")
+            # Extract translated texts with the extractor found for earlier responses
+            if self._extract is not None:
+                try:
+                    return self._extract(result, texts)
+                except (KeyError, TypeError, ValueError):
+                    # The response structure changed, detect it again
+                    self._extract = None
+            
+            self._extract = self._find_extractor(result, texts)
+            try:
+                return self._extract(result, texts)
+            except (KeyError, TypeError, IndexError) as e:
+                logger.error(f"Malformed translation API response: {e!r}")
+                raise ValueError(f"Malformed translation API response: {e!r}")
         
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
@@ -213,6 +642,12 @@ class LocalizationProcessor:
         """
         Translate multiple text configurations in batch.
         
+        The texts of all configurations are flattened into as few API requests as
+        possible (at most ``max_batch_size`` texts each) and the translations are
+        scattered back to the configurations they came from. A configuration is
+        never split across requests, so if a request fails, the configurations it
+        covered are returned unchanged.
+        
         Args:
             text_configs: List of text configurations to translate.
             target_language: Target language code.
@@ -221,21 +656,143 @@ class LocalizationProcessor:
         Returns:
             List of translated text configurations.
         """
-        translated_configs = []
+        # Check if API endpoint is configured
+        if not self.api_endpoint:
+            logger.error("Failed to translate configs: Translation API endpoint not configured")
+            return list(text_configs)
+        
+        translated_configs = [config.copy() for config in text_configs]
         
-        for config in text_configs:
+        # Flatten the texts, remembering which configuration and key each came from
+        flat_texts = []
+        index = []
+        for i, config in enumerate(text_configs):
+            texts, keys = self._extract_texts(config)
+            flat_texts.extend(texts)
+            index.extend((i, key) for key in keys)
+        
+        if not flat_texts:
+            logger.warning("No text content found to translate")
+            return translated_configs
+        
+        for start, end in self._batch_bounds(index):
             try:
-                translated_config = self.translate_text(
-                    config, target_language, source_language
+                translated_texts = self._translate_texts(
+                    flat_texts[start:end], target_language, source_language
                 )
-                translated_configs.append(translated_config)
             except ValueError as e:
-                logger.error(f"Failed to translate config: {e}")
+                logger.error(f"Failed to translate configs: {e}")
+                # Keep the original configs to maintain the order
+                for i, _ in index[start:end]:
+                    translated_configs[i] = text_configs[i]
+                continue
+            
+            # Scatter the translations back to their configurations
+            for (i, key), text in zip(index[start:end], translated_texts):
+                translated_configs[i][key] = text
+                translated_configs[i]["localization"] = {
+                    "source_language": source_language,
+                    "target_language": target_language,
+                    "translated": True
+                }
+        
+        return translated_configs
+    
+    def _batch_bounds(self, index: List[Tuple[int, str]]) -> List[Tuple[int, int]]:
+        """
+        Split flattened texts into request batches along configuration boundaries.
+        
+        Args:
+            index: ``(config_index, key)`` pairs for the flattened texts.
+        
+        Returns:
+            List of ``(start, end)`` slice bounds into the flattened texts.
+        """
+        bounds = []
+        start = 0
+        end = 0
+        while end < len(index):
+            # Find the end of the current configuration's texts
+            config_end = end + 1
+            while config_end < len(index) and index[config_end][0] == index[end][0]:
+                config_end += 1
+            
+            # Close the batch if adding this configuration would exceed the limit
+            if end > start and config_end - start > self.max_batch_size:
+                bounds.append((start, end))
+                start = end
+            end = config_end
+        
+        if end > start:
+            bounds.append((start, end))
+        
+        return bounds
+    
+    async def batch_translate_configs_async(
+        self,
+        text_configs: List[Dict[str, Any]],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate multiple text configurations concurrently.
+        
+        At most ``max_concurrency`` translation requests are in flight at once.
+        
+        Args:
+            text_configs: List of text configurations to translate.
+            target_language: Target language code.
+            source_language: Source language code.
+        
+        Returns:
+            List of translated text configurations, in the same order. Configurations
+            that fail to translate are returned unchanged.
+        """
+        # Bound the number of requests in flight to avoid overwhelming the endpoint
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def translate(config):
+            async with semaphore:
+                return await self.translate_text_async(config, target_language, source_language)
+        
+        results = await asyncio.gather(
+            *[translate(config) for config in text_configs],
+            return_exceptions=True
+        )
+        
+        translated_configs = []
+        for config, result in zip(text_configs, results):
+            if isinstance(result, ValueError):
+                logger.error(f"Failed to translate config: {result}")
                 # Add the original config to maintain the order
                 translated_configs.append(config)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                translated_configs.append(result)
         
         return translated_configs
     
+    def close(self) -> None:
+        """
+        Release the HTTP connection pool and the translation cache.
+        """
+        self._session.close()
+        
+        with self._cache_lock:
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+    
+    def __del__(self):
+        """
+        Release resources when the processor is garbage collected.
+        """
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def is_configured(self) -> bool:
         """
         Check if the localization processor is properly configured.
@@ -7,16 +7,60 @@ configuration saving.
 """
 
 import os
+import re
+import sys
 import json
 import shutil
 import logging
 import time
+import uuid
+import weakref
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
 import datetime
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# Supported ways of placing an asset in the output directory
+COPY_MODES = ("auto", "link", "reflink", "copy")
+
+# Characters that are not allowed in path components. \w matches exactly the
+# characters for which str.isalnum() is true, plus the underscore.
+_UNSAFE_PATH_CHARS = re.compile(r"[^\w.\-]+")
+
+# Default number of API calls and errors kept in memory
+DEFAULT_MAX_RECORDS = 10_000
+
+# Metrics that hold lists of recorded events
+EVENT_METRICS = ("api_calls", "errors")
+
+# Filename timestamp for the current second, as [epoch_second, formatted]
+_timestamp_cache = [0, ""]
+
+# Write buffer size for log files
+LOG_BUFFER_SIZE = 1 << 20
+
+def _close_log_handles(handles: Dict[str, Any]) -> None:
+    """
+    Flush and close the given log file handles and forget them.
+    
+    Kept at module level so the finalizer registered by OutputManager does not
+    hold a reference to the manager itself.
+    
+    Args:
+        handles: Open log files, keyed by path.
+    """
+    for handle in handles.values():
+        handle.close()
+    handles.clear()
+
+# Number of directory levels (campaign/product/aspect_ratio/concept) in the output tree
+OUTPUT_DEPTH = 4
+
+# Linux ioctl request that clones a file's extents (copy-on-write)
+FICLONE = 0x40049409
+
 class OutputManager:
     """
     Class for managing output files and directories.
@@ -25,19 +69,33 @@ class OutputManager:
     file naming conventions, saving configurations, and organizing outputs.
     """
     
-    def __init__(self, base_output_dir: Optional[str] = None):
+    def __init__(self, base_output_dir: Optional[str] = None, max_records: int = DEFAULT_MAX_RECORDS):
         """
         Initialize the OutputManager.
         
         Args:
             base_output_dir: Base directory for outputs. If not provided,
                             the current working directory will be used.
+            max_records: Maximum number of API calls and errors kept in memory.
+                        Once reached, the oldest records are dropped.
         """
         self.base_output_dir = base_output_dir or os.path.join(os.getcwd(), "output")
+        self.max_records = max_records
         
-        # Performance metrics
+        # Performance metrics. Elapsed times are measured with the monotonic
+        # perf_counter clock; the wall-clock start/end are only recorded for reference.
         self.start_time = None
         self.metrics = {}
+        self._perf_starts = {}
+        
+        # Directories already created by this manager
+        self._created_dirs = set()
+        
+        # Open log files, keyed by path, reused by repeated save_log calls.
+        # They are closed by close(), when the manager is garbage collected,
+        # or at interpreter exit, whichever comes first.
+        self._log_handles = {}
+        weakref.finalize(self, _close_log_handles, self._log_handles)
     
     def create_output_structure(
         self,
@@ -74,7 +132,7 @@ class OutputManager:
         )
         
         # Create the directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         logger.info(f"Created output directory: {output_dir}")
         
@@ -98,12 +156,11 @@ class OutputManager:
             Path to the saved configuration file.
         """
         # Create the output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         # Save the configuration
         config_path = os.path.join(output_dir, filename)
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        self._write_json_atomic(config, config_path)
         
         logger.info(f"Saved concept configuration to {config_path}")
         
@@ -113,7 +170,8 @@ class OutputManager:
         self,
         asset_path: str,
         output_dir: str,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        copy_mode: str = "auto"
     ) -> str:
         """
         Save an asset to the output directory.
@@ -123,19 +181,31 @@ class OutputManager:
             output_dir: Directory to save the asset to.
             filename: Name to use for the saved asset. If not provided,
                      the original filename will be used.
+            copy_mode: How to place the asset:
+                - "auto": Clone the file (copy-on-write) where the filesystem
+                  supports it, otherwise copy it.
+                - "link": Hard link the file, falling back to a copy. The saved
+                  asset shares its contents with the source, so it must not be
+                  modified in place.
+                - "reflink": Clone the file, falling back to a copy.
+                - "copy": Always copy the file.
         
         Returns:
             Path to the saved asset.
         
         Raises:
             FileNotFoundError: If the asset does not exist.
+            ValueError: If the copy mode is not supported.
         """
+        if copy_mode not in COPY_MODES:
+            raise ValueError(f"Unsupported copy mode: {copy_mode}. Must be one of {COPY_MODES}")
+        
         # Check if the asset exists
         if not os.path.isfile(asset_path):
             raise FileNotFoundError(f"Asset not found: {asset_path}")
         
         # Create the output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         # Determine the output filename
         if filename is None:
@@ -143,12 +213,83 @@ class OutputManager:
         
         # Save the asset
         output_path = os.path.join(output_dir, filename)
-        shutil.copy2(asset_path, output_path)
+        self._place_asset(asset_path, output_path, copy_mode)
         
         logger.info(f"Saved asset to {output_path}")
         
         return output_path
     
+    def _place_asset(self, asset_path: str, output_path: str, copy_mode: str) -> None:
+        """
+        Link, clone or copy an asset to its output path.
+        
+        The asset is placed under a temporary name and then moved over the output
+        path, so an existing output is replaced rather than written through (which
+        would modify every file hard linked to it).
+        
+        Args:
+            asset_path: Path to the asset.
+            output_path: Destination path.
+            copy_mode: One of COPY_MODES.
+        
+        Raises:
+            shutil.SameFileError: If the output path is the asset itself.
+        """
+        if os.path.exists(output_path) and os.path.samefile(asset_path, output_path):
+            # The output path is the asset itself
+            if os.path.abspath(asset_path) == os.path.abspath(output_path):
+                raise shutil.SameFileError(f"{asset_path!r} and {output_path!r} are the same file")
+            
+            # Already linked by an earlier save; other modes replace the link
+            # with an independent file below
+            if copy_mode == "link":
+                return
+        
+        tmp_path = f"{output_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            linked = False
+            if copy_mode != "copy":
+                try:
+                    if copy_mode == "link":
+                        os.link(asset_path, tmp_path)
+                    else:
+                        self._reflink(asset_path, tmp_path)
+                        shutil.copystat(asset_path, tmp_path)
+                    linked = True
+                except OSError as e:
+                    logger.debug(f"Could not {copy_mode} {asset_path}, copying instead: {e}")
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+            
+            if not linked:
+                shutil.copy2(asset_path, tmp_path)
+            
+            os.replace(tmp_path, output_path)
+        
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
+    def _reflink(self, source: str, target: str) -> None:
+        """
+        Create a copy-on-write clone of a file.
+        
+        Args:
+            source: Path to the file to clone.
+            target: Path of the clone. Must not exist.
+        
+        Raises:
+            OSError: If the platform or filesystem does not support cloning.
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("File cloning is only supported on Linux")
+        
+        import fcntl
+        
+        with open(source, "rb") as src, open(target, "xb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    
     def save_log(
         self,
         log_content: str,
@@ -158,6 +299,11 @@ class OutputManager:
         """
         Save a log file to the output directory.
         
+        The first call for a log path replaces the file; later calls from the same
+        manager append to it through a cached file handle, so incremental log
+        flushes avoid reopening the file. The content is flushed before returning,
+        so the returned file is complete.
+        
         Args:
             log_content: Content of the log.
             output_dir: Directory to save the log to.
@@ -167,17 +313,28 @@ class OutputManager:
             Path to the saved log file.
         """
         # Create the output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         # Save the log
         log_path = os.path.join(output_dir, filename)
-        with open(log_path, "w") as f:
-            f.write(log_content)
+        handle = self._log_handles.get(log_path)
+        if handle is None:
+            handle = open(log_path, "wb", buffering=LOG_BUFFER_SIZE)
+            self._log_handles[log_path] = handle
+        
+        handle.write(log_content.encode("utf-8"))
+        handle.flush()
         
         logger.info(f"Saved log to {log_path}")
         
         return log_path
     
+    def close(self) -> None:
+        """
+        Flush and close any log files opened by save_log.
+        """
+        _close_log_handles(self._log_handles)
+    
     def save_metrics(
         self,
         metrics: Dict[str, Any],
@@ -196,12 +353,11 @@ class OutputManager:
             Path to the saved metrics file.
         """
         # Create the output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         # Save the metrics
         metrics_path = os.path.join(output_dir, filename)
-        with open(metrics_path, "w") as f:
-            json.dump(metrics, f, indent=2)
+        self._write_json_atomic(metrics, metrics_path)
         
         logger.info(f"Saved metrics to {metrics_path}")
         
@@ -214,8 +370,10 @@ class OutputManager:
         Args:
             label: Label for the timing.
         """
+        now = time.perf_counter()
+        
         if label == "total" and self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = now
         
         if "timings" not in self.metrics:
             self.metrics["timings"] = {}
@@ -224,6 +382,7 @@ class OutputManager:
             self.metrics["timings"][label] = {}
         
         self.metrics["timings"][label]["start"] = time.time()
+        self._perf_starts[label] = now
     
     def end_timing(self, label: str = "total") -> float:
         """
@@ -235,11 +394,13 @@ class OutputManager:
         Returns:
             Elapsed time in seconds.
         """
+        now = time.perf_counter()
+        
         if label == "total" and self.start_time is not None:
-            elapsed = time.time() - self.start_time
+            elapsed = now - self.start_time
             self.start_time = None
-        elif "timings" in self.metrics and label in self.metrics["timings"] and "start" in self.metrics["timings"][label]:
-            elapsed = time.time() - self.metrics["timings"][label]["start"]
+        elif label in self._perf_starts:
+            elapsed = now - self._perf_starts[label]
         else:
             logger.warning(f"No timing started for {label}")
             return 0.0
@@ -276,7 +437,7 @@ class OutputManager:
             response_time: Response time in seconds.
         """
         if "api_calls" not in self.metrics:
-            self.metrics["api_calls"] = []
+            self.metrics["api_calls"] = deque(maxlen=self.max_records)
         
         self.metrics["api_calls"].append({
             "api_name": api_name,
@@ -284,7 +445,7 @@ class OutputManager:
             "status_code": status_code,
             "success": success,
             "response_time": response_time,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": time.time()
         })
     
     def record_error(
@@ -304,14 +465,14 @@ class OutputManager:
             recoverable: Whether the error is recoverable.
         """
         if "errors" not in self.metrics:
-            self.metrics["errors"] = []
+            self.metrics["errors"] = deque(maxlen=self.max_records)
         
         self.metrics["errors"].append({
             "error_type": error_type,
             "message": message,
             "component": component,
             "recoverable": recoverable,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": time.time()
         })
     
     def get_metrics(self) -> Dict[str, Any]:
@@ -319,9 +480,38 @@ class OutputManager:
         Get the current metrics.
         
         Returns:
-            Current metrics.
+            Current metrics, with recorded API calls and errors as lists and
+            their timestamps in ISO 8601 format.
+        """
+        metrics = dict(self.metrics)
+        for key in EVENT_METRICS:
+            if key in metrics:
+                # Events store epoch timestamps, formatted here rather than per record
+                metrics[key] = [
+                    {**event, "timestamp": datetime.datetime.fromtimestamp(event["timestamp"]).isoformat()}
+                    for event in metrics[key]
+                ]
+        
+        return metrics
+    
+    def flush_metrics(self, output_dir: str, filename: str = "metrics.json") -> str:
         """
-        return self.metrics
+        Save the current metrics and drop the recorded API calls and errors.
+        
+        Args:
+            output_dir: Directory to save the metrics to.
+            filename: Name of the metrics file.
+        
+        Returns:
+            Path to the saved metrics file.
+        """
+        metrics_path = self.save_metrics(self.get_metrics(), output_dir, filename)
+        
+        for key in EVENT_METRICS:
+            if key in self.metrics:
+                self.metrics[key].clear()
+        
+        return metrics_path
     
     def clear_metrics(self) -> None:
         """
@@ -329,6 +519,7 @@ class OutputManager:
         """
         self.metrics = {}
         self.start_time = None
+        self._perf_starts = {}
     
     def generate_filename(
         self,
@@ -355,13 +546,63 @@ class OutputManager:
         
         # Generate the filename
         if timestamp:
-            timestamp_str = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+            timestamp_str = self._filename_timestamp()
             filename = f"{prefix}_{timestamp_str}_{suffix}.{extension}"
         else:
             filename = f"{prefix}_{suffix}.{extension}"
         
         return filename
     
+    def _filename_timestamp(self) -> str:
+        """
+        Get the current local time formatted for filenames.
+        
+        The formatted string is reused for all calls within the same second.
+        
+        Returns:
+            Timestamp in YYYYmmddHHMMSS format.
+        """
+        second = int(time.time())
+        if second != _timestamp_cache[0]:
+            _timestamp_cache[:] = [second, time.strftime("%Y%m%d%H%M%S", time.localtime(second))]
+        
+        return _timestamp_cache[1]
+    
+    def _ensure_dir(self, directory: str) -> None:
+        """
+        Create a directory unless this manager has already created it.
+        
+        Args:
+            directory: Directory to create.
+        """
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def _write_json_atomic(self, data: Dict[str, Any], path: str) -> None:
+        """
+        Write data as JSON so that readers never see a partially written file.
+        
+        The JSON is encoded in one pass, written to a temporary file in the same
+        directory and then moved over the destination.
+        
+        Args:
+            data: Data to serialize.
+            path: Destination path.
+        """
+        content = json.dumps(data, indent=2).encode("utf-8")
+        
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with open(tmp_path, "xb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Remove the temporary file, leaving any previous file untouched
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
     def _sanitize_path_component(self, component: str) -> str:
         """
         Sanitize a path component for use in file paths.
@@ -372,16 +613,8 @@ class OutputManager:
         Returns:
             Sanitized path component.
         """
-        # Replace spaces with underscores
-        component = component.replace(" ", "_")
-        
-        # Remove special characters
-        component = "".join(c for c in component if c.isalnum() or c in "_-.")
-        
-        # Convert to lowercase
-        component = component.lower()
-        
-        return component
+        # Replace spaces with underscores, remove special characters and convert to lowercase
+        return _UNSAFE_PATH_CHARS.sub("", component.replace(" ", "_")).lower()
     
     def list_outputs(
         self,
@@ -393,6 +626,9 @@ class OutputManager:
         """
         List output directories matching the specified criteria.
         
+        Only concept directories (campaign/product/aspect_ratio/concept) are
+        returned, not the intermediate directories leading to them.
+        
         Args:
             campaign_id: ID of the campaign.
             product_name: Name of the product.
@@ -405,37 +641,45 @@ class OutputManager:
         # Start with the base output directory
         search_dir = self.base_output_dir
         
-        # Add campaign ID if specified
-        if campaign_id:
-            search_dir = os.path.join(search_dir, self._sanitize_path_component(campaign_id))
-        
-        # Add product name if specified
-        if product_name:
-            search_dir = os.path.join(search_dir, self._sanitize_path_component(product_name))
+        # Output directories sit at a fixed depth below the base directory
+        depth = OUTPUT_DEPTH
         
-        # Add aspect ratio if specified
-        if aspect_ratio:
-            search_dir = os.path.join(search_dir, self._sanitize_path_component(aspect_ratio))
-        
-        # Add concept ID if specified
-        if concept_id:
-            search_dir = os.path.join(search_dir, self._sanitize_path_component(concept_id))
+        # Add the specified criteria in directory order
+        for component in (campaign_id, product_name, aspect_ratio, concept_id):
+            if component:
+                search_dir = os.path.join(search_dir, self._sanitize_path_component(component))
+                depth -= 1
         
         # Check if the directory exists
         if not os.path.isdir(search_dir):
             return []
         
-        # List matching directories
-        if campaign_id and product_name and aspect_ratio and concept_id:
-            # If all criteria are specified, return the single directory
+        # If all criteria are specified, return the single directory
+        if depth == 0:
             return [search_dir]
-        else:
-            # Otherwise, list all subdirectories
-            result = []
-            for root, dirs, _ in os.walk(search_dir):
-                for dir_name in dirs:
-                    result.append(os.path.join(root, dir_name))
-            return result
+        
+        # Otherwise, list the concept directories below the search directory
+        return list(self._iter_output_dirs(search_dir, depth))
+    
+    def _iter_output_dirs(self, path: str, depth: int):
+        """
+        Yield the directories exactly ``depth`` levels below a path.
+        
+        Args:
+            path: Directory to search.
+            depth: Number of levels to descend.
+        
+        Yields:
+            Paths of the matching directories.
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if depth == 1:
+                    yield entry.path
+                else:
+                    yield from self._iter_output_dirs(entry.path, depth - 1)
     
     def load_concept_config(self, config_path: str) -> Dict[str, Any]:
         """
@@ -456,8 +700,8 @@ class OutputManager:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         # Load the configuration
-        with open(config_path, "r") as f:
-            config = json.load(f)
+        with open(config_path, "rb") as f:
+            config = json.loads(f.read())
         
         logger.info(f"Loaded concept configuration from {config_path}")
         
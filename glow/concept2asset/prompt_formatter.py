@@ -6,27 +6,281 @@ to achieve optimal results. It includes templates and strategies for different
 image generation models and use cases.
 """
 
+import asyncio
+import functools
 import re
-from typing import Dict, Any, List, Optional, Union
+from string import Template
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from glow.core.logging_config import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Number of prompts formatted per executor job by the async batch formatter
+BATCH_CHUNK_SIZE = 64
+
+# Prompt templates, parsed once at import time
+_DALLE_TEMPLATE = Template("""Create a professional marketing image for $product_name.
+
+Product Description: $product_description
+
+Visual Style: $visual_style
+Mood: $visual_mood
+Color Palette: $color_palette
+Target Audience: $target_audience
+Aspect Ratio: $aspect_ratio
+
+The image should:
+- Feature $product_name as the focal point
+- Evoke emotions of $target_emotions
+- Be photorealistic and high quality
+- Have space for text overlay
+- Not include any text in the image itself
+""")
+
+_DALLE_NEGATIVE_GUIDANCE = """
+
+DO NOT include:
+- Any text, watermarks, or logos
+- Blurry or distorted elements
+- Low quality or unrealistic features
+- Human faces that look unnatural or distorted
+"""
+
+# Firefly may have different optimal formatting than DALL-E
+_FIREFLY_TEMPLATE = Template("""Create a professional marketing image for $product_name.
+
+$product_description
+
+Style: $visual_style
+Mood: $visual_mood
+Colors: $color_palette
+For: $target_audience
+
+The image should evoke: $target_emotions
+The image should be high quality, photorealistic, and have space for text overlay.
+Do not include any text in the image.
+""")
+
+# Fields available to every prompt template
+_TEMPLATE_FIELDS = (
+    "product_name",
+    "product_description",
+    "visual_style",
+    "visual_mood",
+    "color_palette",
+    "target_audience",
+    "target_emotions",
+    "aspect_ratio"
+)
+
+# Compiled prompt templates by name, looked up on every render so that
+# registered overrides apply without changing any caller
+_PROMPT_TEMPLATES = {
+    "dalle": _DALLE_TEMPLATE,
+    "firefly": _FIREFLY_TEMPLATE
+}
+
+def register_prompt_template(name: str, template: str) -> None:
+    """
+    Register a prompt template, replacing any template with the same name.
+    
+    The template is compiled once here. Templates use $-placeholders and may
+    reference any of the prompt fields (e.g. $product_name, $aspect_ratio).
+    
+    Args:
+        name (str): Template name ("dalle" or "firefly" to override a built-in template)
+        template (str): Template text
+        
+    Raises:
+        ValueError: If the template references an unknown field or is malformed
+    """
+    compiled = Template(template)
+    
+    # Render once with empty fields so broken templates fail here, not per prompt
+    try:
+        compiled.substitute(dict.fromkeys(_TEMPLATE_FIELDS, ""))
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Invalid prompt template '{name}': {e!r}") from e
+    
+    _PROMPT_TEMPLATES[name] = compiled
+    logger.info("Registered prompt template: %s", name)
+
+# Quality boosters added to prompts that don't already mention them
+_QUALITY_BOOSTERS = (
+    "high quality",
+    "detailed",
+    "professional",
+    "photorealistic"
+)
+_QUALITY_BOOSTERS_LOWER = tuple(booster.lower() for booster in _QUALITY_BOOSTERS)
+
+# Default maximum prompt length in characters, safe for the image generation APIs
+DEFAULT_MAX_PROMPT_LENGTH = 3000
+
+# Documented prompt length limits, in characters, of the OpenAI image models
+MAX_PROMPT_LENGTHS = {
+    "dall-e-2": 1000,
+    "dall-e-3": 4000
+}
+
+# Composition guidance for the supported aspect ratios
+_COMPOSITION_GUIDES = {
+    "1:1": "centered composition, square format",
+    "9:16": "vertical composition, portrait format, mobile-optimized",
+    "16:9": "horizontal composition, landscape format"
+}
+
+# Common negative prompts for all product types
+_BASE_NEGATIVE_PROMPT = "blurry, distorted, low quality, unrealistic, text, watermark, signature, logo"
+
+# Complete negative prompts for product types, checked in order
+_PRODUCT_NEGATIVE_PROMPTS = (
+    (("beverage", "drink"), _BASE_NEGATIVE_PROMPT + ", spilled, messy, dirty glass, stained"),
+    (("food",), _BASE_NEGATIVE_PROMPT + ", moldy, spoiled, unappetizing"),
+    (("clothing", "apparel"), _BASE_NEGATIVE_PROMPT + ", wrinkled, stained, torn, poorly fitted")
+)
+
+# Product type keyword -> (priority, negative prompt), and one pattern that
+# finds every keyword occurrence in a single pass
+_PRODUCT_KEYWORD_PROMPTS = {
+    keyword: (priority, negative_prompt)
+    for priority, (keywords, negative_prompt) in enumerate(_PRODUCT_NEGATIVE_PROMPTS)
+    for keyword in keywords
+}
+_PRODUCT_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _PRODUCT_KEYWORD_PROMPTS)) + "))"
+)
+
+@functools.lru_cache(maxsize=2048)
+def _enhance_prompt(prompt: str, max_length: int) -> Tuple[str, bool]:
+    """
+    Add quality boosters to a prompt and cap its length.
+    
+    Args:
+        prompt (str): Original prompt
+        max_length (int): Maximum prompt length in characters
+        
+    Returns:
+        Tuple[str, bool]: Enhanced prompt and whether it had to be truncated
+    """
+    # Add quality boosters if not already present. No booster contains another,
+    # so checking the original prompt is the same as checking the growing one.
+    prompt_lower = prompt.lower()
+    missing = [
+        booster for booster, booster_lower in zip(_QUALITY_BOOSTERS, _QUALITY_BOOSTERS_LOWER)
+        if booster_lower not in prompt_lower
+    ]
+    enhanced_prompt = prompt + "".join(f", {booster}" for booster in missing)
+    
+    # Ensure the prompt doesn't get too long
+    if len(enhanced_prompt) > max_length:
+        return enhanced_prompt[:max_length], True
+    
+    return enhanced_prompt, False
+
+@functools.lru_cache(maxsize=2048)
+def _negative_prompt(product_type: str) -> str:
+    """
+    Build the negative prompt for a product type.
+    
+    Args:
+        product_type (str): Type of product
+        
+    Returns:
+        str: Negative prompt
+    """
+    # Use the product-specific negative prompt of the highest priority product type
+    matches = [_PRODUCT_KEYWORD_PROMPTS[keyword] for keyword in _PRODUCT_KEYWORDS_RE.findall(product_type.lower())]
+    if matches:
+        return min(matches)[1]
+    
+    return _BASE_NEGATIVE_PROMPT
+
+@functools.lru_cache(maxsize=64)
+def _composition_suffix(aspect_ratio: str) -> str:
+    """
+    Build the composition guidance appended to prompts for an aspect ratio.
+    
+    Args:
+        aspect_ratio (str): Aspect ratio (e.g., "1:1", "9:16", "16:9")
+        
+    Returns:
+        str: Composition guidance, including the leading separator
+    """
+    composition_guide = _COMPOSITION_GUIDES.get(aspect_ratio)
+    if composition_guide is None:
+        composition_guide = f"composition optimized for {aspect_ratio} aspect ratio"
+    
+    return ", " + composition_guide
+
+def _render_dalle_prompt(
+    product_name: str,
+    product_description: str,
+    visual_style: str,
+    visual_mood: str,
+    color_palette: Union[str, List[str]],
+    target_audience: str,
+    target_emotions: Union[str, List[str]],
+    aspect_ratio: str,
+    additional_instructions: Optional[str] = None
+) -> str:
+    """
+    Render the DALL-E 3 prompt template.
+    
+    See PromptFormatter.format_dalle_prompt for the arguments.
+    
+    Returns:
+        str: Formatted prompt for DALL-E 3
+    """
+    # Convert lists to comma-separated strings
+    if isinstance(color_palette, list):
+        color_palette = ", ".join(color_palette)
+    
+    if isinstance(target_emotions, list):
+        target_emotions = ", ".join(target_emotions)
+    
+    # Format the prompt
+    parts = [
+        _PROMPT_TEMPLATES["dalle"].substitute(
+            product_name=product_name,
+            product_description=product_description,
+            visual_style=visual_style,
+            visual_mood=visual_mood,
+            color_palette=color_palette,
+            target_audience=target_audience,
+            aspect_ratio=aspect_ratio,
+            target_emotions=target_emotions
+        )
+    ]
+    
+    # Add additional instructions if provided
+    if additional_instructions:
+        parts.append(f"\nAdditional Instructions: {additional_instructions}")
+    
+    # Add negative prompt guidance
+    parts.append(_DALLE_NEGATIVE_GUIDANCE)
+    return "".join(parts)
+
 class PromptFormatter:
     """
     Formats prompts for image generation services.
+    
+    The formatter holds no state, so its formatting methods are static and
+    can also be called on the class itself.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Initialize the prompt formatter.
         """
         logger.info("Initialized PromptFormatter")
     
+    @staticmethod
     def format_dalle_prompt(
-        self,
         product_name: str,
         product_description: str,
         visual_style: str,
@@ -54,51 +308,73 @@ class PromptFormatter:
         Returns:
             str: Formatted prompt for DALL-E 3
         """
-        # Convert lists to comma-separated strings
-        if isinstance(color_palette, list):
-            color_palette = ", ".join(color_palette)
+        prompt = _render_dalle_prompt(
+            product_name,
+            product_description,
+            visual_style,
+            visual_mood,
+            color_palette,
+            target_audience,
+            target_emotions,
+            aspect_ratio,
+            additional_instructions
+        )
         
-        if isinstance(target_emotions, list):
-            target_emotions = ", ".join(target_emotions)
+        logger.info("Formatted DALL-E prompt: %.100s...", prompt)
+        return prompt
+    
+    @staticmethod
+    def format_dalle_prompts_batch(items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Format DALL-E 3 prompts for many products in one call.
         
-        # Format the prompt
-        prompt = f"""Create a professional marketing image for {product_name}.
-
-Product Description: {product_description}
-
-Visual Style: {visual_style}
-Mood: {visual_mood}
-Color Palette: {color_palette}
-Target Audience: {target_audience}
-Aspect Ratio: {aspect_ratio}
-
-The image should:
-- Feature {product_name} as the focal point
-- Evoke emotions of {target_emotions}
-- Be photorealistic and high quality
-- Have space for text overlay
-- Not include any text in the image itself
-"""
+        Args:
+            items (List[Dict[str, Any]]): Keyword arguments for format_dalle_prompt,
+                one dictionary per prompt
+            
+        Returns:
+            List[str]: Formatted prompts, in the same order as items
+        """
+        render = _render_dalle_prompt
+        prompts = []
+        append = prompts.append
+        for item in items:
+            append(render(**item))
         
-        # Add additional instructions if provided
-        if additional_instructions:
-            prompt += f"\nAdditional Instructions: {additional_instructions}"
+        logger.info("Formatted %d DALL-E prompts", len(prompts))
+        return prompts
+    
+    @staticmethod
+    async def format_dalle_prompts_batch_async(
+        items: List[Dict[str, Any]],
+        chunk_size: int = BATCH_CHUNK_SIZE
+    ) -> List[str]:
+        """
+        Format DALL-E 3 prompts for many products without blocking the event loop.
         
-        # Add negative prompt guidance
-        prompt += """
-
-DO NOT include:
-- Any text, watermarks, or logos
-- Blurry or distorted elements
-- Low quality or unrealistic features
-- Human faces that look unnatural or distorted
-"""
+        Prompts are formatted in chunks in the event loop's default executor, so
+        other tasks keep running between chunks. The formatted prompts can then be
+        sent to the image API with glow.core.utils.bounded_gather.
         
-        logger.info(f"Formatted DALL-E prompt: {prompt[:100]}...")
-        return prompt
+        Args:
+            items (List[Dict[str, Any]]): Keyword arguments for format_dalle_prompt,
+                one dictionary per prompt
+            chunk_size (int): Number of prompts formatted per executor job
+            
+        Returns:
+            List[str]: Formatted prompts, in the same order as items
+        """
+        loop = asyncio.get_running_loop()
+        prompts = []
+        for start in range(0, len(items), chunk_size):
+            prompts.extend(await loop.run_in_executor(
+                None, PromptFormatter.format_dalle_prompts_batch, items[start:start + chunk_size]
+            ))
+        
+        return prompts
     
+    @staticmethod
     def format_firefly_prompt(
-        self,
         product_name: str,
         product_description: str,
         visual_style: str,
@@ -133,61 +409,51 @@ DO NOT include:
         if isinstance(target_emotions, list):
             target_emotions = ", ".join(target_emotions)
         
-        # Format the prompt (Firefly may have different optimal formatting than DALL-E)
-        prompt = f"""Create a professional marketing image for {product_name}.
-
-{product_description}
-
-Style: {visual_style}
-Mood: {visual_mood}
-Colors: {color_palette}
-For: {target_audience}
-
-The image should evoke: {target_emotions}
-The image should be high quality, photorealistic, and have space for text overlay.
-Do not include any text in the image.
-"""
+        # Format the prompt
+        prompt = _PROMPT_TEMPLATES["firefly"].substitute(
+            product_name=product_name,
+            product_description=product_description,
+            visual_style=visual_style,
+            visual_mood=visual_mood,
+            color_palette=color_palette,
+            target_audience=target_audience,
+            target_emotions=target_emotions,
+            aspect_ratio=aspect_ratio
+        )
         
         # Add additional instructions if provided
         if additional_instructions:
-            prompt += f"\n{additional_instructions}"
+            prompt = f"{prompt}\n{additional_instructions}"
         
-        logger.info(f"Formatted Firefly prompt: {prompt[:100]}...")
+        logger.info("Formatted Firefly prompt: %.100s...", prompt)
         return prompt
     
-    def enhance_prompt(self, prompt: str) -> str:
+    @staticmethod
+    def enhance_prompt(prompt: str, max_length: int = DEFAULT_MAX_PROMPT_LENGTH) -> str:
         """
         Enhance a prompt with best practices for better results.
         
+        Prompts longer than ``max_length`` characters are truncated so the API
+        doesn't reject them. Pass a value from MAX_PROMPT_LENGTHS to use the full
+        limit of a specific model.
+        
         Args:
             prompt (str): Original prompt
+            max_length (int): Maximum prompt length in characters
             
         Returns:
             str: Enhanced prompt
         """
-        # Add quality boosters if not already present
-        quality_boosters = [
-            "high quality",
-            "detailed",
-            "professional",
-            "photorealistic"
-        ]
-        
-        enhanced_prompt = prompt
+        enhanced_prompt, truncated = _enhance_prompt(prompt, max_length)
         
-        for booster in quality_boosters:
-            if booster.lower() not in enhanced_prompt.lower():
-                enhanced_prompt += f", {booster}"
-        
-        # Ensure the prompt doesn't get too long (DALL-E has limits)
-        if len(enhanced_prompt) > 3000:
+        if truncated:
             logger.warning("Prompt is very long, may be truncated by the API")
-            enhanced_prompt = enhanced_prompt[:3000]
         
-        logger.info(f"Enhanced prompt: {enhanced_prompt[:100]}...")
+        logger.info("Enhanced prompt: %.100s...", enhanced_prompt)
         return enhanced_prompt
     
-    def format_negative_prompt(self, product_type: str) -> str:
+    @staticmethod
+    def format_negative_prompt(product_type: str) -> str:
         """
         Generate a negative prompt for better results.
         
@@ -197,21 +463,13 @@ Do not include any text in the image.
         Returns:
             str: Negative prompt
         """
-        # Common negative prompts for all product types
-        negative_prompt = "blurry, distorted, low quality, unrealistic, text, watermark, signature, logo"
-        
-        # Add product-specific negative prompts
-        if "beverage" in product_type.lower() or "drink" in product_type.lower():
-            negative_prompt += ", spilled, messy, dirty glass, stained"
-        elif "food" in product_type.lower():
-            negative_prompt += ", moldy, spoiled, unappetizing"
-        elif "clothing" in product_type.lower() or "apparel" in product_type.lower():
-            negative_prompt += ", wrinkled, stained, torn, poorly fitted"
+        negative_prompt = _negative_prompt(product_type)
         
-        logger.info(f"Generated negative prompt: {negative_prompt}")
+        logger.info("Generated negative prompt: %s", negative_prompt)
         return negative_prompt
     
-    def optimize_for_aspect_ratio(self, prompt: str, aspect_ratio: str) -> str:
+    @staticmethod
+    def optimize_for_aspect_ratio(prompt: str, aspect_ratio: str) -> str:
         """
         Optimize a prompt for a specific aspect ratio.
         
@@ -222,18 +480,26 @@ Do not include any text in the image.
         Returns:
             str: Optimized prompt
         """
-        # Add composition guidance based on aspect ratio
-        if aspect_ratio == "1:1":
-            composition_guide = "centered composition, square format"
-        elif aspect_ratio == "9:16":
-            composition_guide = "vertical composition, portrait format, mobile-optimized"
-        elif aspect_ratio == "16:9":
-            composition_guide = "horizontal composition, landscape format"
-        else:
-            composition_guide = f"composition optimized for {aspect_ratio} aspect ratio"
-        
-        # Add the composition guide to the prompt
-        optimized_prompt = f"{prompt}, {composition_guide}"
-        
-        logger.info(f"Optimized prompt for {aspect_ratio}: {optimized_prompt[:100]}...")
-        return optimized_prompt
\ No newline at end of file
+        # Add the composition guide for the aspect ratio to the prompt
+        optimized_prompt = prompt + _composition_suffix(aspect_ratio)
+        
+        logger.info("Optimized prompt for %s: %.100s...", aspect_ratio, optimized_prompt)
+        return optimized_prompt
+    
+    @staticmethod
+    def optimize_for_aspect_ratio_batch(prompts: List[str], aspect_ratio: str) -> List[str]:
+        """
+        Optimize many prompts for the same aspect ratio.
+        
+        Args:
+            prompts (List[str]): Original prompts
+            aspect_ratio (str): Aspect ratio (e.g., "1:1", "9:16", "16:9")
+            
+        Returns:
+            List[str]: Optimized prompts, in the same order as prompts
+        """
+        suffix = _composition_suffix(aspect_ratio)
+        optimized_prompts = [prompt + suffix for prompt in prompts]
+        
+        logger.info("Optimized %d prompts for %s", len(optimized_prompts), aspect_ratio)
+        return optimized_prompts
\ No newline at end of file
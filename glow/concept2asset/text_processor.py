@@ -22,36 +22,197 @@ essential fonts needed for the application to function properly.
 """
 
 import os
+import re
+import sys
+import bisect
+import functools
 import json
 import random
-from typing import Dict, Any, List, Optional, Union, Tuple
-import colorsys
+from typing import Dict, Any, List, NamedTuple, Optional, Union, Tuple
+import numpy as np
 
 from glow.core.logging_config import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Font categories with simplified options (one primary font per category)
+# Font categories with simplified options (one primary font per category).
+# Category and font names are interned, since they are compared and copied
+# into every style.
 FONT_CATEGORIES = {
-    "serif": ["PlayfairDisplay-Regular"],
-    "sans-serif": ["Montserrat", "OpenSans-Regular", "Roboto-Regular"],
-    "display": ["Anton-Regular"],
-    "script": ["DancingScript-Regular"],
-    "monospace": ["RobotoMono-Regular"]
+    sys.intern(category): tuple(sys.intern(font) for font in fonts)
+    for category, fonts in (
+        ("serif", ("PlayfairDisplay-Regular",)),
+        ("sans-serif", ("Montserrat", "OpenSans-Regular", "Roboto-Regular")),
+        ("display", ("Anton-Regular",)),
+        ("script", ("DancingScript-Regular",)),
+        ("monospace", ("RobotoMono-Regular",))
+    )
 }
 
+# Font categories whose fonts get a weight suffix
+_WEIGHTED_CATEGORIES = frozenset({"sans-serif", "serif"})
+
+# All category fonts and category names, flattened once at import time
+_DEFAULT_FONTS = tuple(font for fonts in FONT_CATEGORIES.values() for font in fonts)
+_FONT_CATEGORY_KEYS = tuple(FONT_CATEGORIES.keys())
+
 # Font weights
-FONT_WEIGHTS = ["Regular", "Bold", "Light", "Medium", "Black", "Thin"]
+FONT_WEIGHTS = ("Regular", "Bold", "Light", "Medium", "Black", "Thin")
+
+# Creative direction keywords that select a font category, in priority order.
+# Keywords match anywhere in the direction (e.g. "minimalist" matches "minimal").
+_FONT_KEYWORD_GROUPS = (
+    ("sans-serif", ("modern", "clean", "minimal")),
+    ("serif", ("elegant", "luxury", "premium")),
+    ("display", ("bold", "strong", "impact")),
+    ("script", ("playful", "fun", "creative")),
+    ("monospace", ("tech", "code", "digital"))
+)
+
+# Keyword -> (priority, category), and one pattern that finds every keyword
+# occurrence in a single pass (the lookahead also reports overlapping matches)
+_FONT_KEYWORD_CATEGORIES = {
+    keyword: (priority, category)
+    for priority, (category, keywords) in enumerate(_FONT_KEYWORD_GROUPS)
+    for keyword in keywords
+}
+_FONT_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _FONT_KEYWORD_CATEGORIES)) + "))"
+)
+
+# Creative direction keywords that select a text color, in priority order:
+# light text for dark backgrounds, dark text for light backgrounds
+_COLOR_KEYWORD_GROUPS = (
+    ("#FFFFFF", ("dark", "night")),
+    ("#000000", ("light", "bright"))
+)
+
+# Keyword -> (priority, color), scanned in a single pass like the font keywords
+_COLOR_KEYWORD_COLORS = {
+    keyword: (priority, color)
+    for priority, (color, keywords) in enumerate(_COLOR_KEYWORD_GROUPS)
+    for keyword in keywords
+}
+_COLOR_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _COLOR_KEYWORD_COLORS)) + "))"
+)
+
+# Image heights in pixels for the supported aspect ratios
+# (1:1 is 1024x1024, 16:9 is 1792x1024, 9:16 is 1024x1792)
+_IMAGE_HEIGHTS = {
+    "1:1": 1024,
+    "16:9": 1024,
+    "9:16": 1792
+}
+
+# Base font sizes (10% of image height), defaulting to a 1024x1024 image
+_BASE_FONT_SIZES = {aspect_ratio: height // 10 for aspect_ratio, height in _IMAGE_HEIGHTS.items()}
+_DEFAULT_BASE_FONT_SIZE = 1024 // 10
+
+# Font size factors (in tenths) for primary texts up to 15, 30 and 50
+# characters, and for longer texts
+_LENGTH_BREAKS = (15, 30, 50)
+_LENGTH_SIZE_FACTORS_X10 = (10, 9, 8, 7)
+
+# Shadow colors for white text and for other text colors
+_WHITE_COLORS = frozenset({"#ffffff", "#fff"})
+_SHADOW_LIGHT = "#00000080"  # Black with 50% opacity
+_SHADOW_DARK = "#00000040"  # Black with 25% opacity
 
 # Text positions
 TEXT_POSITIONS = ["top", "bottom", "center", "top_left", "top_right", "bottom_left", "bottom_right"]
 
+class _TextContext(NamedTuple):
+    """
+    Values derived once from a concept configuration for text styling.
+    """
+    concept_section: Dict[str, Any]
+    creative_direction: str
+    aspect_ratio: str
+    primary_text_length: int
+    reference_image: bool
+
+def _derive_text_context(concept_config: Dict[str, Any]) -> _TextContext:
+    """
+    Derive the values used by the font, color and size selectors.
+    
+    Args:
+        concept_config (Dict[str, Any]): Concept configuration
+        
+    Returns:
+        _TextContext: Derived values
+    """
+    # Support both new "generated_concept" and legacy "llm_processing" for backward compatibility
+    if "generated_concept" in concept_config:
+        concept_section = concept_config.get("generated_concept", {})
+    else:
+        concept_section = concept_config.get("llm_processing", {})
+    
+    text_config = concept_section.get("text_overlay_config", {})
+    parameters = concept_config.get("image_generation", {}).get("parameters", {})
+    
+    return _TextContext(
+        concept_section=concept_section,
+        creative_direction=concept_section.get("creative_direction", "").lower(),
+        aspect_ratio=concept_config.get("aspect_ratio", "1:1"),
+        primary_text_length=len(text_config.get("primary_text", "")),
+        reference_image=bool(parameters.get("reference_image"))
+    )
+
+@functools.lru_cache(maxsize=128)
+def _shadow_for(text_color: str) -> str:
+    """
+    Get the shadow color for a text color.
+    
+    Args:
+        text_color (str): Text color (hex code, optionally with alpha)
+        
+    Returns:
+        str: Shadow color (hex code with alpha)
+    """
+    # If text color is white, use a stronger shadow
+    if text_color[:7].casefold() in _WHITE_COLORS:
+        return _SHADOW_LIGHT
+    else:
+        return _SHADOW_DARK
+
+def _hls_to_rgb(hue: np.ndarray, lightness: np.ndarray, saturation: np.ndarray) -> np.ndarray:
+    """
+    Convert HLS colors to RGB, vectorized over arrays of colors.
+    
+    Uses the same formulas as colorsys.hls_to_rgb.
+    
+    Args:
+        hue (np.ndarray): Hues in [0, 1)
+        lightness (np.ndarray): Lightness values in [0, 1]
+        saturation (np.ndarray): Saturation values in [0, 1]
+        
+    Returns:
+        np.ndarray: Array of shape (n, 3) with RGB components in [0, 1]
+    """
+    m2 = np.where(lightness <= 0.5, lightness * (1.0 + saturation), lightness + saturation - lightness * saturation)
+    m1 = 2.0 * lightness - m2
+    
+    channels = []
+    for offset in (1.0 / 3.0, 0.0, -1.0 / 3.0):
+        h = (hue + offset) % 1.0
+        channel = np.select(
+            [h < 1.0 / 6.0, h < 0.5, h < 2.0 / 3.0],
+            [m1 + (m2 - m1) * h * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - h) * 6.0],
+            default=m1
+        )
+        channels.append(np.where(saturation == 0.0, lightness, channel))
+    
+    return np.stack(channels, axis=-1)
+
 class TextProcessor:
     """
     Processes text styling configurations.
     """
     
+    __slots__ = ("available_fonts", "_rng")
+    
     def __init__(self, available_fonts: Optional[List[str]] = None):
         """
         Initialize the text processor.
@@ -60,6 +221,9 @@ class TextProcessor:
             available_fonts (List[str], optional): List of available fonts
         """
         self.available_fonts = available_fonts or self._get_default_fonts()
+        
+        # Private random generator, so selections don't contend on the global one
+        self._rng = random.Random()
         logger.info(f"Initialized TextProcessor with {len(self.available_fonts)} available fonts")
     
     def process_text(self, concept_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -75,7 +239,7 @@ class TextProcessor:
         Raises:
             ValueError: If the concept configuration is invalid
         """
-        logger.info(f"Processing text for concept: {concept_config.get('concept', 'unknown')}")
+        logger.info("Processing text for concept: %s", concept_config.get("concept", "unknown"))
         
         # Extract text overlay configuration
         # Support both new "generated_concept" and legacy "llm_processing" for backward compatibility
@@ -96,45 +260,65 @@ class TextProcessor:
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        text_config = concept_section["text_overlay_config"].copy()
+        source_config = concept_section["text_overlay_config"]
         
-        # Ensure required fields are present
-        if "primary_text" not in text_config:
+        # Ensure required fields are present before copying anything
+        if "primary_text" not in source_config:
             error_msg = "No primary_text in text_overlay_config"
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Set default values if not provided
-        if "text_position" not in text_config:
-            text_config["text_position"] = "bottom"
+        text_config = dict(source_config)
+        
+        # Set default values if not provided. Derived defaults are only computed
+        # for keys that are actually missing.
+        text_config.setdefault("text_position", "bottom")
+        
+        # Derive the values shared by the selectors once
+        context = _derive_text_context(concept_config)
         
         if "font" not in text_config:
-            text_config["font"] = self._select_font(concept_config)
+            text_config["font"] = self._select_font(context)
         
         if "color" not in text_config:
-            text_config["color"] = self._select_color(concept_config)
+            text_config["color"] = self._select_color(context)
         
-        if "shadow" not in text_config:
-            text_config["shadow"] = True
+        text_config.setdefault("shadow", True)
         
         if "shadow_color" not in text_config:
             text_config["shadow_color"] = self._get_shadow_color(text_config["color"])
         
         # Add font size if not provided
         if "font_size" not in text_config:
-            text_config["font_size"] = self._calculate_font_size(concept_config)
+            text_config["font_size"] = self._calculate_font_size(context)
         
         # Add padding if not provided
-        if "padding" not in text_config:
-            text_config["padding"] = 20
+        text_config.setdefault("padding", 20)
         
-        logger.info(f"Processed text configuration: {text_config}")
+        logger.info("Processed text configuration: %s", text_config)
         return text_config
     
+    def process_text_batch(self, concept_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process text styling configurations for several concepts.
+        
+        Args:
+            concept_configs (List[Dict[str, Any]]): Concept configurations
+            
+        Returns:
+            List[Dict[str, Any]]: Text styling configurations, in the same order
+            
+        Raises:
+            ValueError: If any concept configuration is invalid
+        """
+        process = self.process_text
+        return [process(concept_config) for concept_config in concept_configs]
+    
     def generate_text_styles(
         self,
         campaign_brief: Dict[str, Any],
-        num_styles: int = 3
+        num_styles: int = 3,
+        rng: Optional[random.Random] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate multiple text styling options based on a campaign brief.
@@ -142,66 +326,76 @@ class TextProcessor:
         Args:
             campaign_brief (Dict[str, Any]): Campaign brief
             num_styles (int): Number of styles to generate
+            rng (random.Random, optional): Random generator to use. Pass a seeded
+                generator for reproducible styles.
             
         Returns:
             List[Dict[str, Any]]: List of text styling configurations
         """
-        logger.info(f"Generating {num_styles} text styles for campaign: {campaign_brief.get('campaign_id', 'unknown')}")
+        logger.info("Generating %d text styles for campaign: %s", num_styles, campaign_brief.get("campaign_id", "unknown"))
         
         styles = []
         
         # Extract visual direction from campaign brief
         visual_direction = campaign_brief.get("visual_direction", {})
         color_palette = visual_direction.get("color_palette", [])
+        style_direction = visual_direction.get("style", "").lower()
+        
+        rng = rng or self._rng
+        
+        # Draw the random values for all styles at once
+        np_rng = np.random.default_rng(rng.getrandbits(64))
+        num_random_colors = max(num_styles - len(color_palette), 0)
+        hues = np_rng.random(num_random_colors)
+        saturations = np_rng.uniform(0.5, 1.0, num_random_colors)
+        lightnesses = np_rng.uniform(0.7, 0.9, num_random_colors)  # Lighter colors for better readability
+        rgb = (_hls_to_rgb(hues, lightnesses, saturations) * 255).astype(np.uint8)
+        random_colors = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist()]
+        
+        positions = np_rng.integers(0, len(TEXT_POSITIONS), num_styles).tolist()
+        font_sizes = np_rng.integers(90, 121, num_styles).tolist()  # Range around our new 10% size
+        paddings = np_rng.integers(30, 61, num_styles).tolist()  # Increased padding for better spacing with larger text
         
         # Generate styles
         for i in range(num_styles):
             # Select a font category based on the style
-            if "modern" in visual_direction.get("style", "").lower():
-                font_category = random.choice(["sans-serif", "display"])
-            elif "elegant" in visual_direction.get("style", "").lower():
-                font_category = random.choice(["serif", "script"])
-            elif "tech" in visual_direction.get("style", "").lower():
-                font_category = random.choice(["sans-serif", "monospace"])
+            if "modern" in style_direction:
+                font_category = rng.choice(["sans-serif", "display"])
+            elif "elegant" in style_direction:
+                font_category = rng.choice(["serif", "script"])
+            elif "tech" in style_direction:
+                font_category = rng.choice(["sans-serif", "monospace"])
             else:
-                font_category = random.choice(list(FONT_CATEGORIES.keys()))
+                font_category = rng.choice(_FONT_CATEGORY_KEYS)
             
             # Select a font from the category
-            font = random.choice(FONT_CATEGORIES[font_category])
+            font = rng.choice(FONT_CATEGORIES[font_category])
             
             # Add a weight if it's a sans-serif or serif font
-            if font_category in ["sans-serif", "serif"]:
-                font_weight = random.choice(FONT_WEIGHTS)
+            if font_category in _WEIGHTED_CATEGORIES:
+                font_weight = rng.choice(FONT_WEIGHTS)
                 font = f"{font} {font_weight}"
             
-            # Select a color from the palette or generate a contrasting color
-            if color_palette and i < len(color_palette):
+            # Select a color from the palette or use a generated light color
+            if i < len(color_palette):
                 color = color_palette[i]
             else:
-                # Generate a random color
-                hue = random.random()
-                saturation = random.uniform(0.5, 1.0)
-                lightness = random.uniform(0.7, 0.9)  # Lighter colors for better readability
-                r, g, b = colorsys.hls_to_rgb(hue, lightness, saturation)
-                color = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-            
-            # Select a position
-            position = random.choice(TEXT_POSITIONS)
+                color = random_colors[i - len(color_palette)]
             
             # Create the style
             style = {
                 "font": font,
                 "color": color,
-                "text_position": position,
+                "text_position": TEXT_POSITIONS[positions[i]],
                 "shadow": True,
                 "shadow_color": self._get_shadow_color(color),
-                "font_size": random.randint(90, 120),  # Range around our new 10% size
-                "padding": random.randint(30, 60)  # Increased padding for better spacing with larger text
+                "font_size": font_sizes[i],
+                "padding": paddings[i]
             }
             
             styles.append(style)
         
-        logger.info(f"Generated {len(styles)} text styles")
+        logger.info("Generated %d text styles", len(styles))
         return styles
     
     def _get_default_fonts(self) -> List[str]:
@@ -211,14 +405,29 @@ class TextProcessor:
         Returns:
             List[str]: List of default fonts
         """
-        # Flatten the font categories
-        fonts = []
-        for category, category_fonts in FONT_CATEGORIES.items():
-            fonts.extend(category_fonts)
+        return list(_DEFAULT_FONTS)
+    
+    def _text_context(self, concept_config: Union[Dict[str, Any], _TextContext]) -> _TextContext:
+        """
+        Get the derived text styling values for a concept configuration.
+        
+        Args:
+            concept_config (Dict[str, Any] or _TextContext): Concept configuration,
+                or the values already derived from it
+            
+        Returns:
+            _TextContext: Derived values
+        """
+        if isinstance(concept_config, _TextContext):
+            return concept_config
         
-        return fonts
+        return _derive_text_context(concept_config)
     
-    def _select_font(self, concept_config: Dict[str, Any]) -> str:
+    def _select_font(
+        self,
+        concept_config: Union[Dict[str, Any], _TextContext],
+        rng: Optional[random.Random] = None
+    ) -> str:
         """
         Select a font based on the concept configuration.
         
@@ -233,53 +442,43 @@ class TextProcessor:
         4. Using the Pillow default font as a last resort
         
         Args:
-            concept_config (Dict[str, Any]): Concept configuration
+            concept_config (Dict[str, Any] or _TextContext): Concept configuration,
+                or the values already derived from it
+            rng (random.Random, optional): Random generator to use
             
         Returns:
             str: Selected font
         """
-        # Extract creative direction
-        # Support both new "generated_concept" and legacy "llm_processing" for backward compatibility
-        if "generated_concept" in concept_config:
-            concept_section = concept_config.get("generated_concept", {})
-        else:
-            concept_section = concept_config.get("llm_processing", {})
-            
-        creative_direction = concept_section.get("creative_direction", "").lower()
+        context = self._text_context(concept_config)
+        creative_direction = context.creative_direction
         
-        # Select a font category based on the creative direction
-        if any(keyword in creative_direction for keyword in ["modern", "clean", "minimal"]):
-            font_category = "sans-serif"
-        elif any(keyword in creative_direction for keyword in ["elegant", "luxury", "premium"]):
-            font_category = "serif"
-        elif any(keyword in creative_direction for keyword in ["bold", "strong", "impact"]):
-            font_category = "display"
-        elif any(keyword in creative_direction for keyword in ["playful", "fun", "creative"]):
-            font_category = "script"
-        elif any(keyword in creative_direction for keyword in ["tech", "code", "digital"]):
-            font_category = "monospace"
+        # Select the highest priority font category mentioned in the creative direction
+        matches = [_FONT_KEYWORD_CATEGORIES[keyword] for keyword in _FONT_KEYWORDS_RE.findall(creative_direction)]
+        if matches:
+            font_category = min(matches)[1]
         else:
             # Default to sans-serif
             font_category = "sans-serif"
         
         # Select a font from the category
         fonts = FONT_CATEGORIES.get(font_category, FONT_CATEGORIES["sans-serif"])
-        font = random.choice(fonts)
+        font = (rng or self._rng).choice(fonts)
         
         # Add a weight if it's a sans-serif or serif font
-        if font_category in ["sans-serif", "serif"]:
+        if font_category in _WEIGHTED_CATEGORIES:
             font_weight = "Bold" if "bold" in creative_direction else "Regular"
             font = f"{font} {font_weight}"
         
-        logger.info(f"Selected font: {font} from category: {font_category}")
+        logger.info("Selected font: %s from category: %s", font, font_category)
         return font
     
-    def _select_color(self, concept_config: Dict[str, Any]) -> str:
+    def _select_color(self, concept_config: Union[Dict[str, Any], _TextContext]) -> str:
         """
         Select a color based on the concept configuration.
         
         Args:
-            concept_config (Dict[str, Any]): Concept configuration
+            concept_config (Dict[str, Any] or _TextContext): Concept configuration,
+                or the values already derived from it
             
         Returns:
             str: Selected color (hex code)
@@ -287,33 +486,21 @@ class TextProcessor:
         # Default to white
         default_color = "#FFFFFF"
         
-        # Extract color palette from image generation parameters
-        image_generation = concept_config.get("image_generation", {})
-        parameters = image_generation.get("parameters", {})
+        context = self._text_context(concept_config)
         
         # If there's a reference image, use white for better contrast
-        if parameters.get("reference_image"):
+        if context.reference_image:
             return default_color
         
-        # Extract creative direction
-        # Support both new "generated_concept" and legacy "llm_processing" for backward compatibility
-        if "generated_concept" in concept_config:
-            concept_section = concept_config.get("generated_concept", {})
-        else:
-            concept_section = concept_config.get("llm_processing", {})
-            
-        creative_direction = concept_section.get("creative_direction", "").lower()
-        
-        # Select a color based on the creative direction
-        if "dark" in creative_direction or "night" in creative_direction:
-            # Light color for dark backgrounds
-            return "#FFFFFF"
-        elif "light" in creative_direction or "bright" in creative_direction:
-            # Dark color for light backgrounds
-            return "#000000"
-        else:
-            # Default to white
-            return default_color
+        creative_direction = context.creative_direction
+        
+        # Select the highest priority color mentioned in the creative direction
+        matches = [_COLOR_KEYWORD_COLORS[keyword] for keyword in _COLOR_KEYWORDS_RE.findall(creative_direction)]
+        if matches:
+            return min(matches)[1]
+        
+        # Default to white
+        return default_color
     
     def _get_shadow_color(self, text_color: str) -> str:
         """
@@ -325,65 +512,28 @@ class TextProcessor:
         Returns:
             str: Shadow color (hex code with alpha)
         """
-        # If text color is light, use a dark shadow
-        if text_color.lower() in ["#ffffff", "#fff"]:
-            return "#00000080"  # Black with 50% opacity
-        else:
-            return "#00000040"  # Black with 25% opacity
+        return _shadow_for(text_color)
     
-    def _calculate_font_size(self, concept_config: Dict[str, Any]) -> int:
+    def _calculate_font_size(self, concept_config: Union[Dict[str, Any], _TextContext]) -> int:
         """
         Calculate an appropriate font size based on the concept configuration.
         
         Args:
-            concept_config (Dict[str, Any]): Concept configuration
+            concept_config (Dict[str, Any] or _TextContext): Concept configuration,
+                or the values already derived from it
             
         Returns:
             int: Font size in pixels
         """
-        # Extract aspect ratio
-        aspect_ratio = concept_config.get("aspect_ratio", "1:1")
+        context = self._text_context(concept_config)
+        aspect_ratio = context.aspect_ratio
+        text_length = context.primary_text_length
         
-        # Extract text length
-        # Support both new "generated_concept" and legacy "llm_processing" for backward compatibility
-        if "generated_concept" in concept_config:
-            concept_section = concept_config.get("generated_concept", {})
-        else:
-            concept_section = concept_config.get("llm_processing", {})
-            
-        text_config = concept_section.get("text_overlay_config", {})
-        primary_text = text_config.get("primary_text", "")
-        text_length = len(primary_text)
-        
-        # Calculate base font size based on image dimensions
-        # Using 10% of image height as requested
-        if aspect_ratio == "1:1":
-            # 1:1 aspect ratio uses 1024x1024 pixels
-            image_height = 1024
-            base_size = int(image_height * 0.10)  # 10% of image height = ~102
-        elif aspect_ratio == "16:9":
-            # 16:9 aspect ratio uses 1792x1024 pixels
-            image_height = 1024
-            base_size = int(image_height * 0.10)  # 10% of image height = ~102
-        elif aspect_ratio == "9:16":
-            # 9:16 aspect ratio uses 1024x1792 pixels
-            image_height = 1792
-            base_size = int(image_height * 0.10)  # 10% of image height = ~179
-        else:
-            # Default to 1024x1024
-            image_height = 1024
-            base_size = int(image_height * 0.10)  # 10% of image height = ~102
+        # Base font size is 10% of the image height
+        base_size = _BASE_FONT_SIZES.get(aspect_ratio, _DEFAULT_BASE_FONT_SIZE)
         
         # Adjust for text length
-        if text_length > 50:
-            size_factor = 0.7
-        elif text_length > 30:
-            size_factor = 0.8
-        elif text_length > 15:
-            size_factor = 0.9
-        else:
-            size_factor = 1.0
-        
-        font_size = int(base_size * size_factor)
-        logger.info(f"Calculated font size: {font_size}px for text length: {text_length}")
+        factor_x10 = _LENGTH_SIZE_FACTORS_X10[bisect.bisect_left(_LENGTH_BREAKS, text_length)]
+        font_size = base_size * factor_x10 // 10
+        logger.info("Calculated font size: %dpx for text length: %d", font_size, text_length)
         return font_size
\ No newline at end of file
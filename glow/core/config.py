@@ -17,8 +17,10 @@ Configuration overrides allow customization at different levels:
 
 import os
 import json
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 import logging
 
 # Default configuration paths
@@ -28,15 +30,35 @@ USER_CONFIG_PATH = os.path.expanduser("~/.glow/config.json")
 # Configuration singleton
 _config_cache = {}
 
-def get_config(reload: bool = False) -> Dict[str, Any]:
+# Contents of the default configuration file, keyed by its path, modification
+# time and size so the file is only re-read when it changes
+_default_config_source = (None, b"{}")
+
+def get_config(reload: bool = False) -> Mapping[str, Any]:
     """
     Get the configuration dictionary, loading it if necessary.
     
+    The configuration is returned as a read-only view of the cached
+    configuration, so it can be shared without copying. Use set_config_value()
+    to change values.
+    
     Args:
         reload (bool): Force reload the configuration even if cached
         
     Returns:
-        Dict[str, Any]: The configuration dictionary
+        Mapping[str, Any]: Read-only view of the configuration dictionary
+    """
+    return MappingProxyType(_get_config_cache(reload))
+
+def _get_config_cache(reload: bool = False) -> Dict[str, Any]:
+    """
+    Get the mutable cached configuration, loading it if necessary.
+    
+    Args:
+        reload (bool): Force reload the configuration even if cached
+        
+    Returns:
+        Dict[str, Any]: The cached configuration dictionary
     """
     global _config_cache
     
@@ -70,26 +92,51 @@ def load_config() -> Dict[str, Any]:
         Dict[str, Any]: The merged configuration dictionary
     """
     # Start with default configuration
-    config = {}
-    
-    # Load default configuration if it exists
-    if os.path.exists(DEFAULT_CONFIG_PATH):
-        with open(DEFAULT_CONFIG_PATH, 'r') as f:
-            config.update(json.load(f))
+    config = _read_default_config()
     
     # Override with user configuration if it exists
-    if os.path.exists(USER_CONFIG_PATH):
-        with open(USER_CONFIG_PATH, 'r') as f:
-            user_config = json.load(f)
-            
-            # Deep merge the configurations
-            deep_merge(config, user_config)
+    try:
+        with open(USER_CONFIG_PATH, 'rb') as f:
+            user_config_data = f.read()
+    except FileNotFoundError:
+        return config
+    
+    # An empty file or "{}" (e.g. on a fresh install) overrides nothing
+    if len(user_config_data) <= 2:
+        return config
+    
+    # Deep merge the configurations
+    user_config = json.loads(user_config_data)
+    if user_config:
+        deep_merge(config, user_config)
     
     return config
 
+def _read_default_config() -> Dict[str, Any]:
+    """
+    Parse the default configuration, reading the file only when it has changed.
+    
+    Returns:
+        Dict[str, Any]: A fresh copy of the default configuration, or an empty
+            dictionary if the default configuration file doesn't exist
+    """
+    global _default_config_source
+    
+    try:
+        stat = os.stat(DEFAULT_CONFIG_PATH)
+    except FileNotFoundError:
+        return {}
+    
+    source_key = (DEFAULT_CONFIG_PATH, stat.st_mtime_ns, stat.st_size)
+    if _default_config_source[0] != source_key:
+        with open(DEFAULT_CONFIG_PATH, 'rb') as f:
+            _default_config_source = (source_key, f.read())
+    
+    return json.loads(_default_config_source[1])
+
 def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> None:
     """
-    Recursively merge override dictionary into base dictionary.
+    Deep merge override dictionary into base dictionary.
     
     This function performs a deep merge of nested dictionaries, allowing for
     partial overrides of configuration sections. For example, a user can override
@@ -97,7 +144,7 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> None:
     
     The merge behavior is as follows:
     - If a key exists in both dictionaries and both values are dictionaries,
-      recursively merge those dictionaries
+      merge those dictionaries as well
     - Otherwise, the value from the override dictionary takes precedence
     
     This is a key part of the configuration override system, enabling granular
@@ -107,11 +154,64 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> None:
         base (Dict[str, Any]): Base dictionary to be updated
         override (Dict[str, Any]): Dictionary with values to override
     """
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            deep_merge(base[key], value)
-        else:
-            base[key] = value
+    # Walk nested dictionaries with an explicit stack instead of recursion
+    stack = [(base, override)]
+    push = stack.append
+    pop = stack.pop
+    
+    while stack:
+        current_base, current_override = pop()
+        
+        # Copy the whole override in one step when no keys collide
+        if current_base.keys().isdisjoint(current_override):
+            current_base.update(current_override)
+            continue
+        
+        for key, value in current_override.items():
+            base_value = current_base.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
+                push((base_value, value))
+            else:
+                current_base[key] = value
+
+def _write_config_file(path: str, data: bytes, permissions: int = 0o666, exclusive: bool = False) -> None:
+    """
+    Write a configuration file, creating its directory if it's missing.
+    
+    Args:
+        path (str): Path of the file
+        data (bytes): File contents
+        permissions (int): Permissions of the file if it's created (before the umask)
+        exclusive (bool): Fail with FileExistsError if the file already exists
+        
+    Raises:
+        FileExistsError: If exclusive is set and the file already exists
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    try:
+        fd = os.open(path, flags, permissions)
+    except FileNotFoundError:
+        # Only create the directory when the first attempt shows it's missing
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, flags, permissions)
+    
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+
+def _write_user_config(config: Dict[str, Any]) -> str:
+    """
+    Write configuration to the user config file without updating the cache.
+    
+    Args:
+        config (Dict[str, Any]): Configuration dictionary to save
+        
+    Returns:
+        str: The JSON text written to the file
+    """
+    # Save configuration, readable only by the user since it may hold credentials
+    user_config_text = json.dumps(config, indent=2)
+    _write_config_file(USER_CONFIG_PATH, user_config_text.encode("utf-8"), permissions=0o600)
+    return user_config_text
 
 def save_user_config(config: Dict[str, Any]) -> None:
     """
@@ -134,16 +234,25 @@ def save_user_config(config: Dict[str, Any]) -> None:
     Args:
         config (Dict[str, Any]): Configuration dictionary to save
     """
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(USER_CONFIG_PATH), exist_ok=True)
+    user_config_text = _write_user_config(config)
     
-    # Save configuration
-    with open(USER_CONFIG_PATH, 'w') as f:
-        json.dump(config, f, indent=2)
-    
-    # Update cache
+    # Update cache from the saved text rather than reading both files again
     global _config_cache
-    _config_cache = load_config()
+    _config_cache = _read_default_config()
+    deep_merge(_config_cache, json.loads(user_config_text))
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dot notation configuration key into its parts.
+    
+    Args:
+        key (str): The configuration key
+        
+    Returns:
+        Tuple[str, ...]: The key parts, e.g. ('api', 'openai', 'model')
+    """
+    return tuple(key.split('.'))
 
 def get_config_value(key: str, default: Any = None) -> Any:
     """
@@ -171,22 +280,16 @@ def get_config_value(key: str, default: Any = None) -> Any:
     Returns:
         Any: The configuration value or default
     """
-    config = get_config()
+    current = _get_config_cache()
     
-    # Handle nested keys with dot notation
-    if '.' in key:
-        parts = key.split('.')
-        current = config
-        
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return default
-                
-        return current
+    # Walk nested keys with dot notation
+    for part in _split_key(key):
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return default
     
-    return config.get(key, default)
+    return current
 
 def set_config_value(key: str, value: Any, save: bool = True) -> None:
     """
@@ -219,31 +322,26 @@ def set_config_value(key: str, value: Any, save: bool = True) -> None:
         value (Any): The value to set
         save (bool): Whether to save the updated configuration to disk
     """
-    config = get_config()
+    config = _get_config_cache()
     
-    # Handle nested keys with dot notation
-    if '.' in key:
-        parts = key.split('.')
-        current = config
-        
-        # Navigate to the deepest dict
-        for part in parts[:-1]:
-            if part not in current or not isinstance(current[part], dict):
-                current[part] = {}
-            current = current[part]
-                
-        # Set the value
-        current[parts[-1]] = value
-    else:
-        config[key] = value
+    # Navigate to the deepest dict for nested keys with dot notation
+    *parents, last = _split_key(key)
+    current = config
+    for part in parents:
+        if part not in current or not isinstance(current[part], dict):
+            current[part] = {}
+        current = current[part]
+    
+    # Set the value
+    current[last] = value
     
     # Update cache
     global _config_cache
     _config_cache = config
     
-    # Save to disk if requested
+    # Save to disk if requested; the cache already holds the new value
     if save:
-        save_user_config(config)
+        _write_user_config(config)
 
 def create_default_config() -> None:
     """
@@ -257,29 +355,31 @@ def create_default_config() -> None:
     like API keys. Those should be added by the user to their user configuration
     file at ~/.glow/config.json.
     """
-    if not os.path.exists(DEFAULT_CONFIG_PATH):
-        default_config = {
-            "api": {
-                "openai": {
-                    "model": "gpt-4",
-                    "temperature": 0.7,
-                    "max_tokens": 2000
-                },
+    default_config = {
+        "api": {
+            "openai": {
+                "model": "gpt-4",
+                "temperature": 0.7,
+                "max_tokens": 2000
             },
-            "output": {
-                "directory": "output",
-                "formats": ["1_1", "9_16", "16_9"],
-                "file_format": "png"
-            },
-            "logging": {
-                "level": "INFO",
-                "file": "glow.log"
-            }
+        },
+        "output": {
+            "directory": "output",
+            "formats": ["1_1", "9_16", "16_9"],
+            "file_format": "png"
+        },
+        "logging": {
+            "level": "INFO",
+            "file": "glow.log"
         }
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(DEFAULT_CONFIG_PATH), exist_ok=True)
-        
-        # Save default configuration
-        with open(DEFAULT_CONFIG_PATH, 'w') as f:
-            json.dump(default_config, f, indent=2)
\ No newline at end of file
+    }
+    
+    # Save default configuration, unless the file already exists
+    try:
+        _write_config_file(
+            DEFAULT_CONFIG_PATH,
+            json.dumps(default_config, indent=2).encode("utf-8"),
+            exclusive=True
+        )
+    except FileExistsError:
+        pass
\ No newline at end of file
@@ -10,15 +10,71 @@ This module provides functions for securely managing API credentials:
 import os
 import sys
 import getpass
-from typing import Dict, Any, Optional, List, Union
-from dotenv import load_dotenv
+import functools
+from typing import Dict, Any, MutableMapping, Optional, List, Union
 from glow.core.logging_config import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Whether the .env file has been loaded into the environment
+_dotenv_loaded = False
+
+# Environment variable names of the API keys, by API name
+API_KEY_ENV_VARS = {
+    "openrouter": "OPENROUTER_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "firefly": "ADOBE_API_KEY",
+    "translation": "TRANSLATION_API_KEY",
+    "adobe": "ADOBE_CLIENT_ID"  # Adobe services often need multiple credentials
+}
+
+# APIs whose key must be set in the environment instead of being prompted for,
+# with the service name and where to get a key
+_ENV_ONLY_API_KEYS = {
+    "openrouter": ("OpenRouter", "https://openrouter.ai/keys")
+}
+
+# Instructions for setting an environment variable in common shells
+_ENV_VAR_INSTRUCTIONS = (
+    "\n  For Bash/Zsh (Linux/Mac):\n"
+    "    export {key}=your_api_key_here\n"
+    "\n  For Windows Command Prompt:\n"
+    "    set {key}=your_api_key_here\n"
+    "\n  For Windows PowerShell:\n"
+    "    $env:{key}=\"your_api_key_here\"\n"
+)
+
+# Help shown before prompting for an API key
+_API_KEY_PROMPT_HELP = (
+    "\nTo avoid being prompted for the {key} in the future, you can set it as an environment variable:\n"
+    + _ENV_VAR_INSTRUCTIONS
+    + "\nYou can add this to your shell profile to make it permanent.\n\n"
+)
+
+# Help shown when an API key that must be set in the environment is missing
+_MISSING_API_KEY_HELP = (
+    "\nERROR: {key} environment variable is not set.\n"
+    "\nTo use this feature, you need to set the {key} environment variable:\n"
+    + _ENV_VAR_INSTRUCTIONS
+    + "\nYou can get an {service} API key at: {url}\n"
+    "\nAdd this to your shell profile to make it permanent.\n\n"
+)
+
+def load_env_file() -> None:
+    """
+    Load environment variables from the .env file, if it exists.
+    
+    The file is only read on the first call, so credential lookups that are
+    never made don't pay for importing python-dotenv and searching for the file.
+    Variables already set in the environment are not overridden.
+    """
+    global _dotenv_loaded
+    
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
 
 def get_credential(key: str, prompt: Optional[str] = None, required: bool = True) -> Optional[str]:
     """
@@ -32,11 +88,35 @@ def get_credential(key: str, prompt: Optional[str] = None, required: bool = True
     Returns:
         Optional[str]: The credential value or None if not required and not found
         
+    Raises:
+        ValueError: If credential is required but not found and not provided by user
+    """
+    load_env_file()
+    return _get_credential(key, os.environ, prompt, required)
+
+def _get_credential(
+    key: str,
+    environ: MutableMapping[str, str],
+    prompt: Optional[str] = None,
+    required: bool = True
+) -> Optional[str]:
+    """
+    Get a credential from an environment mapping, prompting the user if not found.
+    
+    Args:
+        key (str): Environment variable name
+        environ (MutableMapping[str, str]): os.environ, or a snapshot of it
+        prompt (str, optional): Prompt message for user input
+        required (bool): Whether the credential is required
+        
+    Returns:
+        Optional[str]: The credential value or None if not required and not found
+        
     Raises:
         ValueError: If credential is required but not found and not provided by user
     """
     # Try to get from environment
-    value = os.environ.get(key)
+    value = environ.get(key)
     
     # If not found and required, prompt user
     if not value and required:
@@ -45,14 +125,7 @@ def get_credential(key: str, prompt: Optional[str] = None, required: bool = True
         
         # For API keys, provide instructions on setting environment variables
         if key.endswith("_API_KEY"):
-            print(f"\nTo avoid being prompted for the {key} in the future, you can set it as an environment variable:")
-            print(f"\n  For Bash/Zsh (Linux/Mac):")
-            print(f"    export {key}=your_api_key_here")
-            print(f"\n  For Windows Command Prompt:")
-            print(f"    set {key}=your_api_key_here")
-            print(f"\n  For Windows PowerShell:")
-            print(f"    $env:{key}=\"your_api_key_here\"")
-            print(f"\nYou can add this to your shell profile to make it permanent.\n")
+            sys.stdout.write(_API_KEY_PROMPT_HELP.format(key=key))
         
         # Use getpass for sensitive input
         value = getpass.getpass(prompt)
@@ -64,6 +137,7 @@ def get_credential(key: str, prompt: Optional[str] = None, required: bool = True
         
         # Set as environment variable for this session
         os.environ[key] = value
+        environ[key] = value
     
     return value
 
@@ -83,9 +157,13 @@ def get_credentials_for_service(service: str, env_vars: List[str]) -> Dict[str,
     """
     credentials = {}
     
+    # Look the variables up in one snapshot of the environment
+    load_env_file()
+    environ = dict(os.environ)
+    
     for var in env_vars:
         prompt = f"Please enter your {var} for {service}: "
-        value = get_credential(var, prompt=prompt, required=True)
+        value = _get_credential(var, environ, prompt=prompt, required=True)
         credentials[var] = value
     
     return credentials
@@ -112,6 +190,19 @@ def validate_credentials(service: str, credentials: Dict[str, str]) -> bool:
     
     return True
 
+@functools.lru_cache(maxsize=None)
+def _test_api_key(api_name: str) -> str:
+    """
+    Build the dummy API key returned while running under pytest.
+    
+    Args:
+        api_name (str): API name
+        
+    Returns:
+        str: Dummy API key
+    """
+    return f"test_{api_name}_api_key"
+
 def get_api_key(api_name: str) -> str:
     """
     Get API key for a specific API.
@@ -128,44 +219,30 @@ def get_api_key(api_name: str) -> str:
     # Check if we're running in a test environment
     if 'PYTEST_CURRENT_TEST' in os.environ:
         # Return a dummy API key for testing
-        logger.debug(f"Using dummy API key for {api_name} in test environment")
-        return f"test_{api_name}_api_key"
-    
-    # Map API names to environment variable names
-    env_var_map = {
-        "openrouter": "OPENROUTER_API_KEY",
-        "openai": "OPENAI_API_KEY",
-        "firefly": "ADOBE_API_KEY",
-        "translation": "TRANSLATION_API_KEY",
-        "adobe": "ADOBE_CLIENT_ID"  # Adobe services often need multiple credentials
-    }
+        logger.debug("Using dummy API key for %s in test environment", api_name)
+        return _test_api_key(api_name)
+    
+    load_env_file()
     
     # Get the environment variable name
-    env_var = env_var_map.get(api_name.lower())
+    name = api_name.lower()
+    env_var = API_KEY_ENV_VARS.get(name)
     if not env_var:
         raise ValueError(f"Unknown API: {api_name}")
     
-    # Special handling for OpenRouter API key
-    if api_name.lower() == "openrouter":
-        # Check if the API key is set in the environment
-        value = os.environ.get(env_var)
-        if not value:
-            # Provide clear instructions and exit
-            print(f"\nERROR: {env_var} environment variable is not set.")
-            print(f"\nTo use this feature, you need to set the {env_var} environment variable:")
-            print(f"\n  For Bash/Zsh (Linux/Mac):")
-            print(f"    export {env_var}=your_api_key_here")
-            print(f"\n  For Windows Command Prompt:")
-            print(f"    set {env_var}=your_api_key_here")
-            print(f"\n  For Windows PowerShell:")
-            print(f"    $env:{env_var}=\"your_api_key_here\"")
-            print(f"\nYou can get an OpenRouter API key at: https://openrouter.ai/keys")
-            print(f"\nAdd this to your shell profile to make it permanent.\n")
-            raise ValueError(f"{env_var} environment variable is required but not set")
-        return value
-    else:
-        # For other APIs, use the standard credential flow
+    # For most APIs, use the standard credential flow
+    env_only = _ENV_ONLY_API_KEYS.get(name)
+    if env_only is None:
         return get_credential(env_var, prompt=f"Please enter your {api_name} API key: ")
+    
+    # Other keys must be set in the environment
+    value = os.environ.get(env_var)
+    if not value:
+        # Provide clear instructions and exit
+        service, url = env_only
+        sys.stdout.write(_MISSING_API_KEY_HELP.format(key=env_var, service=service, url=url))
+        raise ValueError(f"{env_var} environment variable is required but not set")
+    return value
 
 def get_service_credentials(config_section: Dict[str, Any]) -> Dict[str, str]:
     """
@@ -197,26 +274,37 @@ def save_credentials_to_env_file(credentials: Dict[str, str], env_file: str = ".
         credentials should be managed securely through environment variables
         or a secrets management service.
     """
-    # Check if file exists
-    file_exists = os.path.isfile(env_file)
-    
     # Read existing content if file exists
-    existing_vars = {}
-    if file_exists:
+    try:
         with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    key, value = line.split('=', 1)
-                    existing_vars[key] = value
+            content = f.read()
+    except FileNotFoundError:
+        content = ""
+    
+    existing_vars = dict(
+        line.split('=', 1)
+        for line in map(str.strip, content.splitlines())
+        if line and not line.startswith('#')
+    )
     
     # Update with new credentials
     existing_vars.update(credentials)
     
-    # Write back to file
-    with open(env_file, 'w') as f:
-        for key, value in existing_vars.items():
-            f.write(f"{key}={value}\n")
+    # Write to a temporary file readable only by the user, then swap it in so
+    # an interrupted write can't leave a truncated .env file behind
+    content = "".join(f"{key}={value}\n" for key, value in existing_vars.items())
+    temp_file = f"{env_file}.tmp"
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            # Also restrict a temporary file left over from an earlier attempt
+            os.chmod(temp_file, 0o600)
+            f.write(content)
+        os.replace(temp_file, env_file)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+        raise
     
     logger.info(f"Credentials saved to {env_file}")
     print(f"Credentials saved to {env_file}")
\ No newline at end of file
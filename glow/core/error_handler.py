@@ -5,14 +5,41 @@ This module provides functionality for handling API errors and providing
 consistent error reporting.
 """
 
+import copy
+import hashlib
 import logging
-import traceback
-from typing import Dict, Any, Optional, Union, Callable
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Tuple, Union, Callable
 import requests
 import json
 
 logger = logging.getLogger(__name__)
 
+# Default lifetime in seconds of cached API responses
+DEFAULT_CACHE_TTL = 60
+
+# Maximum number of cached API responses
+RESPONSE_CACHE_SIZE = 256
+
+# Cached API responses: request key -> (expiry time, parsed response), oldest first
+_response_cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Requests currently being sent with collapse_duplicates: request key -> outcome
+_inflight_requests: Dict[bytes, Future] = {}
+_inflight_requests_lock = threading.Lock()
+
+# Request data keys whose values are redacted when logging API errors
+_SENSITIVE_REQUEST_KEYS_RE = re.compile("key|token|secret|password", re.IGNORECASE)
+
+# Retried failures by (endpoint, status code), used to throttle retry warnings
+_retry_failures: Counter = Counter()
+_retry_failures_lock = threading.Lock()
+
 class APIError(Exception):
     """
     Exception raised for API errors.
@@ -50,13 +77,13 @@ class APIError(Exception):
         self.request_data = request_data
         
         # Create a detailed error message
-        detailed_message = f"API Error: {message}"
+        parts = [f"API Error: {message}"]
         if status_code:
-            detailed_message += f" (Status Code: {status_code})"
+            parts.append(f" (Status Code: {status_code})")
         if endpoint:
-            detailed_message += f" (Endpoint: {endpoint})"
+            parts.append(f" (Endpoint: {endpoint})")
         
-        super().__init__(detailed_message)
+        super().__init__("".join(parts))
 
 
 class ValidationError(Exception):
@@ -88,11 +115,11 @@ class ValidationError(Exception):
         self.value = value
         
         # Create a detailed error message
-        detailed_message = f"Validation Error: {message}"
+        parts = [f"Validation Error: {message}"]
         if field:
-            detailed_message += f" (Field: {field})"
+            parts.append(f" (Field: {field})")
         
-        super().__init__(detailed_message)
+        super().__init__("".join(parts))
 
 
 class ConfigurationError(Exception):
@@ -124,13 +151,75 @@ class ConfigurationError(Exception):
         self.missing_keys = missing_keys or []
         
         # Create a detailed error message
-        detailed_message = f"Configuration Error: {message}"
+        parts = [f"Configuration Error: {message}"]
         if component:
-            detailed_message += f" (Component: {component})"
+            parts.append(f" (Component: {component})")
         if missing_keys:
-            detailed_message += f" (Missing Keys: {', '.join(missing_keys)})"
+            parts.append(f" (Missing Keys: {', '.join(missing_keys)})")
         
-        super().__init__(detailed_message)
+        super().__init__("".join(parts))
+
+
+def _request_key(
+    request_func: Callable,
+    endpoint: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str]
+) -> bytes:
+    """
+    Compute the response cache key of a request.
+    
+    Args:
+        request_func: Function to make the API request.
+        endpoint: API endpoint.
+        payload: Request payload.
+        headers: Request headers.
+    
+    Returns:
+        Digest of the request method, endpoint, payload and headers.
+    """
+    canonical = json.dumps(
+        [getattr(request_func, "__name__", ""), endpoint, payload, headers],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def _response_ttl(response: Any, default_ttl: float) -> float:
+    """
+    Get how long a response may be cached, honoring its Cache-Control header.
+    
+    Args:
+        response: API response.
+        default_ttl: Lifetime in seconds when the response doesn't specify one.
+    
+    Returns:
+        Lifetime in seconds; 0 if the response must not be cached.
+    """
+    cache_control = getattr(response, "headers", {}).get("Cache-Control", "")
+    if not isinstance(cache_control, str):
+        return default_ttl
+    
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-store", "no-cache", "private"):
+            return 0
+        if name == "max-age":
+            try:
+                return max(0, int(value))
+            except ValueError:
+                return 0
+    
+    return default_ttl
+
+
+def clear_response_cache() -> None:
+    """
+    Remove all cached API responses.
+    """
+    with _response_cache_lock:
+        _response_cache.clear()
 
 
 def handle_api_request(
@@ -138,17 +227,98 @@ def handle_api_request(
     endpoint: str,
     payload: Dict[str, Any],
     headers: Dict[str, str],
-    error_message: str = "API request failed"
+    error_message: str = "API request failed",
+    enable_cache: bool = False,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    collapse_duplicates: bool = False
 ) -> Dict[str, Any]:
     """
     Handle an API request with error handling.
     
+    With enable_cache, successful responses are cached in memory by request,
+    so identical requests made within cache_ttl seconds (or the response's
+    Cache-Control max-age) don't go over the network. With collapse_duplicates,
+    a request that is identical to one already in flight in another thread
+    waits for and shares that request's outcome instead of sending its own.
+    Only enable either for idempotent requests.
+    
+    Args:
+        request_func: Function to make the API request.
+        endpoint: API endpoint.
+        payload: Request payload.
+        headers: Request headers.
+        error_message: Error message to use if the request fails.
+        enable_cache: Whether to cache successful responses.
+        cache_ttl: Default lifetime in seconds of cached responses.
+        collapse_duplicates: Whether to share identical concurrent requests.
+    
+    Returns:
+        API response.
+    
+    Raises:
+        APIError: If the API request fails.
+    """
+    if not (enable_cache or collapse_duplicates):
+        return _send_api_request(request_func, endpoint, payload, headers, error_message)
+    
+    request_key = _request_key(request_func, endpoint, payload, headers)
+    
+    # Return a cached response if there is a fresh one
+    if enable_cache:
+        with _response_cache_lock:
+            cached = _response_cache.get(request_key)
+            if cached is not None and cached[0] > time.monotonic():
+                _response_cache.move_to_end(request_key)
+                return copy.deepcopy(cached[1])
+    
+    cache_key = request_key if enable_cache else None
+    if not collapse_duplicates:
+        return _send_api_request(request_func, endpoint, payload, headers, error_message, cache_key, cache_ttl)
+    
+    # Wait for an identical request that is already in flight
+    with _inflight_requests_lock:
+        future = _inflight_requests.get(request_key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight_requests[request_key] = Future()
+    
+    if not is_leader:
+        return copy.deepcopy(future.result())
+    
+    # Send the request and share its outcome with the waiting duplicates
+    try:
+        result = _send_api_request(request_func, endpoint, payload, headers, error_message, cache_key, cache_ttl)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_requests_lock:
+            del _inflight_requests[request_key]
+
+
+def _send_api_request(
+    request_func: Callable,
+    endpoint: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    error_message: str,
+    cache_key: Optional[bytes] = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL
+) -> Dict[str, Any]:
+    """
+    Send an API request and translate failures into APIErrors.
+    
     Args:
         request_func: Function to make the API request.
         endpoint: API endpoint.
         payload: Request payload.
         headers: Request headers.
         error_message: Error message to use if the request fails.
+        cache_key: Response cache key, or None to not cache the response.
+        cache_ttl: Default lifetime in seconds of a cached response.
     
     Returns:
         API response.
@@ -170,9 +340,20 @@ def handle_api_request(
         # Parse the response
         try:
             result = response.json()
+            
+            # Cache the response unless it asks not to be
+            if cache_key is not None:
+                ttl = _response_ttl(response, cache_ttl)
+                if ttl > 0:
+                    with _response_cache_lock:
+                        _response_cache[cache_key] = (time.monotonic() + ttl, copy.deepcopy(result))
+                        _response_cache.move_to_end(cache_key)
+                        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                            _response_cache.popitem(last=False)
+            
             return result
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse API response: {e}")
+            logger.error("Failed to parse API response: %s", e)
             error_msg = f"Failed to parse API response: {e}"
             # Include the original error message in the API error message
             # This ensures the test can find the "Invalid JSON" string
@@ -198,8 +379,8 @@ def handle_api_request(
             status_code = getattr(response, 'status_code', None)
             response_text = getattr(response, 'text', str(e))
         
-        logger.error(f"HTTP error: {e}")
-        logger.error(f"Response: {response_text}")
+        logger.error("HTTP error: %s", e)
+        logger.error("Response: %s", response_text)
         
         # Create a more descriptive error message for the test
         error_msg = f"{error_message}: {e}"
@@ -214,7 +395,7 @@ def handle_api_request(
     
     except requests.exceptions.ConnectionError as e:
         # Handle connection errors
-        logger.error(f"Connection error: {e}")
+        logger.error("Connection error: %s", e)
         
         raise APIError(
             message=f"{error_message}: Connection error",
@@ -224,7 +405,7 @@ def handle_api_request(
     
     except requests.exceptions.Timeout as e:
         # Handle timeout errors
-        logger.error(f"Timeout error: {e}")
+        logger.error("Timeout error: %s", e)
         
         raise APIError(
             message=f"{error_message}: Request timed out",
@@ -234,7 +415,7 @@ def handle_api_request(
     
     except requests.exceptions.RequestException as e:
         # Handle other request errors
-        logger.error(f"Request error: {e}")
+        logger.error("Request error: %s", e)
         
         raise APIError(
             message=f"{error_message}: {e}",
@@ -244,8 +425,7 @@ def handle_api_request(
     
     except Exception as e:
         # Handle unexpected errors
-        logger.error(f"Unexpected error: {e}")
-        logger.error(traceback.format_exc())
+        logger.error("Unexpected error: %s", e, exc_info=True)
         
         # Include the original error message to make it easier to test
         error_detail = str(e)
@@ -285,11 +465,7 @@ def validate_required_fields(
     Raises:
         ValidationError: If a required field is missing.
     """
-    missing_fields = []
-    
-    for field in required_fields:
-        if field not in data:
-            missing_fields.append(field)
+    missing_fields = [field for field in required_fields if field not in data]
     
     if missing_fields:
         raise ValidationError(
@@ -314,11 +490,7 @@ def validate_configuration(
     Raises:
         ConfigurationError: If a required key is missing.
     """
-    missing_keys = []
-    
-    for key in required_keys:
-        if key not in config:
-            missing_keys.append(key)
+    missing_keys = [key for key in required_keys if key not in config]
     
     if missing_keys:
         raise ConfigurationError(
@@ -348,16 +520,42 @@ def log_api_error(error: APIError) -> None:
     
     if error.request_data:
         # Log request data without sensitive information
-        safe_request_data = error.request_data.copy()
-        
-        # Remove sensitive information
-        for key in safe_request_data:
-            if "key" in key.lower() or "token" in key.lower() or "secret" in key.lower() or "password" in key.lower():
-                safe_request_data[key] = "***REDACTED***"
+        safe_request_data = {
+            key: "***REDACTED***" if _SENSITIVE_REQUEST_KEYS_RE.search(key) else value
+            for key, value in error.request_data.items()
+        }
         
         logger.error(f"Request Data: {safe_request_data}")
 
 
+def _count_retry_failure(endpoint: str, status_code: Optional[int]) -> int:
+    """
+    Count a retried failure of an endpoint.
+    
+    Args:
+        endpoint: API endpoint.
+        status_code: HTTP status code of the failure.
+    
+    Returns:
+        Number of retried failures of the endpoint with this status code.
+    """
+    with _retry_failures_lock:
+        _retry_failures[(endpoint, status_code)] += 1
+        return _retry_failures[(endpoint, status_code)]
+
+
+def _reset_retry_failures(endpoint: str) -> None:
+    """
+    Forget the retried failures of an endpoint after it succeeds.
+    
+    Args:
+        endpoint: API endpoint.
+    """
+    with _retry_failures_lock:
+        for key in [key for key in _retry_failures if key[0] == endpoint]:
+            del _retry_failures[key]
+
+
 def retry_api_request(
     request_func: Callable,
     endpoint: str,
@@ -385,14 +583,12 @@ def retry_api_request(
     Raises:
         APIError: If the API request fails after all retries.
     """
-    import time
-    
     retries = 0
     last_error = None
     
     while retries < max_retries:
         try:
-            return handle_api_request(
+            result = handle_api_request(
                 request_func,
                 endpoint,
                 payload,
@@ -413,11 +609,21 @@ def retry_api_request(
                 # Calculate delay with exponential backoff
                 delay = retry_delay * (2 ** (retries - 1))
                 
-                logger.warning(f"API request failed, retrying in {delay} seconds (attempt {retries}/{max_retries})")
+                # Log only the 1st, 2nd, 4th, 8th, ... failure of an endpoint and
+                # status so a persistent outage doesn't flood the log
+                failures = _count_retry_failure(endpoint, e.status_code)
+                if failures & (failures - 1) == 0 or logger.isEnabledFor(logging.DEBUG):
+                    logger.warning(
+                        "API request failed, retrying in %s seconds (attempt %d/%d, %d failures so far)",
+                        delay, retries, max_retries, failures
+                    )
                 time.sleep(delay)
             else:
                 logger.error(f"API request failed after {max_retries} retries")
                 raise
+        else:
+            _reset_retry_failures(endpoint)
+            return result
     
     # This should not be reached, but just in case
     if last_error:
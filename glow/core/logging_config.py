@@ -9,12 +9,21 @@ This module provides advanced logging configuration for the Glow package:
 """
 
 import os
+import re
 import sys
 import logging
 import logging.handlers
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 
+# Key fragments that mark values as sensitive, matched case-insensitively
+# anywhere in a key
+SENSITIVE_KEYS = (
+    "api_key", "key", "secret", "password", "token", "auth", "credential",
+    "client_id", "client_secret", "access_token", "refresh_token"
+)
+_SENSITIVE_KEYS_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYS)), re.IGNORECASE)
+
 def configure_logging(
     level: str = "DEBUG",
     log_file: Optional[str] = None,
@@ -158,27 +167,32 @@ def redact_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Redact sensitive information from data.
     
+    The data is only copied if something needs redacting, so data without
+    sensitive values is returned as is. Treat the result as read-only.
+    
     Args:
         data (Dict[str, Any]): Data to redact
         
     Returns:
         Dict[str, Any]: Redacted data
     """
-    # Create a copy to avoid modifying the original
-    redacted = data.copy()
-    
-    # List of keys that might contain sensitive information
-    sensitive_keys = [
-        "api_key", "key", "secret", "password", "token", "auth", "credential",
-        "client_id", "client_secret", "access_token", "refresh_token"
-    ]
-    
-    # Redact sensitive values
-    for key, value in redacted.items():
-        if any(sensitive_key in key.lower() for sensitive_key in sensitive_keys):
-            redacted[key] = "********"
+    redacted = data
+    
+    # Redact sensitive values, copying the data on the first change so the
+    # original is never modified
+    for key, value in data.items():
+        if _SENSITIVE_KEYS_RE.search(key):
+            new_value = "********"
         elif isinstance(value, dict):
-            redacted[key] = redact_sensitive_data(value)
+            new_value = redact_sensitive_data(value)
+            if new_value is value:
+                continue
+        else:
+            continue
+        
+        if redacted is data:
+            redacted = data.copy()
+        redacted[key] = new_value
     
     return redacted
 
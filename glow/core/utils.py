@@ -11,10 +11,14 @@ This module provides utility functions used across the Glow package:
 import os
 import sys
 import json
+import asyncio
 import logging
 import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Awaitable, Iterable, Optional, Union, List
+
+# Extensions of supported image files
+IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp'})
 
 def setup_logging(name: str, **kwargs) -> logging.Logger:
     """
@@ -75,8 +79,8 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If file does not exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return json.loads(f.read())
 
 def save_json_file(data: Dict[str, Any], file_path: str, indent: int = 2) -> None:
     """
@@ -91,10 +95,15 @@ def save_json_file(data: Dict[str, Any], file_path: str, indent: int = 2) -> Non
         IOError: If file cannot be written
     """
     # Ensure directory exists
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    directory = os.path.dirname(file_path)
+    if directory:
+        ensure_dir(directory)
+    
+    # Serialize in one shot and write the bytes with a single call
+    content = json.dumps(data, indent=indent).encode("utf-8")
     
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=indent)
+    with open(file_path, 'wb') as f:
+        f.write(content)
 
 def get_file_extension(file_path: str) -> str:
     """
@@ -118,13 +127,11 @@ def is_valid_image_file(file_path: str) -> bool:
     Returns:
         bool: True if file is a valid image, False otherwise
     """
-    if not os.path.isfile(file_path):
+    # Check the extension first, which doesn't need a file system call
+    if get_file_extension(file_path) not in IMAGE_EXTENSIONS:
         return False
     
-    valid_extensions = ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp']
-    extension = get_file_extension(file_path)
-    
-    return extension in valid_extensions
+    return os.path.isfile(file_path)
 
 def format_aspect_ratio(width: int, height: int) -> str:
     """
@@ -185,4 +192,23 @@ def sanitize_filename(filename: str) -> str:
     for char in invalid_chars:
         filename = filename.replace(char, '_')
     
-    return filename
\ No newline at end of file
+    return filename
+
+async def bounded_gather(coros: Iterable[Awaitable[Any]], limit: int = 5) -> List[Any]:
+    """
+    Await coroutines concurrently, with at most ``limit`` running at once.
+    
+    Args:
+        coros (Iterable[Awaitable[Any]]): Coroutines to await
+        limit (int): Maximum number of coroutines running at the same time
+        
+    Returns:
+        List[Any]: Results, in the same order as the coroutines
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*[run(coro) for coro in coros])
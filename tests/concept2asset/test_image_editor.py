@@ -375,4 +375,320 @@ class TestImageEditor:
         mock_truetype.assert_called_once_with(font_path, 36)
         
         # Check that the font was returned
-        assert font == mock_font
\ No newline at end of file
+        assert font == mock_font
+    
+    @patch('PIL.ImageFont.truetype')
+    def test_get_font_is_cached(self, mock_truetype):
+        """
+        Test that repeated font lookups reuse the loaded font.
+        """
+        # Create a mock font
+        mock_font = MagicMock()
+        mock_truetype.return_value = mock_font
+        
+        # Create an editor with a font directory containing the font
+        editor = ImageEditor(font_dir=self.temp_dir.name)
+        font_path = os.path.join(self.temp_dir.name, "Cached.ttf")
+        with open(font_path, 'w') as f:
+            f.write("mock font file")
+        
+        text_config = {
+            "font": "Cached",
+            "font_size": 24
+        }
+        
+        # Load the same font twice
+        first = editor._get_font(text_config)
+        second = editor._get_font(text_config)
+        
+        # Check that the font file was only parsed once
+        mock_truetype.assert_called_once_with(font_path, 24)
+        assert first is second is mock_font
+    
+    def test_apply_text_overlay_shadow_keeps_image_opaque(self):
+        """
+        Test that a semi-transparent shadow is blended rather than cutting through the image.
+        """
+        # Create a text configuration with a semi-transparent shadow
+        text_config = {
+            "primary_text": "Test Text",
+            "text_position": "center",
+            "color": "#000000",
+            "font_size": 36,
+            "shadow": True,
+            "shadow_color": "#00000080",
+            "shadow_offset": (4, 4)
+        }
+        
+        # Apply text overlay
+        output_path = self.editor.apply_text_overlay(
+            self.test_image_path,
+            text_config
+        )
+        
+        # Check that the opaque test image stays fully opaque
+        with Image.open(output_path) as img:
+            assert img.getchannel("A").getextrema() == (255, 255)
+        
+        # Clean up
+        os.remove(output_path)
+    
+    def test_apply_opacity(self):
+        """
+        Test that opacity caps the logo's alpha channel without touching color.
+        """
+        # Create a logo with one pixel already below the target alpha
+        logo = Image.new('RGBA', (4, 4), color=(10, 20, 30, 255))
+        logo.putpixel((0, 0), (10, 20, 30, 40))
+        
+        result = self.editor._apply_opacity(logo, 50)
+        
+        assert result.mode == "RGBA"
+        assert result.getpixel((1, 1)) == (10, 20, 30, 127)
+        assert result.getpixel((0, 0)) == (10, 20, 30, 40)
+        
+        # Check that the input logo was not modified
+        assert logo.getpixel((1, 1)) == (10, 20, 30, 255)
+    
+    def test_apply_logo_overlay(self):
+        """
+        Test applying a logo overlay from a local file.
+        """
+        # Create a semi-transparent red logo
+        logo_path = os.path.join(self.temp_dir.name, "logo.png")
+        Image.new('RGBA', (100, 50), color=(255, 0, 0, 128)).save(logo_path)
+        
+        logo_config = {
+            "url": logo_path,
+            "position": "top_left",
+            "size": 20,
+            "padding": 10
+        }
+        
+        # Apply logo overlay
+        output_path = self.editor.apply_logo_overlay(
+            self.test_image_path,
+            logo_config
+        )
+        
+        # Check that the logo was blended over the opaque image
+        with Image.open(output_path) as img:
+            assert img.size == (500, 500)
+            r, g, b, a = img.getpixel((20, 20))
+            assert a == 255
+            assert r == 255 and 120 <= g <= 135
+            assert img.getpixel((400, 400)) == (255, 255, 255, 255)
+        
+        # Clean up
+        os.remove(output_path)
+    
+    @patch('glow.concept2asset.image_editor.requests.get')
+    def test_load_logo_from_url_is_cached(self, mock_get):
+        """
+        Test that a remote logo is streamed once and reused on later loads.
+        """
+        from io import BytesIO
+        from glow.concept2asset.image_editor import _fetch_logo_bytes
+        
+        _fetch_logo_bytes.cache_clear()
+        
+        # Create a mock streaming response containing a PNG logo
+        logo_bytes = BytesIO()
+        Image.new('RGBA', (8, 8), color=(255, 0, 0, 255)).save(logo_bytes, "PNG")
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = BytesIO(logo_bytes.getvalue())
+        mock_get.return_value = mock_response
+        
+        # Load the same logo twice
+        first = self.editor._load_logo("https://example.com/logo.png")
+        second = self.editor._load_logo("https://example.com/logo.png")
+        
+        # Check that the logo was only downloaded once, as a stream
+        mock_get.assert_called_once_with("https://example.com/logo.png", timeout=10, stream=True)
+        assert first.size == second.size == (8, 8)
+        assert first.mode == "RGBA"
+        
+        _fetch_logo_bytes.cache_clear()
+    
+    def test_prepare_logo_is_cached(self):
+        """
+        Test that prepared logos are reused for the same size and opacity.
+        """
+        logo_path = os.path.join(self.temp_dir.name, "cached_logo.png")
+        Image.new('RGBA', (200, 100), color=(0, 0, 255, 255)).save(logo_path)
+        
+        with patch.object(self.editor, '_load_logo', wraps=self.editor._load_logo) as mock_load:
+            first = self.editor._prepare_logo(logo_path, 50, 80)
+            second = self.editor._prepare_logo(logo_path, 50, 80)
+            third = self.editor._prepare_logo(logo_path, 60, 80)
+        
+        # Check that the logo was only loaded once per size
+        assert mock_load.call_count == 2
+        assert first is second
+        assert first.size == (50, 25)
+        assert third.size == (60, 30)
+        assert first.getpixel((0, 0))[3] == 204
+    
+    def test_prepare_logo_is_loaded_eagerly(self):
+        """
+        Test that a cached local RGBA logo is fully loaded and holds no open file.
+        """
+        logo_path = os.path.join(self.temp_dir.name, "eager_logo.png")
+        Image.new('RGBA', (50, 25), color=(0, 0, 255, 255)).save(logo_path)
+        
+        # Same width and full opacity, so the loaded image itself is cached
+        logo = self.editor._prepare_logo(logo_path, 50, 100)
+        
+        assert logo.mode == "RGBA"
+        assert getattr(logo, "fp", None) is None
+        assert logo.getpixel((0, 0)) == (0, 0, 255, 255)
+    
+    def test_apply_color_adjustments_matches_image_enhance(self):
+        """
+        Test that the fused color adjustments match Pillow's ImageEnhance operators.
+        """
+        import numpy as np
+        from PIL import ImageEnhance
+        
+        # Create a noisy RGB image
+        rng = np.random.default_rng(0)
+        img = Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        
+        adjustments = {
+            "brightness": 10,
+            "contrast": 20,
+            "saturation": -30
+        }
+        
+        # Apply the adjustments sequentially with ImageEnhance
+        expected = ImageEnhance.Brightness(img).enhance(1.1)
+        expected = ImageEnhance.Contrast(expected).enhance(1.2)
+        expected = ImageEnhance.Color(expected).enhance(0.7)
+        
+        result = self.editor._apply_color_adjustments(img, adjustments)
+        
+        # Allow for per-step rounding differences
+        assert result.mode == "RGB"
+        diff = np.abs(np.asarray(result, dtype=int) - np.asarray(expected, dtype=int))
+        assert diff.max() <= 3
+    
+    def test_adjust_image_no_adjustments(self):
+        """
+        Test that an empty adjustment set copies the image unchanged.
+        """
+        output_path = self.editor.adjust_image(
+            self.test_image_path,
+            {}
+        )
+        
+        # Check that the output is a byte-for-byte copy of the input
+        with open(self.test_image_path, 'rb') as src, open(output_path, 'rb') as dst:
+            assert src.read() == dst.read()
+        
+        # Clean up
+        os.remove(output_path)
+    
+    def test_process_batch(self):
+        """
+        Test processing several images with a shared text configuration.
+        """
+        # Create a second test image
+        second_image_path = os.path.join(self.temp_dir.name, "test_image_2.png")
+        Image.new('RGB', (300, 200), color=(0, 128, 255)).save(second_image_path)
+        
+        text_config = {
+            "primary_text": "Batch Text",
+            "text_position": "center",
+            "color": "#000000",
+            "font_size": 24
+        }
+        
+        with patch.object(self.editor, '_get_font', wraps=self.editor._get_font) as mock_get_font:
+            output_paths = self.editor.process_batch(
+                [self.test_image_path, second_image_path],
+                text_config=text_config,
+                adjustments={"brightness": 10}
+            )
+        
+        # Check that the font was resolved once for the whole batch
+        mock_get_font.assert_called_once_with(text_config)
+        
+        # Check that outputs are returned in input order
+        assert output_paths == [
+            os.path.join(self.temp_dir.name, "test_image_text_adjusted.png"),
+            os.path.join(self.temp_dir.name, "test_image_2_text_adjusted.png")
+        ]
+        for output_path in output_paths:
+            assert os.path.isfile(output_path)
+    
+    def test_parse_color(self):
+        """
+        Test parsing RGB, RGBA and invalid hex colors.
+        """
+        assert self.editor._parse_color("#FF8000") == (255, 128, 0, 255)
+        assert self.editor._parse_color("00000080") == (0, 0, 0, 128)
+        assert self.editor._parse_color("#12345678") == (0x12, 0x34, 0x56, 0x78)
+        
+        # Invalid lengths fall back to the default text color
+        assert self.editor._parse_color("#FFF") == (255, 255, 255, 255)
+    
+    def test_intermediate_save_kwargs(self):
+        """
+        Test the fast save options used for intermediate images.
+        """
+        from glow.concept2asset.image_editor import intermediate_save_kwargs
+        
+        assert intermediate_save_kwargs("step.png") == {"compress_level": 1}
+        assert intermediate_save_kwargs("step.JPG") == {"quality": 95, "subsampling": 0}
+        assert intermediate_save_kwargs("step.webp") == {}
+    
+    def test_apply_text_overlay_with_save_kwargs(self):
+        """
+        Test that save options are passed through to Image.save.
+        """
+        text_config = {
+            "primary_text": "Test Text",
+            "font_size": 36
+        }
+        
+        with patch('PIL.Image.Image.save') as mock_save:
+            output_path = self.editor.apply_text_overlay(
+                self.test_image_path,
+                text_config,
+                save_kwargs={"compress_level": 1}
+            )
+        
+        mock_save.assert_called_once_with(output_path, compress_level=1)
+    
+    def test_fallback_font_resolved_at_init(self):
+        """
+        Test that the fallback font is resolved from the font directory at construction.
+        """
+        # Only the second preferred fallback font is available
+        font_path = os.path.join(self.temp_dir.name, "OpenSans-Regular.ttf")
+        with open(font_path, 'w') as f:
+            f.write("mock font file")
+        
+        editor = ImageEditor(font_dir=self.temp_dir.name)
+        assert editor._fallback_font_path == font_path
+        
+        # No fallback font is available in an empty directory
+        empty_dir = os.path.join(self.temp_dir.name, "empty")
+        os.makedirs(empty_dir)
+        assert ImageEditor(font_dir=empty_dir)._fallback_font_path is None
+    
+    def test_overlay_logo_partially_outside_image(self):
+        """
+        Test overlaying a logo whose position lies partly outside the image.
+        """
+        img = Image.new('RGBA', (100, 100), color=(255, 255, 255, 255))
+        logo = Image.new('RGBA', (40, 40), color=(0, 0, 0, 255))
+        
+        result = self.editor._overlay_logo(img, logo, (-10, -20))
+        
+        # Check that only the visible part of the logo was drawn
+        assert result is img
+        assert result.getpixel((0, 0)) == (0, 0, 0, 255)
+        assert result.getpixel((29, 19)) == (0, 0, 0, 255)
+        assert result.getpixel((30, 20)) == (255, 255, 255, 255)
@@ -5,6 +5,9 @@ This module tests the localization processor functionality.
 """
 
 import os
+import time
+import asyncio
+import threading
 import pytest
 from unittest.mock import patch, MagicMock
 import requests
@@ -82,7 +85,7 @@ class TestLocalizationProcessor:
         assert processor.headers == {}
         assert processor.params == {}
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text(self, mock_post):
         """
         Test translating text.
@@ -145,7 +148,7 @@ class TestLocalizationProcessor:
         assert translated_config["shadow"] is True
         assert translated_config["shadow_color"] == "#00000080"
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text_alternative_response_structure(self, mock_post):
         """
         Test translating text with an alternative response structure.
@@ -173,7 +176,7 @@ class TestLocalizationProcessor:
         assert translated_config["secondary_text"] == "ค้นพบรสชาติแห่งสวรรค์"
         assert translated_config["call_to_action"] == "เติมความสดชื่นให้ฤดูร้อนของคุณ"
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text_list_response(self, mock_post):
         """
         Test translating text with a list response.
@@ -199,7 +202,7 @@ class TestLocalizationProcessor:
         assert translated_config["secondary_text"] == "ค้นพบรสชาติแห่งสวรรค์"
         assert translated_config["call_to_action"] == "เติมความสดชื่นให้ฤดูร้อนของคุณ"
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text_single_text_response(self, mock_post):
         """
         Test translating text with a single text response.
@@ -243,7 +246,7 @@ class TestLocalizationProcessor:
                 target_language="th"
             )
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text_api_error(self, mock_post):
         """
         Test translating text with an API error.
@@ -258,7 +261,7 @@ class TestLocalizationProcessor:
                 target_language="th"
             )
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text_json_decode_error(self, mock_post):
         """
         Test translating text with a JSON decode error.
@@ -276,7 +279,7 @@ class TestLocalizationProcessor:
                 target_language="th"
             )
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_text_unexpected_response(self, mock_post):
         """
         Test translating text with an unexpected response structure.
@@ -296,7 +299,7 @@ class TestLocalizationProcessor:
                 target_language="th"
             )
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_batch_translate_configs(self, mock_post):
         """
         Test batch translating text configurations.
@@ -317,24 +320,16 @@ class TestLocalizationProcessor:
             }
         ]
         
-        # Mock the API response for each call
-        mock_response1 = MagicMock()
-        mock_response1.json.return_value = {
-            "translations": [
-                {"translated_text": "ดับร้อนด้วยความสดชื่นเขตร้อน"}
-            ]
-        }
-        mock_response1.raise_for_status = MagicMock()
-        
-        mock_response2 = MagicMock()
-        mock_response2.json.return_value = {
+        # Mock a single batched API response
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
             "translations": [
+                {"translated_text": "ดับร้อนด้วยความสดชื่นเขตร้อน"},
                 {"translated_text": "ค้นพบรสชาติแห่งสวรรค์"}
             ]
         }
-        mock_response2.raise_for_status = MagicMock()
-        
-        mock_post.side_effect = [mock_response1, mock_response2]
+        mock_response.raise_for_status = MagicMock()
+        mock_post.return_value = mock_response
         
         # Batch translate the configurations
         translated_configs = self.processor.batch_translate_configs(
@@ -342,14 +337,197 @@ class TestLocalizationProcessor:
             target_language="th"
         )
         
-        # Check that the API was called twice
-        assert mock_post.call_count == 2
+        # Check that the texts were sent in a single request
+        assert mock_post.call_count == 1
+        assert mock_post.call_args[1]["json"]["texts"] == [
+            "Beat the heat with tropical refreshment",
+            "Discover a taste of paradise"
+        ]
         
         # Check that the text was translated in both configurations
         assert translated_configs[0]["primary_text"] == "ดับร้อนด้วยความสดชื่นเขตร้อน"
         assert translated_configs[1]["primary_text"] == "ค้นพบรสชาติแห่งสวรรค์"
+        assert translated_configs[1]["localization"]["target_language"] == "th"
+        
+        # Check that the original configurations were not modified
+        assert text_configs[0]["primary_text"] == "Beat the heat with tropical refreshment"
+    
+    @patch("requests.Session.post")
+    def test_batch_translate_configs_chunks_by_config(self, mock_post):
+        """
+        Test that batches respect max_batch_size without splitting a configuration.
+        """
+        processor = LocalizationProcessor({**self.api_config, "max_batch_size": 3})
+        text_configs = [
+            {"primary_text": "a1", "call_to_action": "a2"},
+            {"primary_text": "b1", "call_to_action": "b2"},
+            {"primary_text": "c1"}
+        ]
+        
+        def fake_post(url, json=None, headers=None):
+            response = MagicMock()
+            response.json.return_value = {"translated_texts": [text.upper() for text in json["texts"]]}
+            return response
+        
+        mock_post.side_effect = fake_post
+        
+        translated_configs = processor.batch_translate_configs(text_configs, target_language="fr")
+        
+        # Check the request grouping and the scattered results
+        sent = [call[1]["json"]["texts"] for call in mock_post.call_args_list]
+        assert sent == [["a1", "a2"], ["b1", "b2", "c1"]]
+        assert [config["primary_text"] for config in translated_configs] == ["A1", "B1", "C1"]
+        assert translated_configs[1]["call_to_action"] == "B2"
+    
+    @patch("requests.Session.post")
+    def test_batch_translate_configs_malformed_response(self, mock_post):
+        """
+        Test that a malformed API response leaves the configurations unchanged.
+        """
+        text_configs = [{"primary_text": "Hello"}, {"primary_text": "World"}]
+        
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"translations": [{"text": "Bonjour"}, {"text": "Monde"}]}
+        mock_post.return_value = mock_response
+        
+        translated_configs = self.processor.batch_translate_configs(text_configs, target_language="fr")
+        
+        assert translated_configs == text_configs
+        assert all("localization" not in config for config in translated_configs)
+    
+    @patch("requests.Session.post")
+    def test_batch_translate_configs_without_endpoint(self, mock_post):
+        """
+        Test that configurations are returned unchanged when no API endpoint is configured.
+        """
+        processor = LocalizationProcessor({})
+        text_configs = [{"primary_text": "Hello"}]
+        
+        assert processor.batch_translate_configs(text_configs, target_language="fr") == text_configs
+        mock_post.assert_not_called()
+    
+    @patch("requests.Session.post")
+    def test_batch_translate_configs_deduplicates_texts(self, mock_post):
+        """
+        Test that repeated texts are translated once and reused afterwards.
+        """
+        text_configs = [
+            {"primary_text": "Summer sale", "call_to_action": "Buy now"},
+            {"primary_text": "New flavors", "call_to_action": "Buy now"}
+        ]
+        
+        def fake_post(url, json=None, headers=None):
+            response = MagicMock()
+            response.json.return_value = {"translated_texts": [text.upper() for text in json["texts"]]}
+            return response
+        
+        mock_post.side_effect = fake_post
+        
+        translated_configs = self.processor.batch_translate_configs(text_configs, target_language="fr")
+        
+        # Check that the duplicate call to action was only sent once
+        assert mock_post.call_args[1]["json"]["texts"] == ["Summer sale", "Buy now", "New flavors"]
+        assert translated_configs[1]["call_to_action"] == "BUY NOW"
+        
+        # Check that a later translation of known texts skips the API
+        translated = self.processor.translate_text({"primary_text": "Summer sale"}, target_language="fr")
+        assert translated["primary_text"] == "SUMMER SALE"
+        assert mock_post.call_count == 1
+    
+    @patch("requests.Session.post")
+    def test_disk_cache_reused_across_processors(self, mock_post, tmp_path):
+        """
+        Test that translations cached on disk are reused by a new processor.
+        """
+        api_config = {**self.api_config, "cache_path": str(tmp_path / "translations.db")}
+        
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"translated_texts": ["Soldes d'été", "Acheter"]}
+        mock_post.return_value = mock_response
+        
+        LocalizationProcessor(api_config).translate_text(
+            {"primary_text": "Summer sale", "call_to_action": "Buy now"},
+            target_language="fr"
+        )
+        assert mock_post.call_count == 1
+        
+        # A fresh processor only sends the text that is not cached yet
+        mock_response.json.return_value = {"translated_texts": ["Nouveau"]}
+        translated = LocalizationProcessor(api_config).translate_text(
+            {"primary_text": "Summer sale", "secondary_text": "New", "call_to_action": "Buy now"},
+            target_language="fr"
+        )
+        
+        assert mock_post.call_count == 2
+        assert mock_post.call_args[1]["json"]["texts"] == ["New"]
+        assert translated["primary_text"] == "Soldes d'été"
+        assert translated["secondary_text"] == "Nouveau"
+        assert translated["call_to_action"] == "Acheter"
+    
+    @patch("requests.Session.post")
+    def test_batch_translate_configs_async(self, mock_post):
+        """
+        Test translating text configurations concurrently.
+        """
+        text_configs = [
+            {"primary_text": "Beat the heat", "color": "#FFFFFF"},
+            {"primary_text": "Discover paradise", "color": "#FFFFFF"}
+        ]
+        
+        # Echo the request text back with a language prefix
+        def fake_post(url, json=None, headers=None):
+            response = MagicMock()
+            response.json.return_value = {
+                "translations": [{"translated_text": f"fr:{text}"} for text in json["texts"]]
+            }
+            return response
+        
+        mock_post.side_effect = fake_post
+        
+        translated_configs = asyncio.run(
+            self.processor.batch_translate_configs_async(text_configs, target_language="fr")
+        )
+        
+        # Check that order is preserved and metadata added
+        assert mock_post.call_count == 2
+        assert translated_configs[0]["primary_text"] == "fr:Beat the heat"
+        assert translated_configs[1]["primary_text"] == "fr:Discover paradise"
+        assert translated_configs[1]["localization"]["target_language"] == "fr"
+    
+    @patch("requests.Session.post")
+    def test_batch_translate_configs_async_respects_max_concurrency(self, mock_post):
+        """
+        Test that async batch translation limits the requests in flight.
+        """
+        processor = LocalizationProcessor({**self.api_config, "max_concurrency": 2})
+        text_configs = [{"primary_text": f"Text {i}"} for i in range(6)]
+        
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+        
+        def fake_post(url, json=None, headers=None):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            response = MagicMock()
+            response.json.return_value = {"translated_texts": json["texts"]}
+            return response
+        
+        mock_post.side_effect = fake_post
+        
+        translated_configs = asyncio.run(
+            processor.batch_translate_configs_async(text_configs, target_language="fr")
+        )
+        
+        assert len(translated_configs) == 6
+        assert mock_post.call_count == 6
+        assert peak[0] <= 2
     
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_batch_translate_configs_with_error(self, mock_post):
         """
         Test batch translating text configurations with an error.
@@ -383,7 +561,8 @@ class TestLocalizationProcessor:
         mock_post.side_effect = [mock_response, requests.exceptions.RequestException("API error")]
         
         # Batch translate the configurations
-        translated_configs = self.processor.batch_translate_configs(
+        processor = LocalizationProcessor({**self.api_config, "max_batch_size": 1})
+        translated_configs = processor.batch_translate_configs(
             text_configs,
             target_language="th"
         )
@@ -397,6 +576,80 @@ class TestLocalizationProcessor:
         # Check that the second text was not translated (original is preserved)
         assert translated_configs[1]["primary_text"] == "Discover a taste of paradise"
     
+    @patch("requests.Session.post")
+    def test_access_token_cached_and_refreshed(self, mock_post):
+        """
+        Test that access tokens are reused and refreshed after an auth error.
+        """
+        processor = LocalizationProcessor({
+            **self.api_config,
+            "token_url": "https://auth.translation-service.com/token"
+        })
+        token_url = "https://auth.translation-service.com/token"
+        
+        tokens = iter(["token-1", "token-2"])
+        statuses = iter([200, 401, 200])
+        
+        def fake_post(url, json=None, headers=None):
+            response = MagicMock()
+            if url == token_url:
+                response.json.return_value = {"access_token": next(tokens)}
+            else:
+                response.status_code = next(statuses)
+                response.json.return_value = {"translated_texts": json["texts"]}
+            return response
+        
+        mock_post.side_effect = fake_post
+        
+        processor.translate_text({"primary_text": "One"}, target_language="fr")
+        processor.translate_text({"primary_text": "Two"}, target_language="fr")
+        
+        # One token fetch, two translation requests, then a refresh and a retry
+        urls = [call[0][0] for call in mock_post.call_args_list]
+        assert urls.count(token_url) == 2
+        assert mock_post.call_count == 5
+        
+        # Check that the retried request used the refreshed token
+        assert mock_post.call_args[1]["headers"]["Authorization"] == "Bearer token-2"
+    
+    def test_invalidate_token_keeps_newer_token(self):
+        """
+        Test that a rejected token does not clear a newer token fetched by another thread.
+        """
+        processor = LocalizationProcessor({
+            **self.api_config,
+            "token_url": "https://auth.translation-service.com/token"
+        })
+        
+        # Another thread already replaced the rejected token
+        processor._token = ("token-2", time.monotonic())
+        processor._invalidate_token("Bearer token-1")
+        assert processor._token[0] == "token-2"
+        
+        # The rejected token itself is dropped
+        processor._invalidate_token("Bearer token-2")
+        assert processor._token is None
+    
+    @patch("requests.Session.post")
+    def test_response_extractor_cached_and_redetected(self, mock_post):
+        """
+        Test that the response structure is remembered and re-detected when it changes.
+        """
+        first = MagicMock()
+        first.json.return_value = {"translated_texts": ["Un"]}
+        second = MagicMock()
+        second.json.return_value = {"translated_texts": ["Deux"]}
+        third = MagicMock()
+        third.json.return_value = {"translations": [{"translated_text": "Trois"}]}
+        mock_post.side_effect = [first, second, third]
+        
+        results = [
+            self.processor.translate_text({"primary_text": text}, target_language="fr")["primary_text"]
+            for text in ("One", "Two", "Three")
+        ]
+        
+        assert results == ["Un", "Deux", "Trois"]
+    
     @patch.dict(os.environ, {"TRANSLATION_API_KEY": "test-api-key"})
     def test_is_configured(self):
         """
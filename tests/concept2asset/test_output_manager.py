@@ -4,11 +4,14 @@ Tests for output manager.
 This module tests the output manager functionality.
 """
 
+import gc
 import os
 import json
 import shutil
 import tempfile
 import time
+import datetime
+import weakref
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -60,6 +63,7 @@ class TestOutputManager:
         """
         Clean up test environment.
         """
+        self.output_manager.close()
         self.temp_dir.cleanup()
     
     def test_create_output_structure(self):
@@ -158,6 +162,64 @@ class TestOutputManager:
         expected_path = os.path.join(output_dir, "custom_filename.png")
         assert asset_path == expected_path
     
+    def test_save_asset_copy_modes(self):
+        """
+        Test saving an asset with each copy mode.
+        """
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        
+        for copy_mode in ("auto", "link", "reflink", "copy"):
+            output_path = self.output_manager.save_asset(
+                self.test_asset_path,
+                output_dir,
+                filename=f"{copy_mode}.png",
+                copy_mode=copy_mode
+            )
+            with open(output_path, "r") as f:
+                assert f.read() == "test asset content"
+        
+        # Check that no temporary files were left behind
+        assert sorted(os.listdir(output_dir)) == ["auto.png", "copy.png", "link.png", "reflink.png"]
+        
+        # Check that saving over an existing link replaces it rather than writing through it
+        linked_path = os.path.join(output_dir, "link.png")
+        other_asset = os.path.join(self.temp_dir.name, "other_asset.png")
+        with open(other_asset, "w") as f:
+            f.write("other content")
+        self.output_manager.save_asset(other_asset, output_dir, filename="link.png", copy_mode="copy")
+        
+        with open(linked_path, "r") as f:
+            assert f.read() == "other content"
+        with open(self.test_asset_path, "r") as f:
+            assert f.read() == "test asset content"
+        
+        # Check that an unknown mode is rejected
+        with pytest.raises(ValueError):
+            self.output_manager.save_asset(self.test_asset_path, output_dir, copy_mode="move")
+    
+    def test_save_asset_link_then_auto(self):
+        """
+        Test saving an asset with the default mode over an existing link to it.
+        """
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        output_path = self.output_manager.save_asset(
+            self.test_asset_path, output_dir, filename="asset.png", copy_mode="link"
+        )
+        assert os.path.samefile(self.test_asset_path, output_path)
+        
+        # Saving again with the default mode replaces the link with a separate file
+        assert self.output_manager.save_asset(self.test_asset_path, output_dir, filename="asset.png") == output_path
+        assert not os.path.samefile(self.test_asset_path, output_path)
+        with open(output_path, "r") as f:
+            assert f.read() == "test asset content"
+        assert os.listdir(output_dir) == ["asset.png"]
+        
+        # Saving an asset onto itself is rejected
+        with pytest.raises(shutil.SameFileError):
+            self.output_manager.save_asset(
+                output_path, output_dir, filename="asset.png"
+            )
+    
     def test_save_asset_file_not_found(self):
         """
         Test saving a non-existent asset.
@@ -172,6 +234,19 @@ class TestOutputManager:
                 output_dir
             )
     
+    def test_output_dir_created_once(self):
+        """
+        Test that repeated saves to the same directory only create it once.
+        """
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        
+        with patch("glow.concept2asset.output_manager.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+            self.output_manager.save_concept_config(self.test_config, output_dir)
+            self.output_manager.save_log("log", output_dir)
+            self.output_manager.save_metrics({}, output_dir)
+        
+        mock_makedirs.assert_called_once_with(output_dir, exist_ok=True)
+    
     def test_save_log(self):
         """
         Test saving a log file.
@@ -198,6 +273,46 @@ class TestOutputManager:
             content = f.read()
         assert content == log_content
     
+    def test_save_log_appends_after_first_call(self):
+        """
+        Test that repeated log saves to the same file append to it.
+        """
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        os.makedirs(output_dir)
+        
+        # A log left over from an earlier run is replaced
+        with open(os.path.join(output_dir, "log.txt"), "w") as f:
+            f.write("stale\n")
+        
+        log_path = self.output_manager.save_log("first\n", output_dir)
+        self.output_manager.save_log("second\n", output_dir)
+        
+        # Check that the content is readable before the manager is closed
+        with open(log_path, "r") as f:
+            assert f.read() == "first\nsecond\n"
+        
+        self.output_manager.close()
+        with open(log_path, "r") as f:
+            assert f.read() == "first\nsecond\n"
+    
+    def test_save_log_closed_when_manager_collected(self):
+        """
+        Test that open log files do not keep the manager alive.
+        """
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        
+        output_manager = OutputManager()
+        log_path = output_manager.save_log("collected\n", output_dir)
+        manager_ref = weakref.ref(output_manager)
+        
+        # The open log file does not keep the manager alive
+        del output_manager
+        gc.collect()
+        assert manager_ref() is None
+        
+        with open(log_path, "r") as f:
+            assert f.read() == "collected\n"
+    
     def test_save_metrics(self):
         """
         Test saving metrics.
@@ -242,6 +357,25 @@ class TestOutputManager:
             saved_metrics = json.load(f)
         assert saved_metrics == metrics
     
+    def test_save_metrics_failure_keeps_existing_file(self):
+        """
+        Test that a failed save leaves the previous file intact and no temp files.
+        """
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        metrics_path = self.output_manager.save_metrics({"run": 1}, output_dir)
+        
+        # Serialization fails part way through
+        with pytest.raises(TypeError):
+            self.output_manager.save_metrics({"run": 2, "bad": object()}, output_dir)
+        
+        with patch("glow.concept2asset.output_manager.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                self.output_manager.save_metrics({"run": 3}, output_dir)
+        
+        with open(metrics_path, "r") as f:
+            assert json.load(f) == {"run": 1}
+        assert os.listdir(output_dir) == ["metrics.json"]
+    
     def test_timing(self):
         """
         Test timing functionality.
@@ -290,6 +424,9 @@ class TestOutputManager:
         assert metrics["api_calls"][0]["success"] is True
         assert metrics["api_calls"][0]["response_time"] == 0.5
         assert "timestamp" in metrics["api_calls"][0]
+        
+        # Check that the timestamp is reported in ISO 8601 format
+        datetime.datetime.fromisoformat(metrics["api_calls"][0]["timestamp"])
     
     def test_record_error(self):
         """
@@ -313,6 +450,25 @@ class TestOutputManager:
         assert metrics["errors"][0]["recoverable"] is True
         assert "timestamp" in metrics["errors"][0]
     
+    def test_recorded_events_are_bounded(self):
+        """
+        Test that only the most recent API calls are kept and can be flushed.
+        """
+        output_manager = OutputManager(self.temp_dir.name, max_records=3)
+        for i in range(5):
+            output_manager.record_api_call("test_api", f"endpoint_{i}", 200, True, 0.1)
+        
+        # Check that the oldest calls were dropped
+        metrics = output_manager.get_metrics()
+        assert [call["endpoint"] for call in metrics["api_calls"]] == ["endpoint_2", "endpoint_3", "endpoint_4"]
+        
+        # Check that flushing saves the calls and empties the buffer
+        output_dir = os.path.join(self.temp_dir.name, "test_output")
+        metrics_path = output_manager.flush_metrics(output_dir)
+        with open(metrics_path, "r") as f:
+            assert len(json.load(f)["api_calls"]) == 3
+        assert output_manager.get_metrics()["api_calls"] == []
+    
     def test_clear_metrics(self):
         """
         Test clearing metrics.
@@ -352,6 +508,10 @@ class TestOutputManager:
         assert filename.startswith("test_prefix_")
         assert filename.endswith("_test_suffix.png")
         
+        # Check that the timestamp is the current local time
+        timestamp = datetime.datetime.strptime(filename.split("_")[2], "%Y%m%d%H%M%S")
+        assert abs((datetime.datetime.now() - timestamp).total_seconds()) < 5
+        
         # Generate a filename without timestamp
         filename = self.output_manager.generate_filename(
             "test_prefix",
@@ -385,7 +545,12 @@ class TestOutputManager:
         
         # List all outputs
         outputs = self.output_manager.list_outputs()
-        assert len(outputs) > 0
+        assert len(outputs) == 4
+        
+        # Check that only concept directories are listed
+        base = self.temp_dir.name
+        assert os.path.join(base, "campaign1", "product1", "9_16", "concept1") in outputs
+        assert all(os.path.basename(output) == "concept1" for output in outputs)
         
         # List outputs for a specific campaign
         outputs = self.output_manager.list_outputs("campaign1")
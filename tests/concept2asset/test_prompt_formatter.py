@@ -4,8 +4,11 @@ Tests for prompt formatter.
 This module tests the prompt formatter functionality.
 """
 
+import asyncio
 import pytest
-from glow.concept2asset.prompt_formatter import PromptFormatter
+from glow.concept2asset.prompt_formatter import (
+    PromptFormatter, MAX_PROMPT_LENGTHS, register_prompt_template, _PROMPT_TEMPLATES
+)
 
 class TestPromptFormatter:
     """
@@ -75,6 +78,28 @@ class TestPromptFormatter:
         # Check that the additional instructions are included
         assert additional_instructions in prompt
     
+    def test_format_dalle_prompts_batch(self):
+        """
+        Test formatting DALL-E prompts in a batch, synchronously and asynchronously.
+        """
+        items = [
+            {
+                "product_name": f"Soda {i}",
+                "product_description": "A refreshing soda",
+                "visual_style": "Modern",
+                "visual_mood": "Refreshing",
+                "color_palette": ["Blue", "White"],
+                "target_audience": "Adults",
+                "target_emotions": "happy",
+                "aspect_ratio": "1:1"
+            }
+            for i in range(5)
+        ]
+        expected = [self.formatter.format_dalle_prompt(**item) for item in items]
+        
+        assert self.formatter.format_dalle_prompts_batch(items) == expected
+        assert asyncio.run(self.formatter.format_dalle_prompts_batch_async(items, chunk_size=2)) == expected
+    
     def test_format_firefly_prompt(self):
         """
         Test formatting prompts for Adobe Firefly.
@@ -128,6 +153,16 @@ class TestPromptFormatter:
         assert enhanced_prompt.count("high quality") == 1
         assert enhanced_prompt.count("detailed") == 1
     
+    def test_enhance_prompt_max_length(self):
+        """
+        Test that long prompts are truncated to the requested limit.
+        """
+        long_prompt = "A can of soda on a table. " * 200
+        
+        assert len(self.formatter.enhance_prompt(long_prompt)) == 3000
+        assert len(self.formatter.enhance_prompt(long_prompt, max_length=MAX_PROMPT_LENGTHS["dall-e-3"])) == 4000
+        assert len(self.formatter.enhance_prompt(long_prompt, max_length=MAX_PROMPT_LENGTHS["dall-e-2"])) == 1000
+    
     def test_format_negative_prompt(self):
         """
         Test formatting negative prompts.
@@ -167,4 +202,49 @@ class TestPromptFormatter:
         # Check that the original prompt is preserved
         assert original_prompt in square_prompt
         assert original_prompt in portrait_prompt
-        assert original_prompt in landscape_prompt
\ No newline at end of file
+        assert original_prompt in landscape_prompt
+    
+    def test_optimize_for_aspect_ratio_batch(self):
+        """
+        Test optimizing many prompts for one aspect ratio.
+        """
+        prompts = ["A can of soda", "A bag of chips"]
+        
+        for aspect_ratio in ["1:1", "9:16", "16:9", "4:3"]:
+            optimized = self.formatter.optimize_for_aspect_ratio_batch(prompts, aspect_ratio)
+            assert optimized == [self.formatter.optimize_for_aspect_ratio(prompt, aspect_ratio) for prompt in prompts]
+        
+        assert self.formatter.optimize_for_aspect_ratio_batch([], "1:1") == []
+    
+    def test_static_formatting_methods(self):
+        """
+        Test that formatting methods can be called on the class and that instances have no attribute dictionary.
+        """
+        assert PromptFormatter.format_negative_prompt("beverage") == self.formatter.format_negative_prompt("beverage")
+        assert PromptFormatter.optimize_for_aspect_ratio("A can of soda", "1:1") == self.formatter.optimize_for_aspect_ratio("A can of soda", "1:1")
+        assert not hasattr(self.formatter, "__dict__")
+    
+    def test_register_prompt_template(self, monkeypatch):
+        """
+        Test overriding a built-in prompt template and rejecting invalid templates.
+        """
+        # Restore the built-in template after the test
+        monkeypatch.setitem(_PROMPT_TEMPLATES, "firefly", _PROMPT_TEMPLATES["firefly"])
+        
+        register_prompt_template("firefly", "$product_name in $visual_style style, $aspect_ratio")
+        prompt = self.formatter.format_firefly_prompt(
+            product_name="Test Product",
+            product_description="A test product",
+            visual_style="modern",
+            visual_mood="energetic",
+            color_palette=["red"],
+            target_audience="adults",
+            target_emotions=["joy"],
+            aspect_ratio="1:1"
+        )
+        assert prompt == "Test Product in modern style, 1:1"
+        
+        # Unknown fields fail at registration
+        with pytest.raises(ValueError):
+            register_prompt_template("firefly", "$unknown_field")
+        assert _PROMPT_TEMPLATES["firefly"].template == "$product_name in $visual_style style, $aspect_ratio"
\ No newline at end of file
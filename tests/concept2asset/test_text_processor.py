@@ -4,8 +4,12 @@ Tests for text processor.
 This module tests the text processor functionality.
 """
 
+import random
+import colorsys
 import pytest
-from glow.concept2asset.text_processor import TextProcessor
+from unittest.mock import patch
+import numpy as np
+from glow.concept2asset.text_processor import TextProcessor, TEXT_POSITIONS, _hls_to_rgb
 
 # Sample concept configuration for testing
 SAMPLE_CONCEPT = {
@@ -125,6 +129,48 @@ class TestTextProcessor:
         assert text_config["font_size"] == 42
         assert text_config["padding"] == 30
     
+    def test_process_text_skips_derivation_for_complete_config(self):
+        """
+        Test that defaults are not derived for keys the config already sets.
+        """
+        text_overlay_config = {
+            "primary_text": "Test",
+            "text_position": "top",
+            "font": "Anton-Regular",
+            "color": "#000000",
+            "shadow": False,
+            "shadow_color": "#00000000",
+            "font_size": 50,
+            "padding": 10
+        }
+        concept = {"generated_concept": {"text_overlay_config": text_overlay_config}}
+        
+        with patch.object(TextProcessor, "_select_font") as mock_font, \
+             patch.object(TextProcessor, "_select_color") as mock_color, \
+             patch.object(TextProcessor, "_calculate_font_size") as mock_size:
+            text_config = self.processor.process_text(concept)
+        
+        assert text_config == text_overlay_config
+        assert text_config is not text_overlay_config
+        mock_font.assert_not_called()
+        mock_color.assert_not_called()
+        mock_size.assert_not_called()
+    
+    def test_process_text_batch(self):
+        """
+        Test processing text for several concepts at once.
+        """
+        concepts = [
+            {"generated_concept": {"creative_direction": "Dark night scene", "text_overlay_config": {"primary_text": "One"}}},
+            {"generated_concept": {"creative_direction": "Light bright scene", "text_overlay_config": {"primary_text": "Two"}}}
+        ]
+        
+        text_configs = self.processor.process_text_batch(concepts)
+        
+        assert [config["primary_text"] for config in text_configs] == ["One", "Two"]
+        assert [config["color"] for config in text_configs] == ["#FFFFFF", "#000000"]
+        assert all(config["font_size"] == 102 for config in text_configs)
+    
     def test_process_text_invalid_config(self):
         """
         Test processing text with an invalid configuration.
@@ -167,6 +213,47 @@ class TestTextProcessor:
             assert "font_size" in style
             assert "padding" in style
     
+    def test_generate_text_styles_random_values(self):
+        """
+        Test that generated styles use the palette first and stay within the random ranges.
+        """
+        brief = {"visual_direction": {"style": "modern", "color_palette": ["#123456"]}}
+        styles = self.processor.generate_text_styles(brief, num_styles=20)
+        
+        assert styles[0]["color"] == "#123456"
+        for style in styles[1:]:
+            # Generated colors have an HLS lightness (the mean of the largest and
+            # smallest channel) of at least 0.7, less one for truncation
+            assert len(style["color"]) == 7
+            channels = [int(style["color"][j:j + 2], 16) for j in (1, 3, 5)]
+            assert (max(channels) + min(channels)) / 2 >= 0.7 * 255 - 1
+        for style in styles:
+            assert style["text_position"] in TEXT_POSITIONS
+            assert 90 <= style["font_size"] <= 120
+            assert 30 <= style["padding"] <= 60
+    
+    def test_generate_text_styles_seeded_rng(self):
+        """
+        Test that a seeded random generator makes generated styles reproducible.
+        """
+        first = self.processor.generate_text_styles(SAMPLE_BRIEF, num_styles=5, rng=random.Random(42))
+        second = self.processor.generate_text_styles(SAMPLE_BRIEF, num_styles=5, rng=random.Random(42))
+        
+        assert first == second
+    
+    def test_hls_to_rgb_matches_colorsys(self):
+        """
+        Test that the vectorized HLS conversion matches colorsys.
+        """
+        rng = np.random.default_rng(0)
+        hues, lightnesses, saturations = rng.random((3, 500))
+        saturations[:10] = 0.0
+        
+        rgb = _hls_to_rgb(hues, lightnesses, saturations)
+        expected = [colorsys.hls_to_rgb(h, l, s) for h, l, s in zip(hues, lightnesses, saturations)]
+        
+        assert np.allclose(rgb, expected)
+    
     def test_select_font(self):
         """
         Test selecting a font based on creative direction.
@@ -226,6 +313,10 @@ class TestTextProcessor:
         # Test with dark text color
         shadow_color = self.processor._get_shadow_color("#000000")
         assert shadow_color == "#00000040"  # Black with 25% opacity
+        
+        # Test with short and alpha forms of white
+        assert self.processor._get_shadow_color("#FFF") == "#00000080"
+        assert self.processor._get_shadow_color("#FFFFFFCC") == "#00000080"
     
     def test_calculate_font_size(self):
         """
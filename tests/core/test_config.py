@@ -0,0 +1,219 @@
+"""
+Tests for configuration management.
+
+This module tests the configuration loading and merging functionality.
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from glow.core import config as config_module
+from glow.core.config import (
+    create_default_config, deep_merge, get_config, get_config_value, load_config, save_user_config,
+    set_config_value
+)
+
+class TestConfig:
+    """
+    Tests for the configuration module.
+    """
+    
+    @pytest.fixture(autouse=True)
+    def config_paths(self, tmp_path, monkeypatch):
+        """
+        Point the configuration at temporary files and reset the caches.
+        """
+        self.default_path = tmp_path / "default_config.json"
+        self.user_path = tmp_path / "user" / "config.json"
+        self.default_path.write_text(json.dumps({"api": {"openai": {"model": "gpt-4", "temperature": 0.7}}}))
+        
+        monkeypatch.setattr(config_module, "DEFAULT_CONFIG_PATH", str(self.default_path))
+        monkeypatch.setattr(config_module, "USER_CONFIG_PATH", str(self.user_path))
+        monkeypatch.setattr(config_module, "_config_cache", {})
+        monkeypatch.setattr(config_module, "_default_config_source", (None, b"{}"))
+    
+    def test_deep_merge(self):
+        """
+        Test merging nested overrides into a base configuration.
+        """
+        base = {
+            "api": {"openai": {"model": "gpt-4", "temperature": 0.7}, "timeout": 30},
+            "output": {"directory": "output"},
+            "logging": {"level": "INFO"}
+        }
+        override = {
+            "api": {"openai": {"model": "gpt-4-turbo"}},
+            "output": "custom",
+            "logging": {"file": "glow.log"},
+            "new": {"key": "value"}
+        }
+        
+        deep_merge(base, override)
+        
+        assert base == {
+            "api": {"openai": {"model": "gpt-4-turbo", "temperature": 0.7}, "timeout": 30},
+            "output": "custom",
+            "logging": {"level": "INFO", "file": "glow.log"},
+            "new": {"key": "value"}
+        }
+    
+    def test_deep_merge_disjoint_keys(self):
+        """
+        Test merging overrides that share no keys with the base configuration.
+        """
+        override = {"api": {"openai": {"model": "gpt-4"}}, "output": {"directory": "output"}}
+        
+        # Empty base
+        base = {}
+        deep_merge(base, override)
+        assert base == override
+        assert base["api"] is override["api"]
+        
+        # Disjoint nested section
+        base = {"api": {"stability": {"model": "sdxl"}}}
+        deep_merge(base, override)
+        assert base == {
+            "api": {"stability": {"model": "sdxl"}, "openai": {"model": "gpt-4"}},
+            "output": {"directory": "output"}
+        }
+    
+    def test_deep_merge_deeply_nested(self):
+        """
+        Test merging configurations nested deeper than the recursion limit.
+        """
+        base = current = {}
+        override = current_override = {}
+        for _ in range(5000):
+            current["child"] = {"base": True}
+            current_override["child"] = {"override": True}
+            current = current["child"]
+            current_override = current_override["child"]
+        
+        deep_merge(base, override)
+        
+        assert current == {"base": True, "override": True}
+
+    
+    def test_load_config_rereads_changed_default(self):
+        """
+        Test that the default configuration is re-read only after it changes.
+        """
+        config = load_config()
+        assert config == {"api": {"openai": {"model": "gpt-4", "temperature": 0.7}}}
+        
+        # Each load returns a fresh copy
+        config["api"]["openai"]["model"] = "changed"
+        assert load_config()["api"]["openai"]["model"] == "gpt-4"
+        
+        # Changing the file invalidates the cached contents
+        self.default_path.write_text(json.dumps({"api": {"openai": {"model": "gpt-4o"}}, "extra": True}))
+        stat = os.stat(self.default_path)
+        os.utime(self.default_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config() == {"api": {"openai": {"model": "gpt-4o"}}, "extra": True}
+    
+    def test_load_config_empty_user_config(self):
+        """
+        Test that empty user configuration files are ignored.
+        """
+        defaults = load_config()
+        self.user_path.parent.mkdir()
+        
+        for content in ["", "{}", "{ }\n"]:
+            self.user_path.write_text(content)
+            with patch.object(config_module, "deep_merge") as mock_merge:
+                assert load_config() == defaults
+            mock_merge.assert_not_called()
+    
+    def test_save_user_config_updates_cache(self):
+        """
+        Test that saving the user configuration updates the cache without reading the files again.
+        """
+        get_config()
+        user_config = {"api": {"openai": {"model": "gpt-4-turbo"}}}
+        
+        with patch.object(config_module, "load_config", wraps=config_module.load_config) as mock_load:
+            save_user_config(user_config)
+        
+        mock_load.assert_not_called()
+        assert json.loads(self.user_path.read_text()) == user_config
+        assert os.stat(self.user_path).st_mode & 0o777 == 0o600
+        assert get_config() == {"api": {"openai": {"model": "gpt-4-turbo", "temperature": 0.7}}}
+        assert get_config() == load_config()
+    
+    def test_get_and_set_config_value(self):
+        """
+        Test reading and writing plain and dot notation keys.
+        """
+        assert get_config_value("api.openai.model") == "gpt-4"
+        assert get_config_value("api.openai") == {"model": "gpt-4", "temperature": 0.7}
+        assert get_config_value("api.openai.model.name", "default") == "default"
+        assert get_config_value("missing", "default") == "default"
+        
+        set_config_value("api.openai.model", "gpt-4-turbo", save=False)
+        set_config_value("output.directory", "/tmp/output", save=False)
+        set_config_value("debug", True, save=False)
+        
+        assert get_config_value("api.openai.model") == "gpt-4-turbo"
+        assert get_config_value("output") == {"directory": "/tmp/output"}
+        assert get_config_value("debug") is True
+        assert not self.user_path.exists()
+    
+    def test_create_default_config(self, tmp_path, monkeypatch):
+        """
+        Test creating a missing default configuration without overwriting an existing one.
+        """
+        # Existing file is kept
+        create_default_config()
+        assert json.loads(self.default_path.read_text()) == {"api": {"openai": {"model": "gpt-4", "temperature": 0.7}}}
+        
+        # Missing file and directory are created
+        default_path = tmp_path / "new" / "default_config.json"
+        monkeypatch.setattr(config_module, "DEFAULT_CONFIG_PATH", str(default_path))
+        create_default_config()
+        assert json.loads(default_path.read_text())["output"]["file_format"] == "png"
+        
+        # Loading without a user configuration returns the defaults
+        assert load_config()["logging"] == {"level": "INFO", "file": "glow.log"}    
+    def test_single_config_cache(self):
+        """
+        Test that the package-level accessors share the configuration module's cache.
+        """
+        import glow.core
+        
+        assert glow.core.get_config is get_config
+        assert glow.core.get_config_value is get_config_value
+        
+        set_config_value("output.directory", "/tmp/shared", save=False)
+        assert glow.core.get_config_value("output.directory") == "/tmp/shared"
+        assert glow.core.get_config() == get_config()
+    
+    def test_get_config_is_read_only(self):
+        """
+        Test that get_config returns a read-only view that reflects updates.
+        """
+        config = get_config()
+        
+        with pytest.raises(TypeError):
+            config["debug"] = True
+        
+        set_config_value("debug", True, save=False)
+        assert config["debug"] is True
+        assert get_config_value("debug") is True
+    
+    def test_set_config_value_save(self):
+        """
+        Test that saving a value persists the configuration without reloading it.
+        """
+        get_config()
+        
+        with patch.object(config_module, "_read_default_config") as mock_read:
+            set_config_value("api.openai.model", "gpt-4-turbo")
+        
+        mock_read.assert_not_called()
+        assert get_config_value("api.openai.model") == "gpt-4-turbo"
+        assert json.loads(self.user_path.read_text()) == {
+            "api": {"openai": {"model": "gpt-4-turbo", "temperature": 0.7}}
+        }
+        assert load_config() == dict(get_config())
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Tests for credential management.
+
+This module tests loading, prompting for and saving credentials.
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from glow.core import credentials as credentials_module
+from glow.core.credentials import get_api_key, get_credential, get_credentials_for_service, load_env_file, save_credentials_to_env_file
+
+class TestCredentials:
+    """
+    Tests for the credentials module.
+    """
+    
+    def test_get_credential_from_environment(self, monkeypatch):
+        """
+        Test getting a credential that is set in the environment.
+        """
+        monkeypatch.setenv("TEST_SERVICE_API_KEY", "env-value")
+        
+        with patch("getpass.getpass") as mock_getpass:
+            assert get_credential("TEST_SERVICE_API_KEY") == "env-value"
+        
+        mock_getpass.assert_not_called()
+    
+    def test_get_credential_prompts_with_help(self, monkeypatch, capsys):
+        """
+        Test prompting for a missing API key after printing instructions for setting it.
+        """
+        monkeypatch.delenv("TEST_SERVICE_API_KEY", raising=False)
+        
+        with patch("getpass.getpass", return_value="entered-value"):
+            assert get_credential("TEST_SERVICE_API_KEY") == "entered-value"
+        
+        output = capsys.readouterr().out
+        assert "export TEST_SERVICE_API_KEY=your_api_key_here" in output
+        assert "set TEST_SERVICE_API_KEY=your_api_key_here" in output
+        assert '$env:TEST_SERVICE_API_KEY="your_api_key_here"' in output
+        
+        # The entered value is kept for the session
+        assert os.environ.pop("TEST_SERVICE_API_KEY") == "entered-value"
+    
+    def test_get_credential_missing(self, monkeypatch):
+        """
+        Test missing required and optional credentials.
+        """
+        monkeypatch.delenv("TEST_SERVICE_TOKEN", raising=False)
+        
+        assert get_credential("TEST_SERVICE_TOKEN", required=False) is None
+        
+        with patch("getpass.getpass", return_value=""):
+            with pytest.raises(ValueError):
+                get_credential("TEST_SERVICE_TOKEN")
+
+    
+    def test_get_credentials_for_service(self, monkeypatch):
+        """
+        Test getting several credentials, prompting once for each missing one.
+        """
+        monkeypatch.setenv("TEST_SERVICE_CLIENT_ID", "client-id")
+        monkeypatch.delenv("TEST_SERVICE_SECRET", raising=False)
+        
+        with patch("getpass.getpass", return_value="secret") as mock_getpass:
+            credentials = get_credentials_for_service(
+                "test", ["TEST_SERVICE_CLIENT_ID", "TEST_SERVICE_SECRET", "TEST_SERVICE_SECRET"]
+            )
+        
+        assert credentials == {"TEST_SERVICE_CLIENT_ID": "client-id", "TEST_SERVICE_SECRET": "secret"}
+        mock_getpass.assert_called_once()
+        assert os.environ.pop("TEST_SERVICE_SECRET") == "secret"
+    
+    def test_load_env_file_on_first_use(self, monkeypatch):
+        """
+        Test that the .env file is loaded once, on the first credential lookup.
+        """
+        monkeypatch.delenv("TEST_SERVICE_API_KEY", raising=False)
+        monkeypatch.setattr(credentials_module, "_dotenv_loaded", False)
+        
+        def load_dotenv():
+            os.environ["TEST_SERVICE_API_KEY"] = "dotenv-value"
+        
+        with patch("dotenv.load_dotenv", side_effect=load_dotenv) as mock_load:
+            assert get_credential("TEST_SERVICE_API_KEY") == "dotenv-value"
+            load_env_file()
+        
+        mock_load.assert_called_once()
+        assert os.environ.pop("TEST_SERVICE_API_KEY") == "dotenv-value"
+    
+    def test_save_credentials_to_env_file(self, tmp_path):
+        """
+        Test saving credentials into new and existing .env files.
+        """
+        env_file = tmp_path / ".env"
+        
+        # New file
+        save_credentials_to_env_file({"FIRST_API_KEY": "first"}, str(env_file))
+        assert env_file.read_text() == "FIRST_API_KEY=first\n"
+        
+        # Existing values are kept, comments dropped and updated values replaced
+        env_file.write_text("# Comment\nFIRST_API_KEY=first\n\nURL=https://example.com/?a=b\n")
+        save_credentials_to_env_file({"FIRST_API_KEY": "updated", "SECOND_API_KEY": "second"}, str(env_file))
+        assert env_file.read_text() == (
+            "FIRST_API_KEY=updated\nURL=https://example.com/?a=b\nSECOND_API_KEY=second\n"
+        )
+        assert os.stat(env_file).st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [env_file]
+    
+    def test_get_api_key_in_test_environment(self):
+        """
+        Test that a dummy API key is returned while running under pytest.
+        """
+        assert get_api_key("openrouter") == "test_openrouter_api_key"
+        assert get_api_key("firefly") == "test_firefly_api_key"
+    
+    def test_get_api_key_required_in_environment(self, monkeypatch, capsys):
+        """
+        Test that the OpenRouter API key is read from the environment and never prompted for.
+        """
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.setenv("OPENROUTER_API_KEY", "openrouter-key")
+        assert get_api_key("OpenRouter") == "openrouter-key"
+        
+        monkeypatch.delenv("OPENROUTER_API_KEY")
+        with patch("getpass.getpass") as mock_getpass:
+            with pytest.raises(ValueError):
+                get_api_key("openrouter")
+        
+        mock_getpass.assert_not_called()
+        assert "https://openrouter.ai/keys" in capsys.readouterr().out
+        
+        with pytest.raises(ValueError):
+            get_api_key("unknown")
\ No newline at end of file
@@ -8,12 +8,16 @@ import pytest
 from unittest.mock import patch, MagicMock
 import requests
 import json
+import threading
+import time
 
+from glow.core import error_handler
 from glow.core.error_handler import (
     APIError,
     ValidationError,
     ConfigurationError,
     handle_api_request,
+    clear_response_cache,
     validate_required_fields,
     validate_configuration,
     log_api_error,
@@ -138,6 +142,100 @@ class TestErrorHandler:
         # Check that the result is correct
         assert result == {"status": "success"}
     
+    @patch("requests.get")
+    def test_handle_api_request_cache(self, mock_get):
+        """
+        Test caching successful responses of identical requests.
+        """
+        clear_response_cache()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"status": "success"}
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        # Identical requests are served from the cache
+        results = [
+            handle_api_request(requests.get, "https://api.example.com", {"param": "value"}, {}, enable_cache=True)
+            for _ in range(3)
+        ]
+        assert results == [{"status": "success"}] * 3
+        assert mock_get.call_count == 1
+        
+        # Cached responses can't be changed through a returned result
+        results[0]["status"] = "changed"
+        assert handle_api_request(
+            requests.get, "https://api.example.com", {"param": "value"}, {}, enable_cache=True
+        ) == {"status": "success"}
+        
+        # Different payloads and uncached calls go over the network
+        handle_api_request(requests.get, "https://api.example.com", {"param": "other"}, {}, enable_cache=True)
+        handle_api_request(requests.get, "https://api.example.com", {"param": "value"}, {})
+        assert mock_get.call_count == 3
+        
+        clear_response_cache()
+    
+    @patch("requests.get")
+    def test_handle_api_request_cache_control(self, mock_get):
+        """
+        Test that responses are not cached when Cache-Control forbids it.
+        """
+        clear_response_cache()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"status": "success"}
+        mock_response.headers = {"Cache-Control": "no-store"}
+        mock_get.return_value = mock_response
+        
+        for _ in range(2):
+            handle_api_request(requests.get, "https://api.example.com", {}, {}, enable_cache=True)
+        assert mock_get.call_count == 2
+        
+        # Expired responses are fetched again
+        mock_response.headers = {"Cache-Control": "public, max-age=60"}
+        with patch("time.monotonic", return_value=1000.0):
+            handle_api_request(requests.get, "https://api.example.com", {}, {}, enable_cache=True)
+            handle_api_request(requests.get, "https://api.example.com", {}, {}, enable_cache=True)
+        assert mock_get.call_count == 3
+        with patch("time.monotonic", return_value=1061.0):
+            handle_api_request(requests.get, "https://api.example.com", {}, {}, enable_cache=True)
+        assert mock_get.call_count == 4
+        
+        clear_response_cache()
+    
+    def test_handle_api_request_collapse_duplicates(self):
+        """
+        Test that identical concurrent requests share one network call.
+        """
+        release = threading.Event()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"status": "success"}
+        
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return mock_response
+        
+        mock_get = MagicMock(side_effect=slow_get)
+        results = []
+        
+        def request():
+            results.append(handle_api_request(
+                mock_get, "https://api.example.com", {"param": "value"}, {}, collapse_duplicates=True
+            ))
+        
+        threads = [threading.Thread(target=request) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert mock_get.call_count == 1
+        assert results == [{"status": "success"}] * 4
+        
+        # Later requests are sent again
+        handle_api_request(mock_get, "https://api.example.com", {"param": "value"}, {}, collapse_duplicates=True)
+        assert mock_get.call_count == 2
+    
     @patch("requests.post")
     def test_handle_api_request_http_error(self, mock_post):
         """
@@ -516,4 +614,30 @@ class TestErrorHandler:
         assert "API request failed: 400 Bad Request" in str(error)
         
         # Check that sleep was not called
-        mock_sleep.assert_not_called()
\ No newline at end of file
+        mock_sleep.assert_not_called()
+    
+    @patch("time.sleep")
+    @patch("requests.post")
+    def test_retry_api_request_throttles_warnings(self, mock_post, mock_sleep):
+        """
+        Test that retry warnings are only logged for power-of-two failure counts.
+        """
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        
+        with patch.object(error_handler.logger, "isEnabledFor", return_value=False), \
+             patch.object(error_handler.logger, "warning") as mock_warning:
+            for _ in range(3):
+                with pytest.raises(APIError):
+                    retry_api_request(requests.post, "https://throttled.example.com", {}, {}, max_retries=3)
+        
+        # Six failures were retried, and the 1st, 2nd and 4th were logged
+        assert mock_sleep.call_count == 6
+        assert mock_warning.call_count == 3
+        
+        # A success resets the count
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"status": "success"}
+        mock_post.side_effect = None
+        mock_post.return_value = mock_response
+        retry_api_request(requests.post, "https://throttled.example.com", {}, {})
+        assert not any(key[0] == "https://throttled.example.com" for key in error_handler._retry_failures)
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Tests for logging configuration.
+
+This module tests the logging helper functions.
+"""
+
+from glow.core.logging_config import redact_sensitive_data
+
+class TestLoggingConfig:
+    """
+    Tests for the logging configuration module.
+    """
+    
+    def test_redact_sensitive_data(self):
+        """
+        Test redacting sensitive values, including in nested dictionaries.
+        """
+        data = {
+            "prompt": "A can of soda",
+            "OPENAI_API_KEY": "sk-test",
+            "Authorization": "Bearer token",
+            "options": {"model": "gpt-4", "refresh_token": "refresh"},
+            "count": 3
+        }
+        
+        redacted = redact_sensitive_data(data)
+        
+        assert redacted == {
+            "prompt": "A can of soda",
+            "OPENAI_API_KEY": "********",
+            "Authorization": "********",
+            "options": {"model": "gpt-4", "refresh_token": "********"},
+            "count": 3
+        }
+        
+        # The original data is unchanged
+        assert data["OPENAI_API_KEY"] == "sk-test"
+        assert data["options"]["refresh_token"] == "refresh"
+    
+    def test_redact_sensitive_data_without_sensitive_values(self):
+        """
+        Test that data without sensitive values is not copied.
+        """
+        data = {"prompt": "A can of soda", "options": {"model": "gpt-4"}}
+        assert redact_sensitive_data(data) is data
+        
+        # Only the sections containing sensitive values are copied
+        data = {"options": {"model": "gpt-4"}, "auth": {"token": "secret"}}
+        redacted = redact_sensitive_data(data)
+        assert redacted is not data
+        assert redacted["options"] is data["options"]
+        assert redacted["auth"] == "********"
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Tests for utility functions.
+
+This module tests the file helper functions.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+from glow.core.utils import bounded_gather, ensure_dir, is_valid_image_file, load_json_file, save_json_file
+
+class TestUtils:
+    """
+    Tests for the utils module.
+    """
+    
+    def test_ensure_dir(self, tmp_path):
+        """
+        Test that directories are created, including after being removed.
+        """
+        directory = str(tmp_path / "a" / "b")
+        
+        assert ensure_dir(directory) == directory
+        assert os.path.isdir(directory)
+        
+        # Ensuring an existing directory is fine
+        assert ensure_dir(directory) == directory
+        
+        # A directory removed by something else is created again
+        shutil.rmtree(tmp_path / "a")
+        assert ensure_dir(directory) == directory
+        assert os.path.isdir(directory)
+    
+    def test_save_json_file(self, tmp_path):
+        """
+        Test saving JSON files, including after their directory is removed.
+        """
+        file_path = str(tmp_path / "out" / "data.json")
+        
+        save_json_file({"key": "value"}, file_path)
+        assert load_json_file(file_path) == {"key": "value"}
+        
+        # The directory is created again if it was removed
+        shutil.rmtree(tmp_path / "out")
+        save_json_file({"key": "other"}, file_path)
+        assert load_json_file(file_path) == {"key": "other"}
+    
+    def test_json_file_round_trip(self, tmp_path):
+        """
+        Test that saved JSON files load back unchanged and keep their formatting.
+        """
+        file_path = str(tmp_path / "data.json")
+        data = {"text": "Caf\u00e9 \u2615", "values": [1, 2.5, None, True], "nested": {"empty": {}}}
+        
+        save_json_file(data, file_path)
+        assert load_json_file(file_path) == data
+        with open(file_path) as f:
+            assert f.read() == json.dumps(data, indent=2)
+        
+        save_json_file(data, file_path, indent=None)
+        with open(file_path) as f:
+            assert f.read() == json.dumps(data)
+    
+    def test_is_valid_image_file(self, tmp_path):
+        """
+        Test checking image files by extension and existence.
+        """
+        image_path = tmp_path / "image.PNG"
+        image_path.write_bytes(b"")
+        text_path = tmp_path / "notes.txt"
+        text_path.write_text("notes")
+        
+        assert is_valid_image_file(str(image_path))
+        assert not is_valid_image_file(str(tmp_path / "missing.png"))
+        assert not is_valid_image_file(str(text_path))
+        
+        # Files with other extensions are rejected without touching the file system
+        with patch("os.path.isfile") as mock_isfile:
+            assert not is_valid_image_file(str(text_path))
+        mock_isfile.assert_not_called()
+    
+    def test_bounded_gather(self):
+        """
+        Test that bounded_gather keeps order and limits concurrency.
+        """
+        running = [0]
+        peak = [0]
+        
+        async def job(value):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            return value
+        
+        results = asyncio.run(bounded_gather([job(i) for i in range(10)], limit=3))
+        
+        assert results == list(range(10))
+        assert peak[0] == 3
\ No newline at end of file